@@ -8,6 +8,8 @@ import random
 from numpy import sin, cos, exp, pi
 
 from root.config.main import rAnk, mAster_rank, np, cOmm
+from objects.CSCG._3d.master import MeshGenerator, SpaceInvoker, FormCaller
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.main import EWC_SparseMatrix
 
 
 
@@ -55,7 +57,103 @@ def test_LinearAlgebra_EWC_No1_Operators():
         np.testing.assert_array_almost_equal(Ai - ai, 0, decimal=5)
         np.testing.assert_array_almost_equal(Bi - ai, 0, decimal=5)
 
-
+    #--------- 3d CSCG tests: block-dense local matrices -------------------------------------
+    mesh = MeshGenerator('crazy', c=0.1)([2, 2, 3], EDM='debug')
+    space = SpaceInvoker('polynomials')([('Lobatto', 2), ('Lobatto', 1), ('Lobatto', 2)])
+    FC = FormCaller(mesh, space)
+    u = FC('1-f', is_hybrid=False)
+    f = FC('2-f', is_hybrid=True)
+    M1 = u.matrices.mass
+    M2 = f.matrices.mass
+    E21 = u.matrices.incidence
+    assert M1.block_dense is not None and M2.block_dense is not None
+    # the element-wise (scipy sparse) copies.
+    m1 = EWC_SparseMatrix(mesh, {i: M1[i] for i in M1})
+    m2 = EWC_SparseMatrix(mesh, {i: M2[i] for i in M2})
+    m1.gathering_matrices = (u, u)
+    assert m1.block_dense is None and m2.block_dense is None
+
+    for BD, EW in [(M1 @ E21.T @ M2 @ E21, m1 @ E21.T @ m2 @ E21),
+                   (E21.T @ M2, E21.T @ m2),
+                   (M1 + 2 * M1.T - M1 / 3, m1 + 2 * m1.T - m1 / 3),
+                   (- M2.inv, - m2.inv),
+                   (M2 @ M2.inv, EWC_SparseMatrix(mesh, ('identity', f.num.basis)))]:
+        assert BD.block_dense is not None
+        Z = BD - BD # of the same pattern: exact zeros in the pattern are kept.
+        for i in BD:
+            assert BD[i].nnz <= np.prod(BD[i].shape) and Z[i].nnz == BD[i].nnz
+            np.testing.assert_array_equal(Z[i].indices, BD[i].indices)
+            np.testing.assert_array_almost_equal(BD[i].toarray(), EW[i].toarray(), decimal=8)
+
+    # on an orthogonal mesh, the local mass matrices of 1-forms are not full.
+    FC0 = FormCaller(MeshGenerator('crazy', c=0.0)([2, 2, 3], EDM='debug'), space)
+    M0 = FC0('1-f', is_hybrid=False).matrices.mass
+    for BD in (M0, M0 @ M0, M0.inv):
+        assert BD.block_dense is not None
+        for i in BD:
+            assert BD[i].nnz < np.prod(BD[i].shape)
+    for i in M0:
+        np.testing.assert_array_almost_equal((M0 @ M0.inv)[i].toarray(), np.eye(M0[i].shape[0]))
+
+    MT = M1.T * 2
+    assert MT.block_dense is not None and MT.gathering_matrices == m1.gathering_matrices
+    A = MT.assembled.M.toarray()
+    B = (m1.T * 2).assembled.M.toarray()
+    np.testing.assert_array_almost_equal(A, B)
+
+    #--------- the expression DAG: shared sub-expressions are evaluated once ---------------------
+    CALLS = list()
+    def counted(i):
+        CALLS.append(i)
+        return m2[i]
+    x = EWC_SparseMatrix(mesh, counted, 'no_cache')
+    y = EWC_SparseMatrix(mesh, counted, 'all_diff')
+    xT = x.T
+    assert (xT @ x)._DG_ is (xT @ x)._DG_ # identical structures are the same node.
+    for z, k in [(x, 0), (x, 1), (y, 0), (y, 1)]:
+        C = z.T @ z.inv @ z + z - (z.T @ z.inv @ z) * 0.5
+        CALLS.clear()
+        for i in C:
+            zi = m2[i].toarray()
+            ci = zi.T @ np.linalg.inv(zi) @ zi + zi - 0.5 * (zi.T @ np.linalg.inv(zi) @ zi)
+            np.testing.assert_array_almost_equal(C[i].toarray(), ci)
+        if z is x: # not cached: evaluated once per element in each pass.
+            assert len(CALLS) == len(C)
+        else: # cached after the first pass.
+            assert len(CALLS) == (len(C) if k == 0 else 0)
+
+    # operands are live: their customizations, also those added after they are used, are seen.
+    rows = range(0, f.numbering.gathering.GLOBAL_num_dofs, 3)
+    for z in (x, y):
+        z.gathering_matrices = (f, f)
+        zTz = z.T @ z
+        zTz.gathering_matrices = (f, f)
+        C = zTz + z
+        for i in C: C[i] # (y) C is cached.
+        for r in rows: zTz.customize.clear_global_row(r)
+        for i in C:
+            np.testing.assert_array_almost_equal(C[i].toarray(), zTz[i].toarray() + z[i].toarray())
+        zTz.customize.clear()
+        for r in rows: z.customize.clear_global_row(r)
+        for i in C:
+            zi = z[i].toarray()
+            np.testing.assert_array_almost_equal(C[i].toarray(), zi.T @ zi + zi)
+        z.customize.clear()
+        for i in C:
+            zi = m2[i].toarray()
+            np.testing.assert_array_almost_equal(C[i].toarray(), zi.T @ zi + zi)
+
+    C = M2 @ M2 + M2 # block-dense
+    assert C.block_dense is not None
+    for r in rows: M2.customize.clear_global_row(r)
+    assert C.block_dense is None and (C + M2).block_dense is None
+    for i in C:
+        zi = M2[i].toarray()
+        np.testing.assert_array_almost_equal(C[i].toarray(), zi @ zi + zi)
+    M2.customize.clear()
+    assert C.block_dense is not None
+    for i in C:
+        np.testing.assert_array_almost_equal(C[i].toarray(), (m2[i] @ m2[i] + m2[i]).toarray())
 
     return 1
 
@@ -7,7 +7,9 @@ import random
 from scipy import sparse as spspa
 from tools.linear_algebra.data_structures.global_matrix.main import GlobalVector, GlobalMatrix, LocallyFullVector
 from tools.linear_algebra.solvers.regular.GMRES.main import GMRES
+from tools.linear_algebra.solvers.regular.direct.main import Direct
 from tools.linear_algebra.solvers.regular.allocator import RegularSolverDistributor
+from screws.exceptions import LinerSystemSolverDivergenceError
 
 
 def ___generate_A_b_of_Manguoglu_Paper___():
@@ -126,6 +128,12 @@ def test_LinearSolver_No0_GMRES():
     np.testing.assert_array_almost_equal(x0, np.array([-2.1810344827586, 1.8362068965517, -0.5948275862068]))
     assert ITER == 1
 
+    x0, info, beta, ITER, message = GMRES(routine='2', name='GMRES_test_mpi_v2')(
+        A, b, X0, restart=3, preconditioner=None, COD=False, plot_residuals=False)
+    x0 = x0.V
+    np.testing.assert_array_almost_equal(x0, np.array([-2.1810344827586, 1.8362068965517, -0.5948275862068]))
+    assert ITER == 1
+
 
 
     M = A.___PRIVATE_gather_M_to_core___()
@@ -148,6 +156,18 @@ def test_LinearSolver_No0_GMRES():
     np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 , -0.11510028,
                                                         0.94048189,  0.36495389,  0.54018445,  1.57663592]))
 
+    x0, info, beta, ITER, message = GMRES(routine='2')(A, b, X0, restart=9, preconditioner=None, COD=False)
+    x0 = x0.V
+    np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 , -0.11510028,
+                                                        0.94048189,  0.36495389,  0.54018445,  1.57663592]))
+
+    x0, info, beta, ITER, message = RegularSolverDistributor("GMRES", routine='2')(A, b, X0, restart=9,
+                                                                                   preconditioner=('Jacobi', dict()),
+                                                                                   COD=False)
+    x0 = x0.V
+    np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 , -0.11510028,
+                                                        0.94048189,  0.36495389,  0.54018445,  1.57663592]))
+
     x0, info, beta, ITER, message = RegularSolverDistributor("GMRES", routine='0')(A, b, X0, restart=9,
                                                                                    preconditioner=('Jacobi', dict()),
                                                                                    COD=False)
@@ -221,6 +241,17 @@ def test_LinearSolver_No1_BiCGSTAB():
     x0 = x0.V
     np.testing.assert_array_almost_equal(x0, np.array([-2.1810344827586, 1.8362068965517, -0.5948275862068]))
 
+    x0, info, beta, ITER, message = \
+    RegularSolverDistributor("BiCGSTAB", routine='1')(A, b, X0, maxiter=10, atol=1e-9, preconditioner=None, COD=False)
+    x0 = x0.V
+    np.testing.assert_array_almost_equal(x0, np.array([-2.1810344827586, 1.8362068965517, -0.5948275862068]))
+
+    x0, info, beta, ITER, message = \
+    RegularSolverDistributor("BiCGSTAB", routine='1')(A, b, X0, maxiter=10, atol=1e-9,
+                                                      preconditioner=('Jacobi', dict()), COD=False)
+    x0 = x0.V
+    np.testing.assert_array_almost_equal(x0, np.array([-2.1810344827586, 1.8362068965517, -0.5948275862068]))
+
 
     M = A.___PRIVATE_gather_M_to_core___()
     if rAnk == mAster_rank:
@@ -229,6 +260,23 @@ def test_LinearSolver_No1_BiCGSTAB():
                                                        (2, 9, 7),
                                                        (5, 8, 3)]))
 
+    # a breakdown, (r0, A r0) = 0, stops the iterations with an error instead of going on with nan.
+    if rAnk == mAster_rank:
+        Ab = np.array([(0, 1), (1, 0)])
+        bb = np.array([(1,), (0,)])
+    else:
+        Ab = np.zeros((2, 2))
+        bb = np.zeros((2, 1))
+    Ab = GlobalMatrix(spspa.csc_matrix(Ab))
+    bb = GlobalVector(spspa.csc_matrix(bb))
+    try:
+        RegularSolverDistributor("BiCGSTAB", routine='1')(
+            Ab, bb, LocallyFullVector(np.zeros((2,))), maxiter=10, atol=1e-9, preconditioner=None, COD=False)
+    except LinerSystemSolverDivergenceError as e:
+        assert 'breakdown' in str(e)
+    else:
+        raise Exception("the breakdown is not detected.")
+
     return 1
 
 def test_LinearSolver_No2_LooseGMRES():
@@ -252,6 +300,14 @@ def test_LinearSolver_No2_LooseGMRES():
     np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 , -0.11510028,
                                                         0.94048189,  0.36495389,  0.54018445,  1.57663592]))
 
+    for preconditioner in (None, ('Jacobi', dict())):
+        x0, info, beta, iter_, message = RegularSolverDistributor("LGMRES", routine='1')(
+            A, b, X0, m=6, k=2, atol=1e-9, maxiter=100, preconditioner=preconditioner, COD=False)
+        x0 = x0.V
+        np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 ,
+                                                           -0.11510028, 0.94048189,  0.36495389,  0.54018445,
+                                                           1.57663592]))
+
     x0, info, beta, Iter, message = RegularSolverDistributor("GMRES")(A, b, X0, restart=8, atol=1e-9,
                                                                       maxiter=100, preconditioner=None, COD=False)
     assert Iter > ITer > ITER
@@ -267,7 +323,8 @@ def test_LinearSolver_No3_direct():
 
     A, b = ___generate_A_b_of_Manguoglu_Paper___()
 
-    x0, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=False)
+    x0, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=False,
+                                                                       reuse_factorization=True)
     x0 = x0.V
     np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 ,
                                                        -0.11510028,
@@ -275,7 +332,41 @@ def test_LinearSolver_No3_direct():
 
     np.testing.assert_almost_equal(A.condition.condition_number, 85.3100212781)
 
-    x0, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=True)
+    x0, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=False,
+                                                                       reuse_factorization=True)
+    assert 'factorization reused' in message # A has not changed, so we reuse the factorization.
+    np.testing.assert_array_almost_equal(x0.V, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 ,
+                                                        -0.11510028,
+                                                         0.94048189,  0.36495389,  0.54018445,  1.57663592]))
+
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(A, 2 * b, COD=False,
+                                                                       reuse_factorization=True)
+    assert 'factorization reused' in message
+    np.testing.assert_array_almost_equal(x1.V, 2 * x0.V)
+
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(2 * A, b, COD=False,
+                                                                       reuse_factorization=True,
+                                                                       factorization='factorized')
+    assert 'factorization reused' not in message
+    np.testing.assert_array_almost_equal(x1.V, x0.V / 2)
+
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=False)
+    assert 'factorization' not in message # no reusing by default.
+    np.testing.assert_array_almost_equal(x1.V, x0.V)
+
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(2 * A, b, COD=False,
+                                                                       reuse_factorization=True,
+                                                                       factorization='factorized')
+    assert 'factorization reused' in message
+    Direct.clear_factorization()
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=False,
+                                                                       reuse_factorization=True)
+    assert 'factorization reused' not in message # it has been released.
+    np.testing.assert_array_almost_equal(x1.V, x0.V)
+
+    b1 = 1 * b # b will be cleaned by the following COD=True solving.
+    x0, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b, COD=True,
+                                                                       reuse_factorization=True)
     x0 = x0.V
     np.testing.assert_array_almost_equal(x0, np.array([-3.23891085,  3.44129703,  1.7765975 , -2.7063454 ,
                                                        -0.11510028,
@@ -284,6 +375,85 @@ def test_LinearSolver_No3_direct():
     assert A.IS.master_dominating # the COD=True has triggered this!
     np.testing.assert_almost_equal(A.condition.condition_number, 85.3100212781)
 
+    x1, info, beta, ITer, message = RegularSolverDistributor("direct")(A, b1, COD=True,
+                                                                       reuse_factorization=True)
+    assert 'factorization reused' in message # A is now in the master core, but the values are the same.
+    np.testing.assert_array_almost_equal(x1.V, x0)
+
+    A, b = ___generate_A_b_of_Manguoglu_Paper___() # distributed again.
+    RegularSolverDistributor("direct")(A, b, COD=False, reuse_factorization=True)
+    for _ in range(2):
+        x1, info, beta, ITer, message = RegularSolverDistributor("direct")(A, 1 * b, COD=True,
+                                                                           reuse_factorization=True)
+        assert 'factorization reused' in message
+        assert A.IS.master_dominating # COD is honoured also when the factorization is reused.
+        np.testing.assert_array_almost_equal(x1.V, x0)
+    Direct.clear_factorization()
+
+    return 1
+
+
+def test_LinearSolver_No4_preconditioners():
+    """"""
+    if rAnk == mAster_rank:
+        print("--- [test_LinearSolver_No4_preconditioners] ...... ", flush=True)
+    from objects.CSCG._3d.master import MeshGenerator, SpaceInvoker, FormCaller
+
+    mesh = MeshGenerator('crazy', c=0.1)([3, 3, 2], EDM='debug')
+    space = SpaceInvoker('polynomials')([('Lobatto', 2), ('Lobatto', 2), ('Lobatto', 2)])
+    FC = FormCaller(mesh, space)
+    u = FC('1-f', is_hybrid=False)
+    M1 = u.matrices.mass
+    M2 = FC('2-f', is_hybrid=False).matrices.mass
+    E21 = u.matrices.incidence
+    A_EWC = M1 + E21.T @ M2 @ E21
+    A_EWC.gathering_matrices = (u, u)
+    A = A_EWC.assembled
+    N = A.shape[0]
+    if rAnk == mAster_rank:
+        b = np.random.rand(N)
+    else:
+        b = np.zeros(N)
+    b = GlobalVector(spspa.csc_matrix(b).T)
+    X0 = LocallyFullVector(N)
+
+    x_ref = RegularSolverDistributor("direct")(A, b, COD=False)[0].V
+
+    ITER0 = RegularSolverDistributor("GMRES", routine='2')(
+        A, b, X0, restart=30, maxiter=100, tol=1e-10, atol=1e-12, COD=False)[3]
+    for preconditioner in [('BlockJacobi', dict()),
+                           ('BlockJacobi', {'GM': A_EWC}),
+                           ('ILU0', dict()),
+                           ('AdditiveSchwarz', {'EWC': A_EWC}),]:
+        x0, info, beta, ITER, message = RegularSolverDistributor("GMRES", routine='2')(
+            A, b, X0, restart=30, maxiter=100, tol=1e-10, atol=1e-12, preconditioner=preconditioner, COD=False)
+        assert info == 0 and ITER < ITER0, f"{preconditioner[0]}: info={info}, ITER={ITER}."
+        np.testing.assert_array_almost_equal(x0.V, x_ref, decimal=8)
+
+    x0, info, beta, ITER, message = RegularSolverDistributor("BiCGSTAB", routine='1')(
+        A, b, X0, maxiter=300, tol=1e-10, atol=1e-12, preconditioner=('BlockJacobi', dict()), COD=False)
+    assert info == 0
+    np.testing.assert_array_almost_equal(x0.V, x_ref, decimal=8)
+
+    # routine 'auto' picks the routines that apply preconditioners from the right.
+    for solver, preconditioner in [("GMRES", ('ILU0', dict())),
+                                   ("LGMRES", ('BlockJacobi', {'GM': A_EWC})),
+                                   ("LGMRES", ('ILU0', dict())),
+                                   ("LGMRES", ('AdditiveSchwarz', {'EWC': A_EWC})),
+                                   ("BiCGSTAB", ('BlockJacobi', dict()))]:
+        x0, info = RegularSolverDistributor(solver)(
+            A, b, X0, maxiter=300, tol=1e-10, atol=1e-12, preconditioner=preconditioner, COD=False)[:2]
+        assert info == 0
+        np.testing.assert_array_almost_equal(x0.V, x_ref, decimal=8)
+
+    from tools.linear_algebra.preconditioners.ILU0 import ILU0Preconditioner
+    try:
+        ILU0Preconditioner.___PRIVATE_ilu0___(spspa.identity(ILU0Preconditioner.___MAX_NNZ___ + 1))
+    except AssertionError:
+        pass
+    else:
+        raise Exception("too large local-diagonal blocks should be refused.")
+
     return 1
 
 
@@ -302,4 +472,5 @@ if __name__ == '__main__':
     test_LinearSolver_No2_LooseGMRES()
     test_LinearSolver_No1_BiCGSTAB()
     test_LinearSolver_No0_GMRES()
-    test_LinearSolver_No3_direct()
\ No newline at end of file
+    test_LinearSolver_No3_direct()
+    test_LinearSolver_No4_preconditioners()
\ No newline at end of file
@@ -205,6 +205,41 @@ def test_applying_strong_BC_for_Poisson_problem():
 
     assert u_error_L2 < 0.2 and p_error_L2 < 0.021 and p_error_dH1 < 0.2
 
+    # ---------- the same BC with the sparsity locked: rows are identified in place -----------------
+    A2 = bmat(([  M2, E23 , -T.T],
+               [-E32, None, None],
+               [ T  , None, None]))
+    A2.gathering_matrices = ((u, p, t), (u, p, t))
+    A2.do.lock_sparsity()
+    LS2 = LinearSystem(A2, concatenate([B0, B1, B2]))
+    LS2.customize.apply_strong_BC(2, 0, tpd, upc)
+    LS2.customize.apply_strong_BC(2, 2, tpc)
+    for e in A2.customizations:
+        assert all([cus[0] in ('milrs', 'milrsac') for cus in A2.customizations[e]])
+
+    AM = LS.A.assembled.M
+    AM2 = LS2.A.assembled.M
+    assert abs(AM - AM2).max() < 1e-12
+    assert np.shares_memory(LS2.A.assembled.M.indices, AM2.indices) # assembled with the assembly plan.
+    bV = LS.b.assembled.V
+    bV2 = LS2.b.assembled.V
+    assert abs(bV - bV2).max() < 1e-12
+
+    # ... and applied after the sparsity-locked matrix has been assembled (the BC adds slots).
+    A3 = bmat(([  M2, E23 , -T.T],
+               [-E32, None, None],
+               [ T  , None, None]))
+    A3.gathering_matrices = ((u, p, t), (u, p, t))
+    A3.do.lock_sparsity()
+    LS3 = LinearSystem(A3, concatenate([B0, B1, B2]))
+    AM0 = LS3.A.assembled.M
+    LS3.customize.apply_strong_BC(2, 0, tpd, upc)
+    LS3.customize.apply_strong_BC(2, 2, tpc)
+    for _ in range(2): # the new plan is made and then used.
+        assert abs(LS3.A.assembled.M - AM).max() < 1e-12
+    A3.customize.clear()
+    assert abs(LS3.A.assembled.M - AM0).max() < 1e-12
+
     return 1
 
 
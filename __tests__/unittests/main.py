@@ -38,6 +38,9 @@ t_global_start = MPI.Wtime()
 
 passed_GLOBAL_tests += test_mifem_NO1_2dCSCG_save_read()
 passed_GLOBAL_tests += test_mifem_NO2_3dCSCG_save_read()
+passed_GLOBAL_tests += test_mifem_NO3_chunked_mi_file()
+passed_GLOBAL_tests += test_mifem_NO4_task_pool()
+passed_GLOBAL_tests += test_mifem_NO5_read_in_master_only()
 
 passed_GLOBAL_tests += test_TOOLS_NO1_iterator()
 
@@ -56,6 +59,7 @@ passed_GLOBAL_tests += test_TOOLS_NO8_GlobalMatrix_dot_product_test()
 passed_GLOBAL_tests += test_TOOLS_NO9_test_Chained_Gathering_Matrix()
 passed_GLOBAL_tests += test_TOOLS_NO10_test_EWC_SparseMatrix_Customize()
 passed_GLOBAL_tests += test_TOOLS_NO11_test_ParallelMatrix3dInputRunner()
+passed_GLOBAL_tests += test_TOOLS_NO11_1_ensemble_ParallelMatrix3dInputRunner()
 passed_GLOBAL_tests += test_TOOLS_NO12_EWC_assembling_test()
 passed_GLOBAL_tests += test_TOOLS_NO13_EWC_Customize_CSCG_partial_dofs()
 passed_GLOBAL_tests += test_TOOLS_NO14_partial_cochain_with_3dCSCG_form_BC()
@@ -63,11 +67,14 @@ passed_GLOBAL_tests += test_TOOLS_NO15_linear_system_apply_BC()
 
 passed_GLOBAL_tests += test_SCREWS_NO1_3d_functions()
 passed_GLOBAL_tests += test_SCREWS_NO2_sending_an_email_to_admin()
+passed_GLOBAL_tests += test_SCREWS_NO5_bounded_cache()
+passed_GLOBAL_tests += test_SCREWS_NO6_automatic_partial_derivatives()
 
 passed_GLOBAL_tests += test_LinearSolver_No0_GMRES()
 passed_GLOBAL_tests += test_LinearSolver_No1_BiCGSTAB()
 passed_GLOBAL_tests += test_LinearSolver_No2_LooseGMRES()
 passed_GLOBAL_tests += test_LinearSolver_No3_direct()
+passed_GLOBAL_tests += test_LinearSolver_No4_preconditioners()
 
 passed_GLOBAL_tests += test_LinearAlgebra_EWC_No0_ColumnVector()
 passed_GLOBAL_tests += test_LinearAlgebra_EWC_No1_Operators()
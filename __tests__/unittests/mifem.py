@@ -16,8 +16,11 @@ from objects.CSCG._3d.master import SpaceInvoker as _3dCSCG_SpaceInvoker
 from objects.CSCG._3d.master import ExactSolutionSelector as _3dCSCG_ExactSolutionSelector
 from objects.CSCG._3d.master import FormCaller as _3dCSCG_FormCaller
 from root.save import save, read
+from root.read.helpers.mi_container import MiContainer, LazyRegionWiseCochain
+import pickle
 
 import random
+from time import sleep
 
 def u(t, x, y, z):
     return np.sin(2 * np.pi * x) * np.cos(2 * np.pi * y) * np.cos(2 * np.pi * z) + t / 2
@@ -260,6 +263,177 @@ def test_mifem_NO2_3dCSCG_save_read():
 
 
 
+def ___check_same_region_wise_cochain___(f, F):
+    """The meshes of `f` and `F` may be distributed differently, so we compare region-wise cochains."""
+    rw = f.cochain.___PRIVATE_do_gather_to_master_and_make_them_region_wise_local_index_grouped___()
+    RW = F.cochain.___PRIVATE_do_gather_to_master_and_make_them_region_wise_local_index_grouped___()
+    if rAnk == mAster_rank:
+        assert rw.keys() == RW.keys()
+        for key in rw:
+            np.testing.assert_array_equal(rw[key], RW[key])
+
+def test_mifem_NO3_chunked_mi_file():
+    if rAnk == mAster_rank:
+        print("--- [test_mifem_NO3_chunked_mi_file] ...... ", flush=True)
+
+    mesh = _3dCSCG_MeshGenerator('crazy', c=0.1)([3,2,2], EDM='chaotic')
+    space = _3dCSCG_SpaceInvoker('polynomials')([('Lobatto',2), ('Lobatto',1), ('Lobatto',2)])
+    FC = _3dCSCG_FormCaller(mesh, space)
+    vector = FC('vector', (u,v,w))
+    f2 = FC('2-f', is_hybrid=True)
+    f2.TW.func.body = vector
+    f2.TW.current_time = 0
+    f2.TW.do.push_all_to_instant()
+    f2.discretize()
+    t0 = FC('0-t')
+    t0.TW.func.do.set_func_body_as(_3dCSCG_ExactSolutionSelector(mesh)('icpsNS:sincosRD'), 'pressure')
+    t0.TW.current_time = 1
+    t0.TW.do.push_all_to_instant()
+    t0.discretize()
+
+    RW = f2.cochain.___PRIVATE_do_gather_to_master_and_make_them_region_wise_local_index_grouped___()
+
+    save([mesh, f2, t0], 'chunked_objects')
+
+    # all cores read the index only, the cochain is read element by element. -------------------
+    container = MiContainer('chunked_objects.mi')
+    assert len(container) == 3 and not container.single
+    obj_dict = container[1]
+    assert obj_dict['obj'] == '_3dCSCG_2Form'
+    LAZY = obj_dict['parameters']['region_wise_cochain_local']
+    assert isinstance(LAZY, LazyRegionWiseCochain)
+    RW = cOmm.bcast(RW, root=mAster_rank)
+    assert len(LAZY) == len(RW) == mesh.elements.GLOBAL_num
+    for key in RW:
+        np.testing.assert_array_equal(LAZY[key], RW[key])
+
+    # lazy read: skipped objects are not deserialized. ------------------------------------------
+    MESH, F2, T0 = read('chunked_objects', read_individuals=[0, 1, 0])
+    assert MESH is None and T0 is None
+    assert F2.mesh == mesh
+    ___check_same_region_wise_cochain___(f2, F2)
+
+    MESH, F2, T0 = read('chunked_objects')
+    assert MESH == mesh and F2.mesh is MESH and T0.mesh is MESH
+    assert T0.TW.current_time == 1
+    ___check_same_region_wise_cochain___(t0, T0)
+
+    save(f2, 'chunked_objects')
+    F2 = read('chunked_objects')
+    assert F2.__class__.__name__ == '_3dCSCG_2Form'
+    ___check_same_region_wise_cochain___(f2, F2)
+
+    # files of the old format (one pickled list) are still readable. ----------------------------
+    _2bs_ = [mesh.___PRIVATE_save___('old_format', do_save=False),
+             f2.___PRIVATE_save___('old_format', do_save=False),
+             (None, None)]
+    if rAnk == mAster_rank:
+        with open('old_format.mi', 'wb') as output:
+            pickle.dump(_2bs_, output, pickle.HIGHEST_PROTOCOL)
+    cOmm.barrier()
+    MESH, F2 = read('old_format')
+    assert MESH == mesh
+    ___check_same_region_wise_cochain___(f2, F2)
+
+    cOmm.barrier()
+    if rAnk == mAster_rank:
+        os.remove('chunked_objects.mi')
+        os.remove('old_format.mi')
+
+    return 1
+
+
+
+def ___task_pool_test_method___(x):
+    if x % 3 == 0: sleep(0.01 * random.random()) # let some tasks be slower.
+    return x ** 2, rAnk
+
+def test_mifem_NO4_task_pool():
+    if rAnk == mAster_rank:
+        print("--- [test_mifem_NO4_task_pool] ...... ", flush=True)
+        N = random.randint(0, 60)
+        chunk_size = random.randint(1, 5)
+        tasks = [random.randint(-100, 100) for _ in range(N)]
+    else:
+        N, chunk_size, tasks = None, None, None
+    N, chunk_size = cOmm.bcast([N, chunk_size], root=mAster_rank)
+
+    for master_works in (False, True):
+        RESULTS = tAsk_pool(tasks, ___task_pool_test_method___, chunk_size=chunk_size,
+                            gather=True, master_works=master_works)
+        if rAnk == mAster_rank:
+            assert [r[0] for r in RESULTS] == [x ** 2 for x in tasks]
+            if sIze > 1 and not master_works:
+                assert all([r[1] != mAster_rank for r in RESULTS])
+        else:
+            assert RESULTS is None
+
+        RESULTS = tAsk_pool(tasks, ___task_pool_test_method___, chunk_size=chunk_size,
+                            master_works=master_works) # not gathered: results of each core.
+        assert all([r[1] == rAnk for r in RESULTS])
+        assert cOmm.allreduce(len(RESULTS), op=MPI.SUM) == N
+
+    return 1
+
+
+
+def test_mifem_NO5_read_in_master_only():
+    if rAnk == mAster_rank:
+        print("--- [test_mifem_NO5_read_in_master_only] ...... ", flush=True)
+    import root.read.main as read_main
+
+    mesh = _3dCSCG_MeshGenerator('crazy', c=0.05)([2,3,2])
+    space = _3dCSCG_SpaceInvoker('polynomials')([('Lobatto',2), ('Lobatto',2), ('Lobatto',1)])
+    FC = _3dCSCG_FormCaller(mesh, space)
+    es = _3dCSCG_ExactSolutionSelector(mesh)('icpsNS:sincosRD')
+    f1 = FC('1-f', is_hybrid=False)
+    f1.TW.func.do.set_func_body_as(es, 'velocity')
+    f1.TW.current_time = 2
+    f1.TW.do.push_all_to_instant()
+    f1.discretize()
+    t2 = FC('2-t')
+    t2.TW.func.do.set_func_body_as(es, 'pressure')
+    t2.TW.current_time = 2
+    t2.TW.do.push_all_to_instant()
+    t2.discretize()
+
+    save([mesh, f1, t2], 'read_in_master_only')
+    _2bs_ = [f1.___PRIVATE_save___('read_in_master_only_old', do_save=False), (None,)]
+    if rAnk == mAster_rank:
+        with open('read_in_master_only_old.mi', 'wb') as output:
+            pickle.dump(_2bs_, output, pickle.HIGHEST_PROTOCOL)
+    cOmm.barrier()
+
+    def ___no_reading___(*args, **kwargs):
+        raise Exception(f"slaves should not read files.")
+
+    chain, is_container = read_main.chain, read_main.___is_mi_container___
+    if rAnk != mAster_rank:
+        read_main.chain = ___no_reading___
+        read_main.___is_mi_container___ = ___no_reading___
+    try:
+        MESH, F1, T2 = read('read_in_master_only')
+        F1_old = read('read_in_master_only_old')
+    finally:
+        read_main.chain, read_main.___is_mi_container___ = chain, is_container
+
+    assert F1.mesh is MESH and T2.mesh is MESH and F1_old.mesh is MESH # the mesh cache works.
+    assert read_main.___CACHE_3dCSCG_mesh___[-1] is MESH
+    assert MESH == mesh and F1.TW.current_time == T2.TW.current_time == 2
+    assert F1.error.L() == f1.error.L() == F1_old.error.L()
+    ___check_same_region_wise_cochain___(f1, F1)
+    ___check_same_region_wise_cochain___(t2, T2)
+
+    cOmm.barrier()
+    if rAnk == mAster_rank:
+        os.remove('read_in_master_only.mi')
+        os.remove('read_in_master_only_old.mi')
+
+    return 1
+
+
+
+
 
 if __name__ == '__main__':
     # mpiexec -n 5 python tests\unittests\mifem.py
@@ -267,4 +441,4 @@ if __name__ == '__main__':
     test_mifem_NO2_3dCSCG_save_read()
 
     #
-    # test_mifem_NO3_3dCSCG_OLD_read_V0()
\ No newline at end of file
+    # test_mifem_NO3_3dCSCG_OLD_read_V0()
@@ -14,8 +14,13 @@ from screws.functions._3d_space.Cartesian_spherical_coordinate_switcher import C
 from screws.functions._3d_space.Cartesian_cylinder_coordinate_switcher import CartCylSwitcher
 from screws.numerical.time_plus_3d_space.partial_derivative_as_functions import NumericalPartialDerivative_txyz_Functions
 from screws.numerical.time_plus_3d_space.partial_derivative import NumericalPartialDerivative_txyz
+from screws.numerical.time_plus_3d_space.automatic_partial_derivative_as_functions import \
+    AutomaticPartialDerivative_txyz_Functions
 from screws.emails.plain import SendAdminAnEmail, SendAdminAnHTMLEmail
+from screws.warnings.automatic_differentiation import AutomaticDifferentiationWarning
+import warnings
 from screws.miscellaneous.generalized_piecewise_function import genpiecewise
+from screws.decorators.memoize.memoize_6 import BoundedCache, memoize6
 
 from functools import partial
 
@@ -223,6 +228,106 @@ def test_SCREWS_NO4_generalized_piecewise_function():
 
 
 
+def test_SCREWS_NO5_bounded_cache():
+    """ """
+    if rAnk == mAster_rank:
+        print("-5- [test_SCREWS_NO5_bounded_cache] ...... ", flush=True)
+
+    cache = BoundedCache(max_bytes=3 * 8000 + 200)
+    CALLS = list()
+
+    @memoize6(cache=cache)
+    def square(x, shift=0):
+        CALLS.append(1)
+        return x ** 2 + shift
+
+    A = np.random.rand(1000)
+    B = np.random.rand(1000)
+    a = square(A)
+    assert np.all(square(A.copy()) == a) and len(CALLS) == 1, f"equal arrays must share the entry."
+    assert not a.flags.writeable, f"cached arrays must be read-only."
+    square(A, shift=1)
+    assert len(CALLS) == 2, f"kwargs must be in the keys."
+    square(B)
+    assert cache.stats == {'hits': 1, 'misses': 3, 'evictions': 0, 'entries': 3, 'bytes': 3 * 8000}
+    square(A) # A is now the most recently used one.
+    square(np.random.rand(1000)) # evict the least recently used one, square(A, shift=1).
+    assert cache.stats['evictions'] == 1 and cache.stats['entries'] == 3
+    square(A)
+    assert len(CALLS) == 4
+    square(A, shift=1)
+    assert len(CALLS) == 5
+
+    # long arrays of the same abbreviated string representation do not collide.
+    C = np.zeros(10000)
+    D = np.zeros(10000)
+    D[5000] = 1
+    assert str(C) == str(D)
+    cache.max_bytes = 10 ** 6
+    assert square(D)[5000] == 1 and square(C)[5000] == 0
+
+    cache.max_bytes = 0
+    assert cache.stats['entries'] == 0 and cache.stats['bytes'] == 0
+
+    return 1
+
+
+def test_SCREWS_NO6_automatic_partial_derivatives():
+    """ """
+    if rAnk == mAster_rank:
+        print("-6- [test_SCREWS_NO6_automatic_partial_derivatives] ...... ", flush=True)
+
+    a, b = random.random() + 0.5, random.random() + 0.5
+
+    def func(t, x, y, z): return np.sin(a*x) * np.exp(y*z) / (1 + x**2) + t**3 * np.sqrt(b + y) * z
+
+    def F_t(t, x, y, z): return 3 * t**2 * np.sqrt(b + y) * z
+    def F_x(t, x, y, z): return np.exp(y*z) * (a*np.cos(a*x) / (1 + x**2) - 2*x*np.sin(a*x) / (1 + x**2)**2)
+    def F_z(t, x, y, z): return y * np.sin(a*x) * np.exp(y*z) / (1 + x**2) + t**3 * np.sqrt(b + y)
+    def F_yz(t, x, y, z): return (1 + y*z) * np.sin(a*x) * np.exp(y*z) / (1 + x**2) + t**3 * 0.5 / np.sqrt(b + y)
+    def F_zz(t, x, y, z): return y**2 * np.sin(a*x) * np.exp(y*z) / (1 + x**2)
+    def F_tt(t, x, y, z): return 6 * t * np.sqrt(b + y) * z
+
+    t = random.random()
+    x, y, z = np.random.rand(3, 5, 6, 7)
+    APD = AutomaticPartialDerivative_txyz_Functions(func)
+    NPD = NumericalPartialDerivative_txyz_Functions(func)
+    for p_, F in [('t', F_t), ('x', F_x), ('z', F_z), ('yz', F_yz), ('zy', F_yz), ('zz', F_zz), ('tt', F_tt)]:
+        np.testing.assert_array_almost_equal(APD(p_)(t, x, y, z), F(t, x, y, z), decimal=12)
+    np.testing.assert_array_almost_equal(APD('y')(t, x, y, z), NPD('y')(t, x, y, z), decimal=6)
+
+    # all derivatives of a function at the same points come from one evaluation.
+    CALLS = list()
+    def counted(t, x, y, z):
+        CALLS.append(1)
+        return func(t, x, y, z)
+    APD = AutomaticPartialDerivative_txyz_Functions(counted)
+    for p_ in ('t', 'x', 'y', 'z', 'xx', 'xy', 'zt'):
+        APD(p_)(t, x, y, z)
+    assert len(CALLS) == 1
+    APD('x')(t + 1, x, y, z)
+    assert len(CALLS) == 2
+
+    # constants, and functions we cannot automatically differentiate (fall back to the numerical ones).
+    assert np.all(APD.__class__(lambda t, x, y, z: 3.0)('xy')(t, x, y, z) == 0)
+    def rounded(t, x, y, z): return np.round(x, 3) * y
+    with warnings.catch_warnings(record=True) as W:
+        warnings.simplefilter('always')
+        np.testing.assert_array_almost_equal(APD.__class__(rounded)('y')(t, x, y, z), np.round(x, 3))
+    assert len([w for w in W if issubclass(w.category, AutomaticDifferentiationWarning)]) == 1
+    # other errors of the function are not hidden.
+    def wrong(t, x, y, z): return x[:, 0, 0, 0]
+    try:
+        APD.__class__(wrong)('x')(t, x, y, z)
+    except TypeError:
+        pass
+    else:
+        raise Exception("errors of the function must be raised.")
+
+    return 1
+
+
+
 if __name__ == '__main__':
     # mpiexec python __tests__\unittests\screws_.py
 
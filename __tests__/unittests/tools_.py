@@ -28,6 +28,7 @@ from tools.linear_algebra.elementwise_cache.operators.concatenate.main import bm
 import tools.linear_algebra.elementwise_cache.operators.concatenate.main as mif
 from tools.linear_algebra.linear_system.main import LinearSystem
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.main import EWC_ColumnVector
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.main import EWC_SparseMatrix
 from tools.run.reader import ParallelMatrix3dInputRunner, RunnerDataReader
 from objects.CSCG.base.forms.base.BC.partial_cochain.partial_dofs.main import PartialDofs
 from objects.CSCG._3d.__tests__.Random.form_caller import random_mesh_and_space_of_total_load_around
@@ -800,6 +801,18 @@ def test_TOOLS_NO8_GlobalMatrix_dot_product_test():
             ___ = a @ b @ c
             np.testing.assert_almost_equal(np.sum(np.abs(abc - ___)), 0)
 
+    for _ in range(5): # distributed (square) GlobalMatrix @ distributed vector.
+        n = cOmm.bcast(random.randint(1, sIze*10), root=mAster_rank)
+        A = GlobalMatrix(spspa.random(n, n, random.uniform(0, 0.3), format='csr'))
+        A.do.claim_distribution_pattern(distributed=True)
+        DA = A.distributed
+        assert DA is A.distributed and DA.GLOBAL_shape == (n, n)
+        x = cOmm.bcast(np.random.rand(n), root=mAster_rank)
+        y = DA.gather(DA @ x[DA.owned])
+        a = A.___PRIVATE_gather_M_to_core___()
+        if rAnk == mAster_rank:
+            np.testing.assert_array_almost_equal(y, a @ x)
+
     return 1
 def ___generate_random_row_major_GM___(i, j, s=None):
     """Make a random row major sparse matrix of shape (i,j) at sparsity=s.
@@ -1295,6 +1308,72 @@ def test_TOOLS_NO11_test_ParallelMatrix3dInputRunner():
 
 
 
+def ___runner_test_function_11_1___(t0, dt, steps, A=10):
+    """
+    Parameters
+    ----------
+    t0 :
+    dt :
+    steps :
+    A : A key ward input.
+
+    Returns
+    -------
+    o1 :
+    o2 :
+    o3 :
+    """
+    o1, o2 = 0, 0
+    if rAnk == mAster_rank:
+        o1, o2 = ___runner_test_function_11___(t0, dt, steps, A=A)
+    else:
+        ___runner_test_function_11___(t0, dt, steps, A=A)
+    SIZE = cOmm.allreduce(1, op=MPI.SUM) # so sIze is the size of the group.
+    assert SIZE == sIze
+    if rAnk == mAster_rank:
+        return o1, o2, sIze
+
+def test_TOOLS_NO11_1_ensemble_ParallelMatrix3dInputRunner():
+    """"""
+    if rAnk == mAster_rank:
+        print("->- [test_TOOLS_NO11_1_ensemble_ParallelMatrix3dInputRunner] ....", flush=True)
+        T0 = ([0, 1, 2], [5, 6])
+        DT = ([0.1, 0.2, 0.15], [0.05, 0.1])
+        STEPS = [1, 3]
+        A = random.uniform(0,10)
+    else:
+        T0, DT, STEPS, A = None, None, None, None
+    T0, DT, STEPS, A = cOmm.bcast([T0, DT, STEPS, A], root=mAster_rank)
+
+    PR1 = ParallelMatrix3dInputRunner(___runner_test_function_11_1___)
+    PR1.iterate(T0, DT, STEPS, A=A)
+
+    group_size = 2 if sIze > 3 else 1
+    PR2 = ParallelMatrix3dInputRunner(___runner_test_function_11_1___)
+    PR2.iterate(T0, DT, STEPS, writeto='pmr_ensemble_test.txt', group_size=group_size, A=A)
+
+    if rAnk == mAster_rank:
+        R1 = PR1._SR_.rdf.to_numpy()[:, :5].astype(float)
+        R2 = PR2._SR_.rdf.to_numpy()[:, :6].astype(float)
+        assert len(R1) == len(R2) == 10
+        R1 = R1[np.lexsort(R1[:, :3].T)]
+        R2 = R2[np.lexsort(R2[:, :3].T)]
+        np.testing.assert_array_almost_equal(R1, R2[:, :5])
+        if sIze > 1:
+            assert np.all(R2[:, 5] == group_size)
+
+        PR3 = ParallelMatrix3dInputRunner(___runner_test_function_11_1___) # all computed already.
+    else:
+        PR3 = ParallelMatrix3dInputRunner(___runner_test_function_11_1___)
+    PR3.iterate(T0, DT, STEPS, writeto='pmr_ensemble_test.txt', group_size=group_size, A=A)
+    if rAnk == mAster_rank:
+        assert len(PR3._SR_.rdf) == 10
+        os.remove('pmr_ensemble_test.txt')
+
+    return 1
+
+
+
 def test_TOOLS_NO12_EWC_assembling_test():
     """"""
     if rAnk == mAster_rank:
@@ -1344,6 +1423,42 @@ def test_TOOLS_NO12_EWC_assembling_test():
     np.testing.assert_array_almost_equal(aM2.toarray(), AM2.M.toarray())
     np.testing.assert_array_almost_equal(aM3.toarray(), AM3.M.toarray())
 
+    for M, AM in zip((M0, M1, M2, M3), (AM0, AM1, AM2, AM3)): # must be bit-identical.
+        VM = M.assembler(routine='vectorized')
+        np.testing.assert_array_equal(AM.M.indptr, VM.M.indptr)
+        np.testing.assert_array_equal(AM.M.indices, VM.M.indices)
+        np.testing.assert_array_equal(AM.M.data, VM.M.data)
+
+    D1 = dict() # sparsity locked: assembled with the assembly plan.
+    for i in M1: D1[i] = M1[i].copy()
+    L1 = EWC_SparseMatrix(mesh, D1)
+    L1.gathering_matrices = (GM1, GM1)
+    L1.do.lock_sparsity()
+    LA1 = L1.assembled
+    np.testing.assert_array_almost_equal(LA1.M.toarray(), AM1.M.toarray())
+    for i in D1: D1[i].data *= 2
+    LB1 = L1.assembler(routine='vectorized')
+    assert LB1.M is not LA1.M
+    if LA1.M.nnz > 0: # a core may have no local element.
+        assert np.shares_memory(LB1.M.indices, LA1.M.indices) # shared indices.
+    np.testing.assert_array_almost_equal(LB1.M.toarray(), 2 * AM1.M.toarray())
+    np.testing.assert_array_almost_equal(LA1.M.toarray(), AM1.M.toarray()) # not changed.
+    L1.do.unlock_sparsity()
+    np.testing.assert_array_almost_equal(L1.assembled.M.toarray(), 2 * AM1.M.toarray())
+    for i in D1: D1[i] = D1[i] * (0.5 + 1j) # complex local data.
+    L1.do.lock_sparsity()
+    for _ in range(2): # make the plan, then use it.
+        np.testing.assert_array_almost_equal(L1.assembled.M.toarray(), (1 + 2j) * AM1.M.toarray())
+    if cOmm.allreduce(len(D1), op=MPI.MIN) > 0: # (assembling is collective) all cores change.
+        i = list(D1.keys())[0] # the same amount of local data, but a different sparsity.
+        D1[i] = D1[i].tocsr() if D1[i].__class__.__name__ == 'csc_matrix' else D1[i].tocsc()
+        try:
+            L1.assembled
+        except AssertionError:
+            pass
+        else:
+            raise Exception(f"a changed local sparsity must be refused.")
+
     def p(t, x, y, z): return -0.001 + x + 2.1254*y + 0.1234*z + t
     scalar = FC('scalar', p)
 
@@ -1388,6 +1503,9 @@ def test_TOOLS_NO12_EWC_assembling_test():
     aM = ___brutal_force_EWC_matrix_assembling___(M, *M.gathering_matrices)
     AM = M.assembled
     np.testing.assert_array_almost_equal(aM.toarray(), AM.M.toarray())
+    VM = M.assembler(routine='vectorized')
+    np.testing.assert_array_equal(AM.M.indices, VM.M.indices)
+    np.testing.assert_array_equal(AM.M.data, VM.M.data)
 
     def p(t, x, y): return -0.001 + x + 2.1254*y + t
     scalar = FC('scalar', p)
@@ -220,6 +220,56 @@ def test_Naive_Numbering_NO4_2trace():
 
 
 
+def test_Naive_Numbering_NO7_distributed_standard_forms():
+    """The numbering of non-hybrid standard forms is done without the master core. We check that
+    the dofs are numbered by 0, 1, 2, ... and are shared correctly on element sides, including
+    the element sides on the core interfaces."""
+    if rAnk == mAster_rank:
+        load = random.randint(50, 299)
+        print(f"--- [test_Naive_Numbering_NO7_distributed_standard_forms] @ FC-load = {load} ...... ",
+              flush=True)
+    else:
+        load= None
+    load = cOmm.bcast(load, root=mAster_rank)
+    FC = random_FormCaller_of_total_load_around(load)
+    mesh = FC._mesh_
+    other_side_name = 'SNEWFB'
+
+    for k in range(3):
+        f = FC(f'{k}-f', is_hybrid=False, numbering_parameters='Naive')
+        GM = f.numbering.gathering
+
+        LOCAL_NUMBERING = set()
+        SIDE_DOFS = dict()
+        for i in GM:
+            LOCAL_NUMBERING.update(GM[i].full_vector)
+            for j, side in enumerate('NSWEBF'):
+                SIDE_DOFS[(i, side)] = f.numbering.do.find.dofs_on_element_side(i, side)
+        assert f.numbering.num_local_dofs == len(LOCAL_NUMBERING), "must be the case!"
+
+        GLOBAL_num_dofs = GM.GLOBAL_num_dofs
+        ALL_NUMBERING = cOmm.gather(LOCAL_NUMBERING, root=mAster_rank)
+        SIDE_DOFS = cOmm.gather(SIDE_DOFS, root=mAster_rank)
+        ELEMENT_MAP = cOmm.gather(mesh.elements.map, root=mAster_rank)
+        if rAnk == mAster_rank:
+            NUMBERING = set()
+            for _ in ALL_NUMBERING: NUMBERING.update(_)
+            assert NUMBERING == set(range(len(NUMBERING))), f"dofs must be numbered by 0, 1, 2, ..."
+            assert len(NUMBERING) == GLOBAL_num_dofs
+
+            SD = dict()
+            for _ in SIDE_DOFS: SD.update(_)
+            EM = dict()
+            for _ in ELEMENT_MAP: EM.update(_)
+            for i in EM:
+                for j, side in enumerate('NSWEBF'):
+                    other = EM[i][j]
+                    if not isinstance(other, str):
+                        np.testing.assert_array_equal(SD[(i, side)], SD[(other, other_side_name[j])])
+
+    return 1
+
+
 
 
 
@@ -227,4 +277,5 @@ if __name__ == '__main__':
     # mpiexec -n 6 python _3dCSCG\TESTS\unittest_Naive_numbering.py
     # test_Naive_Numbering_NO4_2trace()
     test_Naive_Numbering_NO5_0trace()
-    test_Naive_Numbering_NO6_1trace()
\ No newline at end of file
+    test_Naive_Numbering_NO6_1trace()
+    test_Naive_Numbering_NO7_distributed_standard_forms()
\ No newline at end of file
@@ -7,7 +7,7 @@ from tools.linear_algebra.elementwise_cache.operators.concatenate.main import co
 from tools.linear_algebra.elementwise_cache.operators.bmat.main import bmat
 from tools.linear_algebra.elementwise_cache.objects.column_vector.main import EWC_ColumnVector
 from tools.linear_algebra.linear_system.main import LinearSystem
-from root.config.main import rAnk, mAster_rank
+from root.config.main import rAnk, mAster_rank, np
 from objects.CSCG.tools.distribute_local_cochain import distribute_local_cochain
 
 
@@ -95,6 +95,11 @@ def test_Stokes_hdMSEM_Schur_Rank2Solver():
 
     results = LS.solve('Schur', rank=2, blocks=3)()[0]
 
+    # static condensation: the same system with the reduced system solved directly.
+    results_sc = LS.solve('Schur', rank=2, blocks=3, routine='condensation')()[0]
+    for i in results:
+        np.testing.assert_array_almost_equal(results_sc[i], results[i])
+
     distribute_local_cochain(results, [w, u, p, s, t, e])
 
     w.TW.current_time = 0
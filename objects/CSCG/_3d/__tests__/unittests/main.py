@@ -71,6 +71,7 @@ passed_3dCSCG_tests += test_Form_No9_node_forms()
 passed_3dCSCG_tests += test_Form_No10_standard_form_dofs()
 passed_3dCSCG_tests += test_Form_No11_reconstruction_matrices()
 passed_3dCSCG_tests += test_Form_NO12_weak_curl()
+passed_3dCSCG_tests += test_Form_NO13_parallel_field_export()
 
 passed_3dCSCG_tests += test_Space_NO1_basis_functions_mapping_test()
 
@@ -86,6 +87,8 @@ passed_3dCSCG_tests += test_Mesh_NO6_transfinite()
 passed_3dCSCG_tests += test_Mesh_NO7_boundaries()
 passed_3dCSCG_tests += test_Mesh_NO8_Mesh_SubGeometry_perpendicular_slice_object()
 passed_3dCSCG_tests += test_Mesh_NO9_edge_node_mesh()
+passed_3dCSCG_tests += test_Mesh_NO10_RCB_element_distribution()
+passed_3dCSCG_tests += test_Mesh_NO11_point_locator()
 
 passed_3dCSCG_tests += test_Naive_Numbering_NO1_0form()
 passed_3dCSCG_tests += test_Naive_Numbering_NO2_1form()
@@ -93,6 +96,7 @@ passed_3dCSCG_tests += test_Naive_Numbering_NO3_2form()
 passed_3dCSCG_tests += test_Naive_Numbering_NO4_2trace()
 passed_3dCSCG_tests += test_Naive_Numbering_NO6_1trace()
 passed_3dCSCG_tests += test_Naive_Numbering_NO5_0trace()
+passed_3dCSCG_tests += test_Naive_Numbering_NO7_distributed_standard_forms()
 
 passed_3dCSCG_tests += test_trace_NO__general_tests()
 passed_3dCSCG_tests += test_trace_NO0_trace_0_form_Rd_and_Rc()
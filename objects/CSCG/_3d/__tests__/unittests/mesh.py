@@ -1306,6 +1306,76 @@ def test_Mesh_NO9_edge_node_mesh():
     return  1
 
 
+def test_Mesh_NO10_RCB_element_distribution():
+    """"""
+    if rAnk == mAster_rank:
+        print("RCB {test_Mesh_NO10_RCB_element_distribution} ...... ", flush=True)
+
+    for name, kwargs, layout in [('crazy', {'c': 0.1}, [5, 4, 3]),
+                                 ('bridge_arch_cracked', dict(), [3, 2, 2]),
+                                 ('crazy_periodic', {'c': 0.}, [4, 3, 5])]:
+        MESH = MeshGenerator(name, **kwargs)(layout, EDM='debug')
+        mesh = MeshGenerator(name, **kwargs)(layout, EDM='RCB')
+        A = MESH.distribution_quality
+        B = mesh.distribution_quality
+
+        assert B['imbalance'] < 1 / (mesh._num_total_elements_ / sIze), \
+            f"RCB must distribute elements evenly."
+        if sIze <= 8 and 'periodic' not in name: # RCB does not see the periodic boundaries.
+            assert B['edge-cut'] <= A['edge-cut'], f"RCB should cut less element sides."
+        assert abs(B['quality'] - mesh.___PRIVATE_element_division_and_numbering_quality___()[0]) < 1e-12
+
+        # forms live on it as usual.
+        space = SpaceInvoker('polynomials')([2, 2, 2])
+        f = FormCaller(mesh, space)('2-f', is_hybrid=False)
+        F = FormCaller(MESH, space)('2-f', is_hybrid=False)
+        assert f.numbering.gathering.GLOBAL_num_dofs == F.numbering.gathering.GLOBAL_num_dofs
+
+    return 1
+
+
+
+def test_Mesh_NO11_point_locator():
+    """"""
+    if rAnk == mAster_rank:
+        print("LOC {test_Mesh_NO11_point_locator} ...... ", flush=True)
+
+    for name, kwargs, layout in [('crazy', {'c': 0.15}, [4, 3, 3]),
+                                 ('bridge_arch_cracked', dict(), [2, 2, 3])]:
+        mesh = MeshGenerator(name, **kwargs)(layout, EDM='chaotic')
+        locator = mesh.elements.locator
+
+        # points of known elements and reference coordinates (in the interior of elements).
+        elements = list()
+        REF = list()
+        X = list()
+        for i in mesh.elements:
+            xi, et, sg = np.random.uniform(-0.9, 0.9, (3, random.randint(1, 5)))
+            X.append(np.array(mesh.elements[i].coordinate_transformation.mapping(xi, et, sg)).T)
+            REF.append(np.array([xi, et, sg]).T)
+            elements.extend([i for _ in xi])
+        elements = np.array(elements, dtype=int)
+        X = np.concatenate(X) if len(X) > 0 else np.zeros((0, 3))
+        REF = np.concatenate(REF) if len(REF) > 0 else np.zeros((0, 3))
+
+        # local locating.
+        E, xi, et, sg = locator(X[:, 0], X[:, 1], X[:, 2])
+        np.testing.assert_array_equal(E, elements)
+        np.testing.assert_array_almost_equal(np.array([xi, et, sg]).T, REF, decimal=7)
+
+        # each core asks for the points of the next core and some points out of the domain.
+        X = cOmm.sendrecv(X, dest=(rAnk + 1) % sIze, source=(rAnk - 1) % sIze)
+        REF = cOmm.sendrecv(REF, dest=(rAnk + 1) % sIze, source=(rAnk - 1) % sIze)
+        elements = cOmm.sendrecv(elements, dest=(rAnk + 1) % sIze, source=(rAnk - 1) % sIze)
+        X = np.vstack([X, [[5, 5, 5], [-3, 0.5, 0.5]]])
+        E, xi, et, sg = locator.locate(X[:, 0], X[:, 1], X[:, 2])
+        np.testing.assert_array_equal(E[:-2], elements)
+        np.testing.assert_array_almost_equal(np.array([xi, et, sg]).T[:-2], REF, decimal=7)
+        assert np.all(E[-2:] == -1) and np.all(np.isnan(xi[-2:]))
+
+    return 1
+
+
 
 if __name__ == '__main__':
     # mpiexec -n 8 python objects\CSCG\_3d\__tests__\unittests\mesh.py
@@ -352,6 +352,14 @@ def test_Form_NO1a_discretization_and_reconstruction():
     f3.discretize()
     assert f3.error.L() < 0.003
 
+    # batched discretization gives the same local cochains.
+    for f in (f0, f1, f2, f3):
+        f.TW.do.push_all_to_instant(0.5)
+        A = f.discretize(update_cochain=False)[1]
+        B = f.discretize(update_cochain=False, batch=True)[1]
+        for i in mesh.elements:
+            np.testing.assert_array_almost_equal(A[i], B[i])
+
 
     mesh = MeshGenerator('bridge_arch_cracked',)([3,2,4], EDM='chaotic')
     space = SpaceInvoker('polynomials')([('Lobatto', 3), ('Lobatto', 4), ('Lobatto', 2)])
@@ -598,6 +606,23 @@ def test_Form_NO2_mass_matrix():
     if 0 in mesh.elements:
         np.testing.assert_array_almost_equal(mM2T[0].toarray()[:,0], -benchmark2)
 
+    # the batched inner product kernel vs the element-wise one --------------------------
+    for mesh in (MeshGenerator('crazy', c=0.0)([2, 3, 2], EDM='debug'),
+                 MeshGenerator('crazy', c=0.1)([2, 3, 2], EDM='debug'),
+                 MeshGenerator('bridge_arch_cracked')([2, 2, 2], EDM='debug')):
+        space = SpaceInvoker('polynomials')([('Lobatto', 2), ('Lobatto', 3), ('Lobatto', 1)])
+        FC = FormCaller(mesh, space)
+        for k in range(4):
+            f = FC(f'{k}-f', is_hybrid=True)
+            for o in (f, FC(f'{k}-f', is_hybrid=False)):
+                M = f.operators.inner(o)
+                quad_nodes, _, quad_weights = f.space.___PRIVATE_do_evaluate_quadrature___(f.dqp)
+                xietasigma, bfSelf = f.do.evaluate_basis_at_meshgrid(*quad_nodes)
+                bfOther = o.do.evaluate_basis_at_meshgrid(*quad_nodes)[1]
+                for i in M:
+                    Mi = f.___PRIVATE_operator_inner___(o, i, xietasigma, quad_weights, bfSelf, bfOther)
+                    np.testing.assert_array_almost_equal(M[i].toarray(), Mi.toarray(), decimal=12)
+
     return 1
 
 
@@ -894,6 +919,17 @@ def test_Form_NO5_cross_product_2():
     x.TW.___DO_push_all_to_instant___(0)
     assert x.error.L() < 0.00085
 
+    # the precomputed tensors give the same matrices, also after the cochain of w changes ...
+    # ... and with a small budget (the elements are batched in chunks).
+    MWt = w.special.cross_product_2f__ip_2f(u, x, tensor=True)
+    MWs = w.special.cross_product_2f__ip_2f(u, x, tensor=True, cache_max_bytes=2**17)
+    for k in range(2):
+        for i in mesh.elements:
+            assert np.max(np.abs((MW[i] - MWt[i]).toarray())) < 1e-10
+            assert np.max(np.abs((MW[i] - MWs[i]).toarray())) < 1e-10
+        assert MWs._DG_._T_cache_.stats['bytes'] <= 2**17
+        w.cochain.local = {i: np.random.rand(w.num.basis) for i in mesh.elements}
+
     return 1
 
 
@@ -1258,6 +1294,12 @@ def test_Form_No11_reconstruction_matrices():
         np.testing.assert_almost_equal(np.max(np.abs(U- u)), 0)
         np.testing.assert_almost_equal(np.max(np.abs(v- V)), 0)
         np.testing.assert_almost_equal(np.max(np.abs(w- W)), 0)
+    XYZ, RR = f.reconstruct(xi, et, sg, vectorized=True)
+    xyz, R = f.reconstruct(xi, et, sg)
+    for _, i in enumerate(R):
+        for j in range(3):
+            np.testing.assert_almost_equal(np.max(np.abs(XYZ[j][_] - xyz[i][j])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(RR[j][_] - R[i][j])), 0)
 
     #------------- 2-form ------------------------------
     f = FC('2-f', is_hybrid=IH)
@@ -1274,6 +1316,12 @@ def test_Form_No11_reconstruction_matrices():
         np.testing.assert_almost_equal(np.max(np.abs(U- u)), 0)
         np.testing.assert_almost_equal(np.max(np.abs(v- V)), 0)
         np.testing.assert_almost_equal(np.max(np.abs(w- W)), 0)
+    XYZ, RR = f.reconstruct(xi, et, sg, vectorized=True)
+    xyz, R = f.reconstruct(xi, et, sg)
+    for _, i in enumerate(R):
+        for j in range(3):
+            np.testing.assert_almost_equal(np.max(np.abs(XYZ[j][_] - xyz[i][j])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(RR[j][_] - R[i][j])), 0)
 
     #------------ 0-form ----------------------------------------------------
     f = FC('0-f', is_hybrid=IH)
@@ -1288,6 +1336,15 @@ def test_Form_No11_reconstruction_matrices():
         r = MR[i] @ f.cochain.local[i]
         np.testing.assert_almost_equal(np.max(np.abs(r - R[i][0])), 0)
         np.testing.assert_almost_equal(np.max(np.abs(r - RR[_,:])), 0)
+    for ravel in (True, False): # vectorized against element-wise
+        XYZ, RR = f.reconstruct(xi, et, sg, ravel=ravel, vectorized=True)
+        VV = f.reconstruct(xi, et, sg, ravel=ravel, vectorized=True, value_only=True)
+        xyz, R = f.reconstruct(xi, et, sg, ravel=ravel)
+        for _, i in enumerate(R):
+            for j in range(3):
+                np.testing.assert_almost_equal(np.max(np.abs(XYZ[j][_] - xyz[i][j])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(RR[0][_] - R[i][0])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(VV[0][_] - R[i][0])), 0)
 
     LnEnF = f.do.compute_Ln_energy(vectorized=False)
     LnEnT = f.do.compute_Ln_energy(vectorized=True)
@@ -1306,6 +1363,15 @@ def test_Form_No11_reconstruction_matrices():
         r = MR[i] @ f.cochain.local[i]
         np.testing.assert_almost_equal(np.max(np.abs(r - R[i][0])), 0)
         np.testing.assert_almost_equal(np.max(np.abs(r - RR[_,:])), 0)
+    for ravel in (True, False): # vectorized against element-wise
+        XYZ, RR = f.reconstruct(xi, et, sg, ravel=ravel, vectorized=True)
+        VV = f.reconstruct(xi, et, sg, ravel=ravel, vectorized=True, value_only=True)
+        xyz, R = f.reconstruct(xi, et, sg, ravel=ravel)
+        for _, i in enumerate(R):
+            for j in range(3):
+                np.testing.assert_almost_equal(np.max(np.abs(XYZ[j][_] - xyz[i][j])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(RR[0][_] - R[i][0])), 0)
+            np.testing.assert_almost_equal(np.max(np.abs(VV[0][_] - R[i][0])), 0)
 
     return 1
 
@@ -1399,6 +1465,57 @@ def test_Form_NO12_weak_curl():
     return 1
 
 
+def test_Form_NO13_parallel_field_export():
+    """"""
+    if rAnk == mAster_rank:
+        print(f"EXP [test_Form_NO13_parallel_field_export]... ", flush=True)
+
+    from scipy.io import loadmat
+
+    def u(t, x, y, z): return np.cos(np.pi*x) + np.sin(np.pi*y) * z + t
+    def v(t, x, y, z): return np.sin(np.pi*x) + y * np.cos(np.pi*z) + t
+    def w(t, x, y, z): return x * y * z + t
+
+    mesh = MeshGenerator('bridge_arch_cracked',)([3, 2, 2], EDM='chaotic')
+    space = SpaceInvoker('polynomials')([2, 3, 2])
+    FC = FormCaller(mesh, space)
+    f0 = FC('0-f', is_hybrid=False)
+    f2 = FC('2-f', is_hybrid=False)
+    f0.TW.func.body = FC('scalar', u)
+    f2.TW.func.body = FC('vector', (u, v, w))
+    f0.TW.do.push_all_to_instant(0)
+    f2.TW.do.push_all_to_instant(0)
+    f0.discretize()
+    f2.discretize()
+
+    for f, components in [(f0, ('x', 'y', 'z', 'v')), (f2, ('x', 'y', 'z', 'vx', 'vy', 'vz'))]:
+        f.export.field.to_file('test_export_field.mat', numOfSamples=1500)
+        f.export.field.to_file('test_export_field.npy', numOfSamples=1500)
+        f.export.field.to_file('test_export_field.npy', numOfSamples=1500, layout='point-cloud')
+        cOmm.barrier()
+
+        if rAnk == mAster_rank:
+            suffix = '__' + '_'.join(components)
+            POINTS = list()
+            for rn in mesh.domain.regions.names:
+                FILE_NAME = 'test_export_field__InRegion_' + rn[2:] + suffix
+                A = loadmat(FILE_NAME + '.mat')
+                B = np.load(FILE_NAME + '.npy')
+                assert B.shape[0] == len(components)
+                for j, c in enumerate(components):
+                    np.testing.assert_array_equal(A[c], B[j])
+                POINTS.append(B.reshape((len(components), -1)).T)
+                os.remove(FILE_NAME + '.mat')
+                os.remove(FILE_NAME + '.npy')
+            POINTS = np.concatenate(POINTS)
+            CLOUD = np.load('test_export_field' + suffix + '.npy')
+            assert CLOUD.shape == POINTS.shape
+            np.testing.assert_array_equal(CLOUD[np.lexsort(CLOUD.T)], POINTS[np.lexsort(POINTS.T)])
+            os.remove('test_export_field' + suffix + '.npy')
+
+    return 1
+
+
 
 
 
@@ -14,7 +14,8 @@ from objects.CSCG._3d.fields.vector.main import _3dCSCG_VectorField
 from objects.CSCG._3d.fields.scalar.main import _3dCSCG_ScalarField
 from screws.numerical._3d_space.partial_derivative import NumericalPartialDerivative_xyz
 from screws.numerical.time_plus_3d_space.partial_derivative import NumericalPartialDerivative_txyz
-from screws.numerical.time_plus_3d_space.partial_derivative_as_functions import NumericalPartialDerivative_txyz_Functions
+from screws.numerical.time_plus_3d_space.automatic_partial_derivative_as_functions import \
+    AutomaticPartialDerivative_txyz_Functions, automatic_second_partial
 import numpy as np
 
 class incompressible_NavierStokes_Base(Base):
@@ -69,19 +70,19 @@ class incompressible_NavierStokes_Base(Base):
         raise NotImplementedError()
     def u_t(self, t, x, y, z):
         if self._NPDf_u_ is None:
-            self._NPDf_u_ = NumericalPartialDerivative_txyz_Functions(self.u)
+            self._NPDf_u_ = AutomaticPartialDerivative_txyz_Functions(self.u)
         return self._NPDf_u_('t')(t, x, y, z)
     def u_x(self, t, x, y, z):
         if self._NPDf_u_ is None:
-            self._NPDf_u_ = NumericalPartialDerivative_txyz_Functions(self.u)
+            self._NPDf_u_ = AutomaticPartialDerivative_txyz_Functions(self.u)
         return self._NPDf_u_('x')(t, x, y, z)
     def u_y(self, t, x, y, z):
         if self._NPDf_u_ is None:
-            self._NPDf_u_ = NumericalPartialDerivative_txyz_Functions(self.u)
+            self._NPDf_u_ = AutomaticPartialDerivative_txyz_Functions(self.u)
         return self._NPDf_u_('y')(t, x, y, z)
     def u_z(self, t, x, y, z):
         if self._NPDf_u_ is None:
-            self._NPDf_u_ = NumericalPartialDerivative_txyz_Functions(self.u)
+            self._NPDf_u_ = AutomaticPartialDerivative_txyz_Functions(self.u)
         return self._NPDf_u_('z')(t, x, y, z)
 
 
@@ -89,19 +90,19 @@ class incompressible_NavierStokes_Base(Base):
         raise NotImplementedError()
     def v_t(self, t, x, y, z):
         if self._NPDf_v_ is None:
-            self._NPDf_v_ = NumericalPartialDerivative_txyz_Functions(self.v)
+            self._NPDf_v_ = AutomaticPartialDerivative_txyz_Functions(self.v)
         return self._NPDf_v_('t')(t, x, y, z)
     def v_x(self, t, x, y, z):
         if self._NPDf_v_ is None:
-            self._NPDf_v_ = NumericalPartialDerivative_txyz_Functions(self.v)
+            self._NPDf_v_ = AutomaticPartialDerivative_txyz_Functions(self.v)
         return self._NPDf_v_('x')(t, x, y, z)
     def v_y(self, t, x, y, z):
         if self._NPDf_v_ is None:
-            self._NPDf_v_ = NumericalPartialDerivative_txyz_Functions(self.v)
+            self._NPDf_v_ = AutomaticPartialDerivative_txyz_Functions(self.v)
         return self._NPDf_v_('y')(t, x, y, z)
     def v_z(self, t, x, y, z):
         if self._NPDf_v_ is None:
-            self._NPDf_v_ = NumericalPartialDerivative_txyz_Functions(self.v)
+            self._NPDf_v_ = AutomaticPartialDerivative_txyz_Functions(self.v)
         return self._NPDf_v_('z')(t, x, y, z)
 
 
@@ -109,75 +110,75 @@ class incompressible_NavierStokes_Base(Base):
         raise NotImplementedError()
     def w_t(self, t, x, y, z):
         if self._NPDf_w_ is None:
-            self._NPDf_w_ = NumericalPartialDerivative_txyz_Functions(self.w)
+            self._NPDf_w_ = AutomaticPartialDerivative_txyz_Functions(self.w)
         return self._NPDf_w_('t')(t, x, y, z)
     def w_x(self, t, x, y, z):
         if self._NPDf_w_ is None:
-            self._NPDf_w_ = NumericalPartialDerivative_txyz_Functions(self.w)
+            self._NPDf_w_ = AutomaticPartialDerivative_txyz_Functions(self.w)
         return self._NPDf_w_('x')(t, x, y, z)
     def w_y(self, t, x, y, z):
         if self._NPDf_w_ is None:
-            self._NPDf_w_ = NumericalPartialDerivative_txyz_Functions(self.w)
+            self._NPDf_w_ = AutomaticPartialDerivative_txyz_Functions(self.w)
         return self._NPDf_w_('y')(t, x, y, z)
     def w_z(self, t, x, y, z):
         if self._NPDf_w_ is None:
-            self._NPDf_w_ = NumericalPartialDerivative_txyz_Functions(self.w)
+            self._NPDf_w_ = AutomaticPartialDerivative_txyz_Functions(self.w)
         return self._NPDf_w_('z')(t, x, y, z)
 
 
     def p(self, t, x, y, z): raise NotImplementedError()
     def p_x(self, t, x, y, z):
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.p)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.p)
         return self._NPDf_p_('x')(t, x, y, z)
     def p_y(self, t, x, y, z):
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.p)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.p)
         return self._NPDf_p_('y')(t, x, y, z)
     def p_z(self, t, x, y, z):
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.p)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.p)
         return self._NPDf_p_('z')(t, x, y, z)
 
 
     def u_xx(self, t, x, y, z):
         if self._NPDf_ux_ is None:
-            self._NPDf_ux_ = NumericalPartialDerivative_txyz_Functions(self.u_x)
-        return self._NPDf_ux_('x')(t, x, y, z)
+            self._NPDf_ux_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'u', 'u_x', 'x')
+        return self._NPDf_ux_(t, x, y, z)
     def u_yy(self, t, x, y, z):
         if self._NPDf_uy_ is None:
-            self._NPDf_uy_ = NumericalPartialDerivative_txyz_Functions(self.u_y)
-        return self._NPDf_uy_('y')(t, x, y, z)
+            self._NPDf_uy_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'u', 'u_y', 'y')
+        return self._NPDf_uy_(t, x, y, z)
     def u_zz(self, t, x, y, z):
         if self._NPDf_uz_ is None:
-            self._NPDf_uz_ = NumericalPartialDerivative_txyz_Functions(self.u_z)
-        return self._NPDf_uz_('z')(t, x, y, z)
+            self._NPDf_uz_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'u', 'u_z', 'z')
+        return self._NPDf_uz_(t, x, y, z)
 
     def v_xx(self, t, x, y, z):
         if self._NPDf_vx_ is None:
-            self._NPDf_vx_ = NumericalPartialDerivative_txyz_Functions(self.v_x)
-        return self._NPDf_vx_('x')(t, x, y, z)
+            self._NPDf_vx_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'v', 'v_x', 'x')
+        return self._NPDf_vx_(t, x, y, z)
     def v_yy(self, t, x, y, z):
         if self._NPDf_vy_ is None:
-            self._NPDf_vy_ = NumericalPartialDerivative_txyz_Functions(self.v_y)
-        return self._NPDf_vy_('y')(t, x, y, z)
+            self._NPDf_vy_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'v', 'v_y', 'y')
+        return self._NPDf_vy_(t, x, y, z)
     def v_zz(self, t, x, y, z):
         if self._NPDf_vz_ is None:
-            self._NPDf_vz_ = NumericalPartialDerivative_txyz_Functions(self.v_z)
-        return self._NPDf_vz_('z')(t, x, y, z)
+            self._NPDf_vz_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'v', 'v_z', 'z')
+        return self._NPDf_vz_(t, x, y, z)
 
     def w_xx(self, t, x, y, z):
         if self._NPDf_wx_ is None:
-            self._NPDf_wx_ = NumericalPartialDerivative_txyz_Functions(self.w_x)
-        return self._NPDf_wx_('x')(t, x, y, z)
+            self._NPDf_wx_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'w', 'w_x', 'x')
+        return self._NPDf_wx_(t, x, y, z)
     def w_yy(self, t, x, y, z):
         if self._NPDf_wy_ is None:
-            self._NPDf_wy_ = NumericalPartialDerivative_txyz_Functions(self.w_y)
-        return self._NPDf_wy_('y')(t, x, y, z)
+            self._NPDf_wy_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'w', 'w_y', 'y')
+        return self._NPDf_wy_(t, x, y, z)
     def w_zz(self, t, x, y, z):
         if self._NPDf_wz_ is None:
-            self._NPDf_wz_ = NumericalPartialDerivative_txyz_Functions(self.w_z)
-        return self._NPDf_wz_('z')(t, x, y, z)
+            self._NPDf_wz_ = automatic_second_partial(self, incompressible_NavierStokes_Base, 'w', 'w_z', 'z')
+        return self._NPDf_wz_(t, x, y, z)
 
     # .............................................................................
 
@@ -478,9 +479,11 @@ class incompressible_NavierStokes_Base(Base):
             wx = partial(self.omega_x, time)
             wy = partial(self.omega_y, time)
             wz = partial(self.omega_z, time)
-            Pwx = NumericalPartialDerivative_xyz(wx, *rst)
-            Pwy = NumericalPartialDerivative_xyz(wy, *rst)
-            Pwz = NumericalPartialDerivative_xyz(wz, *rst)
+            # the vorticity is not a finite difference anymore (its round-off is not cancelled), so
+            # a larger step with a higher order stencil.
+            Pwx = NumericalPartialDerivative_xyz(wx, *rst, dxdydz=1e-3, order=5)
+            Pwy = NumericalPartialDerivative_xyz(wy, *rst, dxdydz=1e-3, order=5)
+            Pwz = NumericalPartialDerivative_xyz(wz, *rst, dxdydz=1e-3, order=5)
             Pwx_x = Pwx.scipy_partial('x')
             Pwy_y = Pwy.scipy_partial('y')
             Pwz_z = Pwz.scipy_partial('z')
@@ -25,8 +25,8 @@ from objects.CSCG._3d.fields.vector.main import _3dCSCG_VectorField
 from objects.CSCG._3d.fields.scalar.main import _3dCSCG_ScalarField
 
 from screws.numerical.time_plus_3d_space.partial_derivative import NumericalPartialDerivative_txyz
-from screws.numerical.time_plus_3d_space.partial_derivative_as_functions import \
-    NumericalPartialDerivative_txyz_Functions
+from screws.numerical.time_plus_3d_space.automatic_partial_derivative_as_functions import \
+    AutomaticPartialDerivative_txyz_Functions, automatic_second_partial
 
 
 
@@ -83,34 +83,34 @@ class TimeIndependentSchrodingerEquationBase(Base):
     def u(self, t, x, y, z):
         """phi_x"""
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.psi)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.psi)
         return self._NPDf_p_('x')(t, x, y, z)
     def v(self, t, x, y, z):
         """phi_y"""
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.psi)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.psi)
         return self._NPDf_p_('y')(t, x, y, z)
     def w(self, t, x, y, z):
         """phi_z"""
         if self._NPDf_p_ is None:
-            self._NPDf_p_ = NumericalPartialDerivative_txyz_Functions(self.psi)
+            self._NPDf_p_ = AutomaticPartialDerivative_txyz_Functions(self.psi)
         return self._NPDf_p_('z')(t, x, y, z)
 
 
     def u_x(self, t, x, y, z):
         if self._NPDf_px_ is None:
-            self._NPDf_px_ = NumericalPartialDerivative_txyz_Functions(self.u)
-        return self._NPDf_px_('x')(t, x, y, z)
+            self._NPDf_px_ = automatic_second_partial(self, TimeIndependentSchrodingerEquationBase, 'psi', 'u', 'x')
+        return self._NPDf_px_(t, x, y, z)
 
     def v_y(self, t, x, y, z):
         if self._NPDf_py_ is None:
-            self._NPDf_py_ = NumericalPartialDerivative_txyz_Functions(self.v)
-        return self._NPDf_py_('y')(t, x, y, z)
+            self._NPDf_py_ = automatic_second_partial(self, TimeIndependentSchrodingerEquationBase, 'psi', 'v', 'y')
+        return self._NPDf_py_(t, x, y, z)
 
     def w_z(self, t, x, y, z):
         if self._NPDf_pz_ is None:
-            self._NPDf_pz_ = NumericalPartialDerivative_txyz_Functions(self.w)
-        return self._NPDf_pz_('z')(t, x, y, z)
+            self._NPDf_pz_ = automatic_second_partial(self, TimeIndependentSchrodingerEquationBase, 'psi', 'w', 'z')
+        return self._NPDf_pz_(t, x, y, z)
 
 
     @property
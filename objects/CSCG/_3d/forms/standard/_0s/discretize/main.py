@@ -12,7 +12,7 @@ class _3dCSCG_Discretize(FrozenOnly):
         self._boundary_wise_ = _3dCSCG_Discretize_BoundaryWise(sf)
         self._freeze_self_()
 
-    def __call__(self, update_cochain=True, target='func'):
+    def __call__(self, update_cochain=True, target='func', **kwargs):
         """Discretize the current function (a scalar field) to cochain.
 
         It is actually a wrapper of multiple methods that discretize functions of different types (a scalar
@@ -21,6 +21,7 @@ class _3dCSCG_Discretize(FrozenOnly):
         :param bool update_cochain: (`default`: ``True``) If we update cochain with the output? Sometimes we
             may do not want to do so since we just want to use this method do some external jobs.
         :param target:
+        :param kwargs:
         :return: The cochain.
         :rtype: Its type can be different according to the particular discretize method.
 
@@ -29,7 +30,7 @@ class _3dCSCG_Discretize(FrozenOnly):
         if target == 'func':
             if SELF.TW.func.body.__class__.__name__ == '_3dCSCG_ScalarField':
                 if SELF.func.ftype == 'standard':
-                    return self._standard_(update_cochain=update_cochain)
+                    return self._standard_(update_cochain=update_cochain, **kwargs)
                 else:
                     raise NotImplementedError(f"3dCSCG 0-form cannot (target func) discretize "
                                               f"_3dCSCG_ScalarField of ftype={SELF.func.ftype}")
@@ -42,7 +43,7 @@ class _3dCSCG_Discretize(FrozenOnly):
             if SELF.TW.BC.body.__class__.__name__ == '_3dCSCG_ScalarField':
                 if SELF.BC.ftype == 'standard':
                     # always do not update cochain & and target always be "BC"
-                    return self._standard_(update_cochain=False, target='BC')
+                    return self._standard_(update_cochain=False, target='BC', **kwargs)
 
                 elif SELF.BC.ftype == "boundary-wise":
                     # we will always not update cochain & and always set target to be "BC"
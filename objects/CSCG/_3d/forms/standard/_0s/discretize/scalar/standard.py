@@ -8,13 +8,19 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         self._sf_ = sf
         self._freeze_self_()
 
-    def __call__(self, update_cochain=True, target='func'):
+    def __call__(self, update_cochain=True, target='func', batch=False):
         """
         The return cochain is 'locally full local cochain', which means it is mesh-element-wise
         local cochain. So:
 
         cochainLocal is a dict, whose keys are mesh element numbers, and values (1-d arrays) are
         the local cochains.
+
+        :param update_cochain:
+        :param target:
+        :param batch: If True, we evaluate the mapping of all local elements together and call the
+            function only once on the stacked coordinates. The function must accept ndarrays of
+            any shape.
         """
         SELF = self._sf_
 
@@ -31,10 +37,15 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
             raise NotImplementedError(
                 f"_0Form.___PRIVATE_discretize_standard_ftype___ "
                 f"does not work for target={target}.")
-        for i in SELF.mesh.elements:
-            element = SELF.mesh.elements[i]
-            xyz = element.coordinate_transformation.mapping(*nodes)
-            cochainLocal[i] = FUNC(*xyz)
+        if batch:
+            if len(SELF.mesh.elements) > 0:
+                xyz = SELF.mesh.elements.coordinate_transformation.vectorized.mapping(*nodes)
+                cochainLocal = dict(zip(SELF.mesh.elements.indices, FUNC(*xyz)))
+        else:
+            for i in SELF.mesh.elements:
+                element = SELF.mesh.elements[i]
+                xyz = element.coordinate_transformation.mapping(*nodes)
+                cochainLocal[i] = FUNC(*xyz)
         # isKronecker? ...
         if not SELF.space.IS_Kronecker: raise NotImplementedError()
         # pass to cochain.local ...
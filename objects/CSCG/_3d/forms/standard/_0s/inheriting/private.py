@@ -40,3 +40,12 @@ class _3dCSCG_S0F_Private:
         Mi = np.einsum('im, jm, m -> ij', bfOther[0], bfSelf[0], detJ*quad_weights, optimize='greedy')
         Mi = csc_matrix(Mi)
         return Mi
+
+    def ___PRIVATE_operator_inner_batched___(self, _, elements, xietasigma, quad_weights, bfSelf, bfOther):
+        """The batched version of ``___PRIVATE_operator_inner___``: we compute the local matrices
+        of all `elements` together and return them as a 3d ndarray whose first index refers to
+        `elements`.
+        """
+        detJ = self.mesh.elements.coordinate_transformation.vectorized.Jacobian(*xietasigma, elements=elements)
+        M = np.einsum('im, jm, em -> eij', bfOther[0], bfSelf[0], detJ*quad_weights, optimize='greedy')
+        return M
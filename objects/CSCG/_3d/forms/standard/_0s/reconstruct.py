@@ -63,19 +63,27 @@ class _3dCSCG_SF0_reconstruct(FrozenOnly):
                                                           f"for full reconstruction."
             if len(INDICES) > 0:
                 v = np.einsum('ij, ki -> kj', basis[0], f.cochain.array, optimize='greedy')
-
+                value = (v,)
+                if not value_only:
+                    xyz = mesh.elements.coordinate_transformation.vectorized.mapping(*xietasigma)
             else:
-                v = None
+                value = (None,)
+                xyz = (None, None, None)
 
-            if ravel:
+            if ravel or len(INDICES) == 0:
                 pass
             else:
-                raise NotImplementedError()
+                shape = [len(INDICES), len(sigma), len(eta), len(xi)] # the local meshgrid is in Fortran order.
+                value = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in value])
+                if not value_only:
+                    # noinspection PyUnboundLocalVariable
+                    xyz = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in xyz])
 
             if value_only:
-                return (v,)
+                return value
             else:
-                raise Exception()
+                # noinspection PyUnboundLocalVariable
+                return xyz, value
 
         #------- non-vectorized -------------------------------------------------------------------
         else:
@@ -155,76 +155,68 @@ class _0Form_Special(FrozenOnly):
         nT = dict() # the new Trace matrix.
         nC = dict() # the new Trace matrix.
 
-        SKIPPED_edge_elements = list()
+        # The SOS of an edge element (if any) is only in one core which has this edge element (and
+        # thus knows if it is skipped). So each core only parses its local edge elements; no
+        # communication is needed except collecting the skipped edge elements (one allgather).
+        Dirichlet_boundaries = set(Dirichlet_boundaries)
+        LOCAL_edge_elements = list(mesh.edge.elements)
+        skip = np.array([len(Dirichlet_boundaries.intersection(
+            mesh.edge.elements[i].on_mesh_boundaries)) > 0 for i in LOCAL_edge_elements], dtype=bool)
 
-        for i in range(mesh.edge.elements.GLOBAL_num):
+        SKIPPED_edge_elements = cOmm.allgather(
+            [i for i, s in zip(LOCAL_edge_elements, skip) if s])
+        SKIPPED_edge_elements = sorted(set(chain(*SKIPPED_edge_elements)))
 
-            if i in mesh.edge.elements:
-                edge_element = mesh.edge.elements[i]
-                on_mesh_boundaries = edge_element.on_mesh_boundaries
-                skip = False
-                for mb in on_mesh_boundaries:
-                    if mb in Dirichlet_boundaries:
-                        skip = True
-                        break
-            else:
-                skip = False
+        for i in [i for i, s in zip(LOCAL_edge_elements, skip) if not s]:
 
-            skip = cOmm.allreduce(skip, op=MPI.LOR)
+            SOS = mesh.edge.elements.do.find.hybrid_singularity_overcoming_setting(i)
 
-            if skip:
+            if SOS is None: # this core has no business with this SOS
+                pass
+            else:
+                edge_element = mesh.edge.elements[i]
+                replacing = SOS.replacing
+                mesh_element, corner_edge = replacing
+
+                through = SOS.through
+                assert mesh_element in mesh.elements
+                sf_local_dofs = self._sf_.numbering.do.find.local_dofs_on_element_corner_edge(
+                    corner_edge
+                )
+
+                trace_element, trace_edge = through
+                T_MAP = mesh.trace.elements.map[mesh_element]
+                for si, _ in enumerate(T_MAP):
+                    if _ == trace_element:
+                        break
+                trace_face = 'NSWEBF'[si]
+                tf_local_dofs = self._sf_.space.local_numbering.\
+                    ___PRIVATE_find_MESH_ELEMENT_WISE_local_dofs_of_0Trace_edge___(
+                    trace_face, trace_edge
+                )
+
+                positions = edge_element.positions
+                for pos in positions:
+                    if int(pos[:-2]) == mesh_element:
+                        edge_name = pos[-2:]
+                        break
+                ef_local_dofs = self._sf_.space.local_numbering.\
+                    ___PRIVATE_find_MESH_ELEMENT_WISE_local_dofs_of_0edge_edge___(
+                    edge_name
+                )
 
-                SKIPPED_edge_elements.append(i)
+                assert len(sf_local_dofs) == len(tf_local_dofs) == len(ef_local_dofs), \
+                    f"Trivial check!"
 
-            else:
+                if mesh_element not in nT:
+                    nT[mesh_element] = T[mesh_element].copy().tolil()
 
-                SOS = mesh.edge.elements.do.find.hybrid_singularity_overcoming_setting(i)
+                V = nT[mesh_element][tf_local_dofs, sf_local_dofs]
+                nT[mesh_element][tf_local_dofs, sf_local_dofs] = 0
 
-                if SOS is None: # this core has no business with this SOS
-                    pass
-                else:
-                    replacing = SOS.replacing
-                    mesh_element, corner_edge = replacing
-
-                    through = SOS.through
-                    assert mesh_element in mesh.elements
-                    sf_local_dofs = self._sf_.numbering.do.find.local_dofs_on_element_corner_edge(
-                        corner_edge
-                    )
-
-                    trace_element, trace_edge = through
-                    T_MAP = mesh.trace.elements.map[mesh_element]
-                    for si, _ in enumerate(T_MAP):
-                        if _ == trace_element:
-                            break
-                    trace_face = 'NSWEBF'[si]
-                    tf_local_dofs = self._sf_.space.local_numbering.\
-                        ___PRIVATE_find_MESH_ELEMENT_WISE_local_dofs_of_0Trace_edge___(
-                        trace_face, trace_edge
-                    )
-
-                    positions = edge_element.positions
-                    for pos in positions:
-                        if int(pos[:-2]) == mesh_element:
-                            edge_name = pos[-2:]
-                            break
-                    ef_local_dofs = self._sf_.space.local_numbering.\
-                        ___PRIVATE_find_MESH_ELEMENT_WISE_local_dofs_of_0edge_edge___(
-                        edge_name
-                    )
-
-                    assert len(sf_local_dofs) == len(tf_local_dofs) == len(ef_local_dofs), \
-                        f"Trivial check!"
-
-                    if mesh_element not in nT:
-                        nT[mesh_element] = T[mesh_element].copy().tolil()
-
-                    V = nT[mesh_element][tf_local_dofs, sf_local_dofs]
-                    nT[mesh_element][tf_local_dofs, sf_local_dofs] = 0
-
-                    if mesh_element not in nC:
-                        nC[mesh_element] = C[mesh_element].copy().tolil()
-                    nC[mesh_element][tf_local_dofs, ef_local_dofs] = V
+                if mesh_element not in nC:
+                    nC[mesh_element] = C[mesh_element].copy().tolil()
+                nC[mesh_element][tf_local_dofs, ef_local_dofs] = V
 
         for _ in T:
             if _ not in nT:
@@ -393,10 +385,8 @@ class _0Form_Special(FrozenOnly):
                 else:
                     N_e0_dof = -1
 
-                involved_t0_dofs = cOmm.allgather(involved_t0_dofs)
-                involved_e0_dofs = cOmm.allgather(involved_e0_dofs)
-                S_e0_dof = cOmm.allgather(S_e0_dof)
-                N_e0_dof = cOmm.allgather(N_e0_dof)
+                involved_t0_dofs, involved_e0_dofs, S_e0_dof, N_e0_dof = zip(*cOmm.allgather(
+                    (involved_t0_dofs, involved_e0_dofs, S_e0_dof, N_e0_dof)))
 
                 ___ = dict()
                 for _ in involved_t0_dofs:
@@ -10,7 +10,7 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         self.___DISCRETIZE_STANDARD_CACHE___ = None
         self._freeze_self_()
 
-    def __call__(self, update_cochain=True, target='func', quad_degree=None):
+    def __call__(self, update_cochain=True, target='func', quad_degree=None, batch=False):
         """The return cochain is 'locally full local cochain', which means it is mesh-element-wise
         local cochain. So:
 
@@ -20,6 +20,9 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         :param update_cochain:
         :param target:
         :param quad_degree:
+        :param batch: If True, we evaluate the mapping (and the Jacobian) of all local elements
+            together and call the function only once (for each component and direction) on the
+            stacked coordinates. The function must accept ndarrays of any shape.
         :return:
         """
         SELF = self._sf_
@@ -70,6 +73,11 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
                 f"_1Form.___PRIVATE_discretize_standard_ftype___ "
                 f"does not work for target={target}.")
 
+        if batch:
+            cochainLocal = self.___PRIVATE_batch_discretize___(FUNC, quad_weights, edge_size)
+            if update_cochain: SELF.cochain.local = cochainLocal
+            return 'locally full local cochain', cochainLocal
+
         for i in SELF.mesh.elements.indices:
             element = SELF.mesh.elements[i]
             typeWr2Metric = element.type_wrt_metric.mark
@@ -154,6 +162,30 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         # ...
         return 'locally full local cochain', cochainLocal
 
+    def ___PRIVATE_batch_discretize___(self, FUNC, quad_weights, edge_size):
+        """Discretize `FUNC` in all local elements together.
+
+        :return: The 'locally full local cochain'.
+        """
+        SELF = self._sf_
+        if not SELF.space.IS_Kronecker: raise NotImplementedError()
+        elements = SELF.mesh.elements
+        if len(elements) == 0:
+            return dict()
+
+        VEC = elements.coordinate_transformation.vectorized
+        LOCAL = list()
+        for d, key in enumerate('XYZ'):
+            xi, eta, sigma = self.___DISCRETIZE_STANDARD_CACHE___[key]
+            xyz = VEC.mapping(xi, eta, sigma)
+            J = VEC.Jacobian_matrix(xi, eta, sigma)
+            uvw = J[0][d] * FUNC.body[0](*xyz) + J[1][d] * FUNC.body[1](*xyz) + J[2][d] * FUNC.body[2](*xyz)
+            LOCAL.append(np.einsum('ejk, j, k -> ek', uvw, quad_weights[d],
+                                   edge_size[d] * 0.5, optimize='greedy'))
+
+        LOCAL = np.hstack(LOCAL)
+        return dict(zip(elements.indices, LOCAL))
+
     def ___PRIVATE_discretize_preparation___(self, d_='', quad_degree=None):
         SELF = self._sf_
         p = [SELF.dqp[i] + 1 for i in range(SELF.ndim)] if quad_degree is None else quad_degree
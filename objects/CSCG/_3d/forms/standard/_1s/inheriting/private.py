@@ -139,6 +139,39 @@ class _3dCSCG_S1F_Private:
         M = np.einsum('m, im, jm -> ij', quad_weights*sqrt_g_g, bfO, bfS, optimize='optimal')
         return csc_matrix(M)
 
+    def ___PRIVATE_operator_inner_batched___(self, other, elements, xietasigma, quad_weights, bfSelf, bfOther):
+        """The batched version of ``___PRIVATE_operator_inner___``: we compute the local matrices
+        of all `elements` together and return them as a 3d ndarray whose first index refers to
+        `elements`. When all `elements` are orthogonal, the off-diagonal blocks are skipped (zero).
+        """
+        CT = self.mesh.elements.coordinate_transformation.vectorized
+        orthogonal = all([isinstance(self.mesh.elements[i].type_wrt_metric.mark, str) and
+                          self.mesh.elements[i].type_wrt_metric.mark[:4] == 'Orth' for i in elements])
+        J = CT.Jacobian_matrix(*xietasigma, elements=elements)
+        sqrtg = CT.Jacobian(*xietasigma, J=J)
+        iJ = CT.inverse_Jacobian_matrix(*xietasigma, elements=elements, J=J)
+        g = CT.inverse_metric_matrix(*xietasigma, iJ=iJ)
+        del J, iJ
+
+        rO = np.cumsum([0,] + [_.shape[0] for _ in bfOther])
+        rS = np.cumsum([0,] + [_.shape[0] for _ in bfSelf])
+        M = np.zeros((len(elements), rO[-1], rS[-1]))
+        for a in range(3):
+            for b in range(3):
+                if a != b and orthogonal:
+                    continue
+                elif a > b and other is self:
+                    M[:, rO[a]:rO[a+1], rS[b]:rS[b+1]] = \
+                        M[:, rO[b]:rO[b+1], rS[a]:rS[a+1]].transpose((0, 2, 1))
+                else:
+                    M[:, rO[a]:rO[a+1], rS[b]:rS[b+1]] = \
+                        self.___PRIVATE_inner_H1_batched___(quad_weights, sqrtg*g[a][b], bfOther[a], bfSelf[b])
+        return M
+
+    @staticmethod
+    def ___PRIVATE_inner_H1_batched___(quad_weights, sqrt_g_g, bfO, bfS):
+        return np.einsum('em, im, jm -> eij', quad_weights*sqrt_g_g, bfO, bfS, optimize='optimal')
+
 
     def ___PRIVATE_basis_boundary_integral_over_region_side___(self,
         vector, region_name, side_name, quad_degree=None):
@@ -13,7 +13,7 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         self._freeze_self_()
 
 
-    def __call__(self, update_cochain=True, target='func', quad_degree=None):
+    def __call__(self, update_cochain=True, target='func', quad_degree=None, batch=False):
         """The return cochain is 'locally full local cochain', which means it is mesh-element-wise
         local cochain. So:
 
@@ -23,6 +23,9 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         :param update_cochain:
         :param target:
         :param quad_degree:
+        :param batch: If True, we evaluate the mapping (and the Jacobian) of all local elements
+            together and call the function only once (for each component and direction) on the
+            stacked coordinates. The function must accept ndarrays of any shape.
         :return:
         """
         SELF = self._sf_
@@ -117,6 +120,11 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
                 f"_2Form.___PRIVATE_discretize_standard_ftype___ "
                 f"does not work for target={target}.")
 
+        if batch:
+            cochainLocal = self.___PRIVATE_batch_discretize___(FUNC, quad_weights)
+            if update_cochain: SELF.cochain.local = cochainLocal
+            return 'locally full local cochain', cochainLocal
+
         for i in SELF.mesh.elements:
             element = SELF.mesh.elements[i]
             typeWr2Metric = element.type_wrt_metric.mark
@@ -219,6 +227,35 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         return 'locally full local cochain', cochainLocal
 
 
+    def ___PRIVATE_batch_discretize___(self, FUNC, quad_weights):
+        """Discretize `FUNC` in all local elements together.
+
+        :return: The 'locally full local cochain'.
+        """
+        SELF = self._sf_
+        if not SELF.space.IS_Kronecker: raise NotImplementedError()
+        elements = SELF.mesh.elements
+        if len(elements) == 0:
+            return dict()
+
+        VEC = elements.coordinate_transformation.vectorized
+        LOCAL = list()
+        # (the direction, the tangent directions of the faces, the cache key)
+        for d, (t0, t1), key in [(0, (1, 2), 'X'), (1, (0, 2), 'Y'), (2, (0, 1), 'Z')]:
+            xi, et, si, area = self.___DISCRETIZE_STANDARD_CACHE___[key]
+            xyz = VEC.mapping(xi, et, si)
+            J = VEC.Jacobian_matrix(xi, et, si)
+            # the d-th column of the cofactor matrix of J.
+            Jd = [J[(c+1)%3][(d+1)%3] * J[(c+2)%3][(d+2)%3] - J[(c+1)%3][(d+2)%3] * J[(c+2)%3][(d+1)%3]
+                  for c in range(3)]
+            uvw = Jd[0] * FUNC.body[0](*xyz) + Jd[1] * FUNC.body[1](*xyz) + Jd[2] * FUNC.body[2](*xyz)
+            LOCAL.append(np.einsum('ejkl, kl, j -> ej',
+                                   uvw, np.tensordot(quad_weights[t0], quad_weights[t1], axes=0),
+                                   area * 0.25, optimize='optimal'))
+
+        LOCAL = np.hstack(LOCAL)
+        return dict(zip(elements.indices, LOCAL))
+
     @staticmethod
     def ___PRIVATE_discretize_standard_einsum___(uvw, quad_weights_1, quad_weights_2, area):
         """ """
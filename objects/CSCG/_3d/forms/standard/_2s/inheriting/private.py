@@ -164,3 +164,46 @@ class _3dCSCG_S2F_Private:
     def ___PRIVATE_inner_H1___(quad_weights, sqrt_g, g, bfO, bfS):
         M = np.einsum('m, im, jm -> ij', quad_weights * sqrt_g * g, bfO, bfS, optimize='optimal')
         return csc_matrix(M)
+
+    def ___PRIVATE_operator_inner_batched___(self, other, elements, xietasigma, quad_weights, bfSelf, bfOther):
+        """The batched version of ``___PRIVATE_operator_inner___``: we compute the local matrices
+        of all `elements` together and return them as a 3d ndarray whose first index refers to
+        `elements`. When all `elements` are orthogonal, the off-diagonal blocks are skipped (zero).
+        """
+        CT = self.mesh.elements.coordinate_transformation.vectorized
+        orthogonal = all([isinstance(self.mesh.elements[i].type_wrt_metric.mark, str) and
+                          self.mesh.elements[i].type_wrt_metric.mark[:4] == 'Orth' for i in elements])
+        J = CT.Jacobian_matrix(*xietasigma, elements=elements)
+        sqrtg = CT.Jacobian(*xietasigma, J=J)
+        iJ = CT.inverse_Jacobian_matrix(*xietasigma, elements=elements, J=J)
+        g = CT.inverse_metric_matrix(*xietasigma, iJ=iJ)
+        del J, iJ
+
+        # the co-factors of g: G[a][b] is the metric coefficient of block (a, b).
+        G = [[None for _ in range(3)] for __ in range(3)]
+        G[0][0] = g[1][1]*g[2][2] - g[1][2]*g[2][1]
+        G[1][1] = g[2][2]*g[0][0] - g[2][0]*g[0][2]
+        G[2][2] = g[0][0]*g[1][1] - g[0][1]*g[1][0]
+        if not orthogonal:
+            G[0][1] = G[1][0] = g[1][2] * g[2][0] - g[1][0] * g[2][2]
+            G[0][2] = G[2][0] = g[1][0] * g[2][1] - g[1][1] * g[2][0]
+            G[1][2] = G[2][1] = g[2][0] * g[0][1] - g[2][1] * g[0][0]
+
+        rO = np.cumsum([0,] + [_.shape[0] for _ in bfOther])
+        rS = np.cumsum([0,] + [_.shape[0] for _ in bfSelf])
+        M = np.zeros((len(elements), rO[-1], rS[-1]))
+        for a in range(3):
+            for b in range(3):
+                if a != b and orthogonal:
+                    continue
+                elif a > b and other is self:
+                    M[:, rO[a]:rO[a+1], rS[b]:rS[b+1]] = \
+                        M[:, rO[b]:rO[b+1], rS[a]:rS[a+1]].transpose((0, 2, 1))
+                else:
+                    M[:, rO[a]:rO[a+1], rS[b]:rS[b+1]] = \
+                        self.___PRIVATE_inner_H1_batched___(quad_weights, sqrtg, G[a][b], bfOther[a], bfSelf[b])
+        return M
+
+    @staticmethod
+    def ___PRIVATE_inner_H1_batched___(quad_weights, sqrt_g, g, bfO, bfS):
+        return np.einsum('em, im, jm -> eij', quad_weights * sqrt_g * g, bfO, bfS, optimize='optimal')
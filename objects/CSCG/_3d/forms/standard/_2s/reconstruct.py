@@ -51,12 +51,69 @@ class _3dCSCG_SF2_reconstruct(FrozenOnly):
 
             INDICES = list()
             for i in mesh.elements.indices:
-                ri = mesh.do.FIND_region_name_of_element(i)
+                ri = mesh.do.find.region_name_of_element(i)
                 if ri in regions:
                     INDICES.append(i)
         #------------ vectorized -----------------------------------------------------------------
         if vectorized:
-            raise NotImplementedError()
+
+            assert INDICES == mesh.elements.indices, f"currently, vectorized computation only works" \
+                                                          f"for full reconstruction."
+
+            xietasigma, basis = f.do.evaluate_basis_at_meshgrid(xi, eta, sigma)
+
+            if len(INDICES) > 0:
+                # entries are of shape (num_local_elements, num_points), or (num_points,) or scalars
+                # when all elements are of the same type w.r.t. metric; they broadcast in the same way.
+                iJ = mesh.elements.coordinate_transformation.vectorized.inverse_Jacobian_matrix(*xietasigma)
+
+                numOfBasisComponents = f.num.basis_components
+                Arr = f.cochain.array
+                ArrX = Arr[:, :numOfBasisComponents[0]]
+                ArrY = Arr[:, numOfBasisComponents[0]:numOfBasisComponents[0]+numOfBasisComponents[1]]
+                ArrZ = Arr[:, -numOfBasisComponents[2]:]
+
+                u = np.einsum('ij, ki -> kj', basis[0], ArrX, optimize='greedy')
+                v = np.einsum('ij, ki -> kj', basis[1], ArrY, optimize='greedy')
+                w = np.einsum('ij, ki -> kj', basis[2], ArrZ, optimize='greedy')
+
+                if mesh.elements.IS.all_orthogonal:
+                    vx = u * (iJ[1][1] * iJ[2][2])
+                    vy = v * (iJ[2][2] * iJ[0][0])
+                    vz = w * (iJ[0][0] * iJ[1][1])
+                else:
+                    vx = u * (iJ[1][1] * iJ[2][2] - iJ[1][2] * iJ[2][1]) + \
+                         v * (iJ[2][1] * iJ[0][2] - iJ[2][2] * iJ[0][1]) + \
+                         w * (iJ[0][1] * iJ[1][2] - iJ[0][2] * iJ[1][1])
+                    vy = u * (iJ[1][2] * iJ[2][0] - iJ[1][0] * iJ[2][2]) + \
+                         v * (iJ[2][2] * iJ[0][0] - iJ[2][0] * iJ[0][2]) + \
+                         w * (iJ[0][2] * iJ[1][0] - iJ[0][0] * iJ[1][2])
+                    vz = u * (iJ[1][0] * iJ[2][1] - iJ[1][1] * iJ[2][0]) + \
+                         v * (iJ[2][0] * iJ[0][1] - iJ[2][1] * iJ[0][0]) + \
+                         w * (iJ[0][0] * iJ[1][1] - iJ[0][1] * iJ[1][0])
+
+                if not value_only:
+                    xyz = mesh.elements.coordinate_transformation.vectorized.mapping(*xietasigma)
+
+            else:
+                vx, vy, vz = None, None, None
+                xyz = (None, None, None)
+
+            value = (vx, vy, vz)
+            if ravel or len(INDICES) == 0:
+                pass
+            else:
+                shape = [len(INDICES), len(sigma), len(eta), len(xi)] # the local meshgrid is in Fortran order.
+                value = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in value])
+                if not value_only:
+                    # noinspection PyUnboundLocalVariable
+                    xyz = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in xyz])
+
+            if value_only:
+                return value
+            else:
+                # noinspection PyUnboundLocalVariable
+                return xyz, value
 
         # ------- non-vectorized -----------------------------------------------------------------
         else:
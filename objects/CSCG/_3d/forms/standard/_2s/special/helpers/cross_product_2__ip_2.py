@@ -2,6 +2,7 @@
 import numpy as np
 from scipy import sparse as spspa
 from screws.freeze.base import FrozenOnly
+from screws.decorators.memoize.memoize_6 import BoundedCache
 
 
 class ___3dCSCG_2Form_CrossProduct_2__ip_2___(FrozenOnly):
@@ -14,8 +15,15 @@ class ___3dCSCG_2Form_CrossProduct_2__ip_2___(FrozenOnly):
     :param b:
     :param e:
     :param quad_degree:
+    :param tensor: If True, for each type of mesh elements (w.r.t. metric), we compute the
+        third-order tensor ``T[e_dof, a_dof, b_dof]`` once. Then the matrices of all elements of
+        a type are one ``tensordot`` of ``T`` and the stacked local cochains of `a`. Since the
+        geometry does not change, this is much cheaper in a nonlinear (Picard/Newton) loop where
+        only the cochain of `a` changes. Call ``DO_reset_cache`` when the mesh changes.
+    :param cache_max_bytes: The memory budget of the cached tensors and batches of matrices. The
+        elements of a type are batched in chunks of at most half of the budget.
     """
-    def __init__(self, a, b, e, quad_degree=None):
+    def __init__(self, a, b, e, quad_degree=None, tensor=False, cache_max_bytes=2**28):
         assert a.ndim == b.ndim == e.ndim, " <___3dCSCG_2Form_CrossProduct_2__ip_2___> "
         assert a.k == b.k == e.k == 2, " <___3dCSCG_2Form_CrossProduct_2__ip_2___> "
         assert a.mesh == b.mesh, "___3dCSCG_2Form_CrossProduct_2__ip_2___, Meshes do not match."
@@ -41,12 +49,16 @@ class ___3dCSCG_2Form_CrossProduct_2__ip_2___(FrozenOnly):
         self._iJ_    = self._mesh_.elements.coordinate_transformation.inverse_Jacobian_matrix(*xietasigma, J=self._JM_)
         self._g_     = self._mesh_.elements.coordinate_transformation.inverse_metric_matrix(*xietasigma, iJ=self._iJ_)
 
+        self._tensor_ = tensor
+        self._T_cache_ = BoundedCache(max_bytes=cache_max_bytes, name='cross product tensor')
         self.DO_reset_cache()
         self._freeze_self_()
 
     def DO_reset_cache(self):
         self._J_cache_ = dict()
         self._G_cache_ = dict()
+        self._T_cache_.clear()
+        self._groups_ = None
 
     def _J_(self, i):
         element = self._mesh_.elements[i]
@@ -114,9 +126,79 @@ class ___3dCSCG_2Form_CrossProduct_2__ip_2___(FrozenOnly):
             self._G_cache_[typeWr2Metric] = G
             return G
 
+    def _T_(self, i):
+        """The third-order tensor ``T[e_dof, a_dof, b_dof]`` of the type of mesh element #i. Only
+        for orthogonal types."""
+        typeWr2Metric = self._mesh_.elements[i].type_wrt_metric.mark
+        found, T = self._T_cache_.get(typeWr2Metric)
+        if found:
+            return T
+
+        a0, a1, a2 =  self._abf_
+        b0, b1, b2 =  self._bbf_
+        e0, e1, e2 =  self._ebf_
+        J00, J01, J02, J10, J11, J12, J20, J21, J22 = self._J_(i)
+        G00, G01, G02, G10, G11, G12, G20, G21, G22 = self._G_(i)
+
+        # the coefficients of the (e, a, b) blocks; see the `Orth` branch of `__call__`.
+        BLOCKS = {(0, 2, 1): - J11 * J22 * G00, (0, 1, 2): + J11 * J22 * G00,
+                  (1, 2, 0): + J00 * J22 * G11, (1, 0, 2): - J00 * J22 * G11,
+                  (2, 1, 0): - J00 * J11 * G22, (2, 0, 1): + J00 * J11 * G22}
+        E, A, B = (e0, e1, e2), (a0, a1, a2), (b0, b1, b2)
+        eS, aS, bS = [np.cumsum([0,] + [_.shape[0] for _ in bf]) for bf in (E, A, B)]
+
+        T = np.zeros((eS[-1], aS[-1], bS[-1]))
+        for (m, k, n) in BLOCKS:
+            T[eS[m]:eS[m+1], aS[k]:aS[k+1], bS[n]:bS[n+1]] = np.einsum(
+                'iw, kw, jw, w -> ikj', E[m], A[k], B[n], BLOCKS[(m, k, n)] * self._qw_, optimize='greedy')
+
+        self._T_cache_.put(typeWr2Metric, T)
+        return T
+
+    def ___PRIVATE_chunk___(self, i):
+        """The chunk of local mesh elements (of the type of mesh element #i) that is batched with
+        mesh element #i.
+
+        :return: A tuple of two outputs: the cache key of the batch and the elements of the chunk.
+        """
+        if self._groups_ is None:
+            self._groups_ = dict()
+            for j in self._mesh_.elements:
+                mark = self._mesh_.elements[j].type_wrt_metric.mark
+                if mark not in self._groups_: self._groups_[mark] = (list(), dict())
+                elements, positions = self._groups_[mark]
+                positions[j] = len(elements)
+                elements.append(j)
+        typeWr2Metric = self._mesh_.elements[i].type_wrt_metric.mark
+        elements, positions = self._groups_[typeWr2Metric]
+        e_num = sum([_.shape[0] for _ in self._ebf_])
+        b_num = sum([_.shape[0] for _ in self._bbf_])
+        size = max(1, int(self._T_cache_.max_bytes // (2 * 8 * e_num * b_num)))
+        k = positions[i] // size
+        return ('batch', typeWr2Metric, k), elements[k * size : (k + 1) * size]
+
+    def ___PRIVATE_batch___(self, key, elements):
+        """Compute the matrices of a chunk of local mesh elements of a type with one
+        ``tensordot``. The batch is cached together with the tensors, so under the same budget."""
+        A = np.array([self._a_.cochain.local[j] for j in elements])
+        M = np.tensordot(A, self._T_(elements[0]), axes=([1], [1]))
+        batch = (dict(zip(elements, range(len(elements)))), A, M)
+        self._T_cache_.put(key, batch)
+        return batch
+
     def __call__(self, i):
         typeWr2Metric = self._mesh_.elements[i].type_wrt_metric.mark
 
+        if self._tensor_ and isinstance(typeWr2Metric, str) and typeWr2Metric[:4] == 'Orth':
+            # the batch is computed again once the cochain of `a` has changed.
+            ai = self._a_.cochain.local[i]
+            key, elements = self.___PRIVATE_chunk___(i)
+            found, batch = self._T_cache_.get(key)
+            if not found or not np.array_equal(batch[1][batch[0][i]], ai):
+                batch = self.___PRIVATE_batch___(key, elements)
+            INDEX, A, M = batch
+            return spspa.csc_matrix(M[INDEX[i]])
+
         a0, a1, a2 =  self._abf_ # a; given
         b0, b1, b2 =  self._bbf_ # b
         e0, e1, e2 =  self._ebf_ # epsilon
@@ -21,7 +21,7 @@ class _2Form_Special(FrozenOnly):
         self._vortex_detection_ = None
         self._freeze_self_()
 
-    def cross_product_2f__ip_2f(self, u, e, quad_degree=None):
+    def cross_product_2f__ip_2f(self, u, e, quad_degree=None, tensor=False, cache_max_bytes=2**28):
         """
         (self X 2form, 2form)
 
@@ -29,9 +29,17 @@ class _2Form_Special(FrozenOnly):
 
         We do ``(self X other, e)`` where ``self`` and ``other`` both are n-form, n be either 1 or 2.
 
+        :param u:
+        :param e:
+        :param quad_degree:
+        :param tensor: If True, use precomputed (per type of mesh elements) third-order tensors;
+            good when we make the matrix many times with changing cochain of ``self``, see
+            ``___3dCSCG_2Form_CrossProduct_2__ip_2___``.
+        :param cache_max_bytes: The memory budget of the tensors (and batches of matrices).
         :return:
         """
-        SCP_generator = ___3dCSCG_2Form_CrossProduct_2__ip_2___(self._sf_, u, e, quad_degree=quad_degree)
+        SCP_generator = ___3dCSCG_2Form_CrossProduct_2__ip_2___(
+            self._sf_, u, e, quad_degree=quad_degree, tensor=tensor, cache_max_bytes=cache_max_bytes)
         return EWC_SparseMatrix(self._sf_.mesh.elements, SCP_generator, 'no_cache')
 
     @property
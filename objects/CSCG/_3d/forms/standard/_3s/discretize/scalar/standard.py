@@ -10,13 +10,19 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         self.___DISCRETIZE_STANDARD_CACHE___ = None
         self._freeze_self_()
 
-    def __call__(self, update_cochain:bool=True, quad_degree=None):
+    def __call__(self, update_cochain:bool=True, quad_degree=None, batch=False):
         """
         The return cochain is 'locally full local cochain', which means it is mesh-element-wise
         local cochain. So:
 
         cochainLocal is a dict, whose keys are mesh element numbers, and values (1-d arrays) are
         the local cochains.
+
+        :param update_cochain:
+        :param quad_degree:
+        :param batch: If True, we evaluate the mapping (and the Jacobian) of all local elements
+            together and call the function only once on the stacked coordinates. The function must
+            accept ndarrays of any shape.
         """
         SELF = self._sf_
 
@@ -54,21 +60,32 @@ class _3dCSCG_Discretize_Standard(FrozenOnly):
         cochainLocal = dict()
         f = SELF.func.body[0]
         JC = dict()
-        for i in SELF.mesh.elements.indices:
-            element = SELF.mesh.elements[i]
-            typeWr2Metric = element.type_wrt_metric.mark
-            xyz = element.coordinate_transformation.mapping(xi, et, si)
-            if typeWr2Metric in JC:
-                detJ = JC[typeWr2Metric]
-            else:
-                detJ = element.coordinate_transformation.Jacobian(xi, et, si)
-                if isinstance(typeWr2Metric, str):
-                    JC[typeWr2Metric] = detJ
-            fxyz = f(*xyz)
-            cochainLocal[i] = np.einsum('jklm, k, l, m, j -> j',
-                fxyz*detJ, quad_weights[0], quad_weights[1], quad_weights[2],
-                volume, optimize='greedy'
-            )
+        if batch:
+            if len(SELF.mesh.elements) > 0:
+                VEC = SELF.mesh.elements.coordinate_transformation.vectorized
+                xyz = VEC.mapping(xi, et, si)
+                detJ = VEC.Jacobian(xi, et, si, J=VEC.Jacobian_matrix(xi, et, si))
+                LOCAL = np.einsum('ejklm, k, l, m, j -> ej',
+                    f(*xyz)*detJ, quad_weights[0], quad_weights[1], quad_weights[2],
+                    volume, optimize='greedy'
+                )
+                cochainLocal = dict(zip(SELF.mesh.elements.indices, LOCAL))
+        else:
+            for i in SELF.mesh.elements.indices:
+                element = SELF.mesh.elements[i]
+                typeWr2Metric = element.type_wrt_metric.mark
+                xyz = element.coordinate_transformation.mapping(xi, et, si)
+                if typeWr2Metric in JC:
+                    detJ = JC[typeWr2Metric]
+                else:
+                    detJ = element.coordinate_transformation.Jacobian(xi, et, si)
+                    if isinstance(typeWr2Metric, str):
+                        JC[typeWr2Metric] = detJ
+                fxyz = f(*xyz)
+                cochainLocal[i] = np.einsum('jklm, k, l, m, j -> j',
+                    fxyz*detJ, quad_weights[0], quad_weights[1], quad_weights[2],
+                    volume, optimize='greedy'
+                )
         # isKronecker? ...
         if not SELF.space.IS_Kronecker: raise NotImplementedError()
         # pass to cochain.local ...
@@ -58,6 +58,18 @@ class _3dCSCG_S3F_Private:
         Mi = csc_matrix(Mi)
         return Mi
 
+    def ___PRIVATE_operator_inner_batched___(self, _, elements, xietasigma, quad_weights, bfSelf, bfOther):
+        """The batched version of ``___PRIVATE_operator_inner___``: we compute the local matrices
+        of all `elements` together and return them as a 3d ndarray whose first index refers to
+        `elements`.
+        """
+        detJ = self.mesh.elements.coordinate_transformation.vectorized.Jacobian(*xietasigma, elements=elements)
+        M = np.einsum('im, jm, em -> eij',
+            bfOther[0], bfSelf[0], np.reciprocal(detJ)*quad_weights,
+            optimize='greedy'
+        )
+        return M
+
     def ___PRIVATE_operator_wedge___(self, other, quad_degree=None):
         """In fact, it is integral over wedge product."""
         assert other.__class__.__name__ == '_0Form', "Need a _3dCSCG_0Form"
@@ -69,7 +69,7 @@ class _3dCSCG_SF3_Reconstruct(FrozenOnly):
 
             INDICES = list()
             for i in mesh.elements.indices:
-                ri = mesh.do.FIND_region_name_of_element(i)
+                ri = mesh.do.find.region_name_of_element(i)
                 if ri in regions:
                     INDICES.append(i)
 
@@ -91,18 +91,28 @@ class _3dCSCG_SF3_Reconstruct(FrozenOnly):
 
                     v = np.einsum('ij, ki, kj -> kj', basis[0], f.cochain.array, det_iJ, optimize='greedy')
 
+                value = (v,)
+                if not value_only:
+                    xyz = mesh.elements.coordinate_transformation.vectorized.mapping(*xietasigma)
+
             else:
-                v = None
+                value = (None,)
+                xyz = (None, None, None)
 
-            if ravel:
+            if ravel or len(INDICES) == 0:
                 pass
             else:
-                raise NotImplementedError()
+                shape = [len(INDICES), len(sigma), len(eta), len(xi)] # the local meshgrid is in Fortran order.
+                value = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in value])
+                if not value_only:
+                    # noinspection PyUnboundLocalVariable
+                    xyz = tuple([_.reshape(shape).transpose(0, 3, 2, 1) for _ in xyz])
 
             if value_only:
-                return v,
+                return value
             else:
-                raise Exception()
+                # noinspection PyUnboundLocalVariable
+                return xyz, value
 
         #-------- non-vectorized -------------------------------------------------------------------
         else:
@@ -1,6 +1,6 @@
 """We want to export the field to some data files.
 """
-
+import io
 from root.config.main import *
 from screws.freeze.main import FrozenOnly
 from screws.miscellaneous.timer import check_filename, check_no_splcharacter
@@ -18,12 +18,23 @@ class _3dCSC_SF_Export_Field(FrozenOnly):
         self._freeze_self_()
 
 
-    def to_file(self, filename, numOfSamples=1e6, regions=None):
-        """"""
+    def to_file(self, filename, numOfSamples=1e6, regions=None, layout='structured'):
+        """
+        :param filename:
+        :param numOfSamples:
+        :param regions:
+        :param layout: Only for the `.npy` format which is written by all cores together (no data are
+            gathered in the master core). It can be
+
+            - 'structured': for each region, an array of shape (#components, X, Y, Z), where the
+                components are x, y, z, and the values. Same as the data of the `.mat` format.
+            - 'point-cloud': one array of shape (#points, #components) for all regions.
+        :return:
+        """
         filename, extension = check_filename(filename)
         if extension is None: extension = 'txt'
 
-        supported_formats = ('txt', 'mat')
+        supported_formats = ('txt', 'mat', 'npy')
         assert extension in supported_formats, \
             f"format={extension} is not among the supported formats {supported_formats}."
 
@@ -57,6 +68,10 @@ class _3dCSC_SF_Export_Field(FrozenOnly):
 
         xyz, v = self._sf_.reconstruct(*rst, regions=regions)
 
+        if extension == 'npy':
+            self.___PRIVATE_to_npy_files___(filename, xyz, v, regions, layout)
+            return
+
         # Now, we gather xyz & v from all cores into Master Core, store in XYZ & V --- BELOW ---
         if rAnk == mAster_rank:
             X = [None for _ in range(mesh.elements.GLOBAL_num)]
@@ -161,4 +176,93 @@ class _3dCSC_SF_Export_Field(FrozenOnly):
                     savemat(FILE_NAME, m_dic)
 
                 else:
-                    raise Exception(f"Format=.{extension} is not supported.")
\ No newline at end of file
+                    raise Exception(f"Format=.{extension} is not supported.")
+
+    def ___PRIVATE_to_npy_files___(self, filename, xyz, v, regions, layout):
+        """Each core writes its own data into the `.npy` files."""
+        mesh = self._sf_.mesh
+        suffix = '__x_y_z_vx_vy_vz' if self._sf_.k in (1, 2) else '__x_y_z_v'
+        elements = sorted(xyz.keys())
+
+        if layout == 'point-cloud':
+            local_data = [np.column_stack([_.ravel('F') for _ in tuple(xyz[i]) + tuple(v[i])]) for i in elements]
+            num_components = 6 if self._sf_.k in (1, 2) else 4
+            local_data = np.concatenate(local_data) if len(local_data) > 0 else np.zeros((0, num_components))
+            num_points = cOmm.allreduce(local_data.shape[0], op=MPI.SUM)
+            self.___PRIVATE_write_npy___(filename + suffix + '.npy', (num_points, num_components),
+                                         local_data.ravel())
+
+        elif layout == 'structured':
+            for rn in regions:
+                RN = rn[2:]
+                assert check_no_splcharacter(RN), f"region name={RN} wrong."
+                local_data = list()
+                displacements = list()
+                shape = None
+                for i in elements:
+                    region, (I, J, K) = mesh.do.find.region_name_and_local_indices_of_element(i)
+                    if region != rn: continue
+                    data = np.array(tuple(xyz[i]) + tuple(v[i])) # (#components, nx, ny, nz)
+                    c, nx, ny, nz = data.shape
+                    if shape is None:
+                        shape = (c,) + tuple([n * L for n, L in zip((nx, ny, nz), mesh._element_layout_[rn])])
+                    INDICES = np.meshgrid(np.arange(c), I * nx + np.arange(nx), J * ny + np.arange(ny),
+                                          K * nz + np.arange(nz), indexing='ij')
+                    local_data.append(data.ravel())
+                    displacements.append(np.ravel_multi_index(INDICES, shape).ravel())
+                SHAPE = [_ for _ in cOmm.allgather(shape) if _ is not None]
+                shape = SHAPE[0]
+                if len(local_data) > 0:
+                    local_data = np.concatenate(local_data)
+                    displacements = np.concatenate(displacements)
+                else:
+                    local_data = np.zeros(0)
+                    displacements = np.zeros(0, dtype=int)
+                self.___PRIVATE_write_npy___(filename + '__InRegion_' + RN + suffix + '.npy', shape,
+                                             local_data, displacements=displacements)
+
+        else:
+            raise Exception(f"layout={layout} is wrong, must be 'structured' or 'point-cloud'.")
+
+    @staticmethod
+    def ___PRIVATE_write_npy___(FILE_NAME, shape, local_data, displacements=None):
+        """Write a `.npy` file (float64, C order) of `shape` with all cores (MPI-IO).
+
+        :param FILE_NAME:
+        :param shape: The shape of the whole array.
+        :param local_data: A 1d array; the local part of the (raveled) array.
+        :param displacements: If it is None, the local parts of all cores are consecutive chunks (in
+            the sequence of cores). Otherwise, a 1d int array; `local_data[j]` will be at
+            `displacements[j]` of the raveled array.
+        """
+        header = io.BytesIO()
+        np.lib.format.write_array_header_1_0(
+            header, {'descr': np.lib.format.dtype_to_descr(np.dtype('float64')),
+                     'fortran_order': False, 'shape': tuple([int(_) for _ in shape])})
+        header = header.getvalue()
+
+        local_data = np.ascontiguousarray(local_data, dtype='float64')
+        fh = MPI.File.Open(cOmm, FILE_NAME, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+        fh.Set_size(0)
+        if rAnk == mAster_rank:
+            fh.Write_at(0, header)
+
+        if displacements is None:
+            offset = cOmm.exscan(len(local_data), op=MPI.SUM)
+            if offset is None: offset = 0 # in core #0
+            fh.Write_at_all(len(header) + offset * local_data.itemsize, local_data)
+        else:
+            order = np.argsort(displacements, kind='stable')
+            displacements = displacements[order]
+            local_data = local_data[order]
+            # group the consecutive displacements into blocks.
+            starts = np.concatenate([[0], np.flatnonzero(np.diff(displacements) != 1) + 1]) \
+                if len(displacements) > 0 else np.zeros(0, dtype=int)
+            lengths = np.diff(np.append(starts, len(displacements)))
+            filetype = MPI.DOUBLE.Create_indexed(lengths.tolist(), displacements[starts].tolist())
+            filetype.Commit()
+            fh.Set_view(len(header), MPI.DOUBLE, filetype)
+            fh.Write_all(local_data)
+            filetype.Free()
+
+        fh.Close()
@@ -109,9 +109,20 @@ class _3dCSCG_Standard_Form_Numbering_Naive(FrozenOnly):
 
 
 
-    def _2Form_no_parameters(self):
-        """Do the numbering if it is a standard 2-form:
-        :class:`_3dCSCG.form.standard._2_form._2Form`.
+    def ___PRIVATE_distributed_numbering___(self):
+        """Do the numbering of a non-hybrid standard 0-, 1- or 2-form without the master core.
+
+        Each dof is labelled by ``k * numOfBasis + j`` where ``k`` is the smallest mesh element
+        sharing it and ``j`` is its local numbering in element #k. To find the labels, we take the
+        minimum over element sides: first over the sides in this core until nothing changes, then
+        over the sides on the interfaces with the neighbouring cores (only the labels on these
+        sides are exchanged). We repeat it until no label changes in any core.
+
+        A dof is owned by the core of the element of its label. All cores number their owned dofs
+        independently, element by element, after an offset (an exclusive scan of the amounts
+        of owned dofs). The numbers of other dofs are asked from their owners. When the elements are
+        distributed in cores in order, it gives the same numbering as numbering the elements one by
+        one.
 
         :returns: A tuple of 3 outputs:
 
@@ -119,20 +130,6 @@ class _3dCSCG_Standard_Form_Numbering_Naive(FrozenOnly):
             2. (int) -- Number of dofs in this core.
             3. (None,...)-- Extra numbering information.
         """
-        gathering_matrix = dict()
-        element_num = self._sf_.mesh.elements.num
-        numOfBasis = self._sf_.num.basis
-        extraInfo = None
-        if self._sf_.IS.hybrid:
-            for i in self._sf_.mesh.elements:
-                gathering_matrix[i] = Gathering_Vector(i, range(i * numOfBasis, (i + 1) * numOfBasis))
-            gathering_matrix = Gathering_Matrix(gathering_matrix, mesh_type='_3dCSCG')
-            numOfDofs = numOfBasis * element_num
-            return gathering_matrix, numOfDofs, extraInfo
-
-        global_numbering = None
-        # non-hybrid numbering ...
-
         mesh = self._sf_.mesh
         if mesh.domain.IS.periodic:
             if rAnk == mAster_rank:
@@ -145,120 +142,113 @@ class _3dCSCG_Standard_Form_Numbering_Naive(FrozenOnly):
                             f" elements.layout[{rn}]={regionElementLayout} wrong," \
                             f" needs (>1, >1, >1) to make it work for periodic domain."
 
-        if rAnk != mAster_rank:
-            element_map = mesh.elements.map
-            element_indices = mesh.elements.indices
-            cOmm.send([element_map, element_indices], dest=mAster_rank, tag=rAnk)
-            global_numbering = cOmm.recv(source=mAster_rank, tag=rAnk)
-        else:
-            p = self._sf_.p
-            numOfBasisComponents = self._sf_.num.basis_components
-            numberingCache = dict()
-            currentNumber = 0
-            other_side_name = 'SNEWFB' # not an error, this is other side name.
-            sidePairDict = {'N':'S', 'S':'N', 'W':'E', 'E':'W', 'B':'F', 'F':'B'}
-            for i in range(sIze):
-                if i == mAster_rank:
-                    element_map = mesh.elements.map
-                    element_indices = mesh.elements.indices
-                else:
-                    element_map, element_indices = cOmm.recv(source=i, tag=i)
-                for k in element_indices:
-                    if k == 0:
-                        assert numberingCache == dict(), "We make sure #0 element is numbered firstly."
-                        nC0 = np.arange(currentNumber, currentNumber+numOfBasisComponents[0]).reshape(
-                            (p[0]+1, p[1], p[2]), order='F')
-                        currentNumber += numOfBasisComponents[0]
-                        nC1 = np.arange(currentNumber, currentNumber+numOfBasisComponents[1]).reshape(
-                            (p[0], p[1]+1, p[2]), order='F')
-                        currentNumber += numOfBasisComponents[1]
-                        nC2 = np.arange(currentNumber, currentNumber+numOfBasisComponents[2]).reshape(
-                            (p[0], p[1], p[2]+1), order='F')
-                        currentNumber += numOfBasisComponents[2]
-                        numberingCache[0] = [nC0, nC1, nC2]
-                        del nC0, nC1, nC2
-                    else:
-                        notNumberedPlaces0 = numberingCache[k][0] == -1
-                        notNumberedPlaces1 = numberingCache[k][1] == -1
-                        notNumberedPlaces2 = numberingCache[k][2] == -1
-                        howManyNotNumbered0 = len(numberingCache[k][0][notNumberedPlaces0])
-                        howManyNotNumbered1 = len(numberingCache[k][1][notNumberedPlaces1])
-                        howManyNotNumbered2 = len(numberingCache[k][2][notNumberedPlaces2])
-                        # assert howManyNotNumbered < numOfBasis, "We make sure at least a part is numbered!"
-                        if howManyNotNumbered0 > 0:
-                            numberingCache[k][0][notNumberedPlaces0] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered0
-                            )
-                            currentNumber += howManyNotNumbered0
-                        if howManyNotNumbered1 > 0:
-                            numberingCache[k][1][notNumberedPlaces1] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered1
-                            )
-                            currentNumber += howManyNotNumbered1
-                        if howManyNotNumbered2 > 0:
-                            numberingCache[k][2][notNumberedPlaces2] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered2
-                            )
-                            currentNumber += howManyNotNumbered2
-
-                    for j, EMki in enumerate(element_map[k]):
-                        if isinstance(EMki, str): # on domain boundary
-                            pass
-                        else:
-                            otherElement = EMki
-                            otherSide = other_side_name[j]
-                            if otherElement not in numberingCache and otherElement > k:
-                                numberingCache[otherElement] = [-np.ones((p[0]+1, p[1], p[2]), dtype=int),
-                                                                -np.ones((p[0], p[1]+1, p[2]), dtype=int),
-                                                                -np.ones((p[0], p[1], p[2]+1), dtype=int)]
-                            if otherElement > k:
-                                self.___PRIVATE_for_2Form_pass_element_side_numbering_from_to___(
-                                    k, sidePairDict[otherSide], otherElement, otherSide, numberingCache
-                                )
-                toBeSentAway = dict()
-                for k in element_indices: toBeSentAway[k] = numberingCache[k]
-                if i == mAster_rank:
-                    global_numbering = toBeSentAway
+        numOfBasis = self._sf_.num.basis
+        element_map = mesh.elements.map
+        elements = np.array(sorted(mesh.elements.indices), dtype=int)
+        positions = dict(zip(elements, range(len(elements))))
+        side_names = 'NSWEBF'
+        other_side_name = 'SNEWFB' # not an error, this is other side name.
+        SIDES = dict()
+        for side in side_names:
+            SIDES[side] = np.array(self._sf_.numbering.do.find.local_dofs_on_element_side(side), dtype=int)
+
+        # ----- pairs of dofs on the element sides: inside this core and on the core interfaces -----
+        I, J = list(), list()
+        interfaces = [list() for _ in range(sIze)]
+        slaves = dict()
+        for k in elements:
+            for j, EMkj in enumerate(element_map[k]):
+                if isinstance(EMkj, str): # on domain boundary
+                    continue
+                here, there = (k, side_names[j]), (EMkj, other_side_name[j])
+                dofs = positions[k] * numOfBasis + SIDES[here[1]]
+                if EMkj in positions:
+                    if here < there: # each side once.
+                        I.append(dofs)
+                        J.append(positions[EMkj] * numOfBasis + SIDES[there[1]])
                 else:
-                    cOmm.send(toBeSentAway, dest=i, tag=i)
-                for k in element_indices: del numberingCache[k]
+                    if EMkj not in slaves:
+                        slaves[EMkj] = mesh.do.find.slave_of_element(EMkj)
+                    interfaces[slaves[EMkj]].append((min(here, there), max(here, there), dofs))
+        I = np.concatenate(I) if len(I) > 0 else np.zeros(0, dtype=int)
+        J = np.concatenate(J) if len(J) > 0 else np.zeros(0, dtype=int)
+        # both cores of an interface sort its sides in the same way, so the dofs match.
+        for core in range(sIze):
+            sides = sorted(interfaces[core], key=lambda _: _[:2])
+            interfaces[core] = np.concatenate([_[2] for _ in sides]) if len(sides) > 0 \
+                else np.zeros(0, dtype=int)
+
+        # ----- find the labels --------------------------------------------------------------------
+        INITIAL = (elements[:, np.newaxis] * numOfBasis + np.arange(numOfBasis)).ravel()
+        LABELS = INITIAL.copy()
+        while True:
+            while len(I) > 0:
+                m = np.minimum(LABELS[I], LABELS[J])
+                if np.array_equal(LABELS[I], m) and np.array_equal(LABELS[J], m): break
+                np.minimum.at(LABELS, I, m)
+                np.minimum.at(LABELS, J, m)
+            received = cOmm.alltoall([LABELS[dofs] for dofs in interfaces])
+            before = LABELS.copy()
+            for dofs, labels in zip(interfaces, received):
+                np.minimum.at(LABELS, dofs, labels)
+            if not cOmm.allreduce(not np.array_equal(before, LABELS), op=MPI.LOR):
+                break
+
+        # ----- number the owned dofs, then ask the numbers of other dofs from their owners ----------
+        owned = LABELS == INITIAL
+        num_owned = int(np.count_nonzero(owned))
+        offset = cOmm.exscan(num_owned)
+        if rAnk == 0 or offset is None: offset = 0
+        NUMBERS = -np.ones(len(LABELS), dtype=int)
+        # in an element, owned dofs are numbered component by component, each in C-order (except
+        # element #0, which is numbered in the local numbering), as numbering element by element.
+        C_ORDER = np.concatenate([_.ravel('C') for _ in self._sf_.numbering.local])
+        RANKING = np.empty(numOfBasis, dtype=int)
+        RANKING[C_ORDER] = np.arange(numOfBasis)
+        owned = np.flatnonzero(owned)
+        ranking = RANKING[owned % numOfBasis]
+        if len(elements) > 0 and elements[0] == 0:
+            ranking[:numOfBasis] = np.arange(numOfBasis) # all dofs of element #0 are owned.
+        owned = owned[np.argsort((owned // numOfBasis) * numOfBasis + ranking)]
+        NUMBERS[owned] = offset + np.arange(num_owned)
+
+        owner_elements = LABELS // numOfBasis
+        where = np.searchsorted(elements, owner_elements)
+        where[where == len(elements)] = 0
+        local = (elements[where] == owner_elements) & (NUMBERS == -1)
+        NUMBERS[local] = NUMBERS[where[local] * numOfBasis + LABELS[local] % numOfBasis]
+
+        remote = np.flatnonzero(NUMBERS == -1)
+        wanted = np.unique(LABELS[remote])
+        owner_elements = np.unique(wanted // numOfBasis)
+        cores = np.array([mesh.do.find.slave_of_element(e) for e in owner_elements], dtype=int)
+        cores = cores[np.searchsorted(owner_elements, wanted // numOfBasis)]
+        requests = cOmm.alltoall([wanted[cores == core] for core in range(sIze)])
+        answers = list()
+        for labels in requests:
+            answers.append(NUMBERS[np.searchsorted(elements, labels // numOfBasis) * numOfBasis +
+                                   labels % numOfBasis])
+        answers = cOmm.alltoall(answers)
+        numbers = np.empty(len(wanted), dtype=int)
+        for core in range(sIze):
+            numbers[cores == core] = answers[core]
+        NUMBERS[remote] = numbers[np.searchsorted(wanted, LABELS[remote])]
+        del LABELS, INITIAL
 
-        dofsPOOL = set()
-        for i in self._sf_.mesh.elements:
-            vector = np.concatenate([global_numbering[i][0].ravel('F'),
-                                     global_numbering[i][1].ravel('F'),
-                                     global_numbering[i][2].ravel('F')])
-            gathering_matrix[i] = Gathering_Vector(i, vector)
-            dofsPOOL.update(vector)
+        gathering_matrix = dict()
+        for i in mesh.elements:
+            start = positions[i] * numOfBasis
+            gathering_matrix[i] = Gathering_Vector(i, NUMBERS[start:start+numOfBasis])
         gathering_matrix = Gathering_Matrix(gathering_matrix, mesh_type='_3dCSCG')
-        numOfDofs = len(dofsPOOL)
-
-        return gathering_matrix, numOfDofs, extraInfo
+        numOfDofs = len(np.unique(NUMBERS))
 
-    @staticmethod
-    def ___PRIVATE_for_2Form_pass_element_side_numbering_from_to___(
-        fromElement, fromSide, toElement, toSide, numberingCache):
-        if fromSide == 'N'  : data = numberingCache[fromElement][0][0 , :, :]
-        elif fromSide == 'S': data = numberingCache[fromElement][0][-1, :, :]
-        elif fromSide == 'W': data = numberingCache[fromElement][1][ :, 0, :]
-        elif fromSide == 'E': data = numberingCache[fromElement][1][ :,-1, :]
-        elif fromSide == 'B': data = numberingCache[fromElement][2][ :, :, 0]
-        elif fromSide == 'F': data = numberingCache[fromElement][2][ :, :,-1]
-        else: raise Exception()
+        return gathering_matrix, numOfDofs, None
 
-        if toSide == 'N'  : numberingCache[toElement][0][ 0, :, :] = data
-        elif toSide == 'S': numberingCache[toElement][0][-1, :, :] = data
-        elif toSide == 'W': numberingCache[toElement][1][ :, 0, :] = data
-        elif toSide == 'E': numberingCache[toElement][1][ :,-1, :] = data
-        elif toSide == 'B': numberingCache[toElement][2][ :, :, 0] = data
-        elif toSide == 'F': numberingCache[toElement][2][ :, :,-1] = data
-        else: raise Exception()
 
 
-
-    def _1Form_no_parameters(self):
-        """Do the numbering if it is a standard 1-form:
-        :class:`_3dCSCG.form.standard._1_form._1Form`.
+    def _2Form_no_parameters(self):
+        """Do the numbering if it is a standard 2-form:
+        :class:`_3dCSCG.form.standard._2_form._2Form`.
 
         :returns: A tuple of 3 outputs:
 
@@ -277,157 +267,34 @@ class _3dCSCG_Standard_Form_Numbering_Naive(FrozenOnly):
             numOfDofs = numOfBasis * element_num
             return gathering_matrix, numOfDofs, extraInfo
 
-        global_numbering = None
         # non-hybrid numbering ...
-        mesh = self._sf_.mesh
-        if mesh.domain.IS.periodic:
-            if rAnk == mAster_rank:
-                baseElementLayout = mesh.elements.layout
-                for rn in baseElementLayout:
-                    region = mesh.domain.regions[rn]
-                    if region.IS.periodic_to_self:
-                        regionElementLayout = baseElementLayout[rn]
-                        assert all(np.array(regionElementLayout) > 1), \
-                            f" elements.layout[{rn}]={regionElementLayout} wrong," \
-                            f" needs (>1, >1, >1) to make it work for periodic domain."
+        return self.___PRIVATE_distributed_numbering___()
 
-        if rAnk != mAster_rank:
-            element_map = mesh.elements.map
-            element_indices = mesh.elements.indices
-            cOmm.send([element_map, element_indices], dest=mAster_rank, tag=rAnk)
-            global_numbering = cOmm.recv(source=mAster_rank, tag=rAnk)
 
-        else:
-            p = self._sf_.p
-            numOfBasisComponents = self._sf_.num.basis_components
-            numberingCache = dict()
-            currentNumber = 0
-            other_side_name = 'SNEWFB' # not an error, this is other side name.
-            sidePairDict = {'N':'S', 'S':'N', 'W':'E', 'E':'W', 'B':'F', 'F':'B'}
-
-            for i in range(sIze):
-                if i == mAster_rank:
-                    element_map = mesh.elements.map
-                    element_indices = mesh.elements.indices
-                else:
-                    element_map, element_indices = cOmm.recv(source=i, tag=i)
-                for k in element_indices:
-                    if k == 0:
-                        assert numberingCache == dict(), "We make sure #0 element is numbered firstly."
-                        nC0 = np.arange(currentNumber, currentNumber+numOfBasisComponents[0]).reshape(
-                            (p[0], p[1]+1, p[2]+1), order='F')
-                        currentNumber += numOfBasisComponents[0]
-                        nC1 = np.arange(currentNumber, currentNumber+numOfBasisComponents[1]).reshape(
-                            (p[0]+1, p[1], p[2]+1), order='F')
-                        currentNumber += numOfBasisComponents[1]
-                        nC2 = np.arange(currentNumber, currentNumber+numOfBasisComponents[2]).reshape(
-                            (p[0]+1, p[1]+1, p[2]), order='F')
-                        currentNumber += numOfBasisComponents[2]
-                        numberingCache[0] = [nC0, nC1, nC2]
-                        del nC0, nC1, nC2
-                    else:
-                        notNumberedPlaces0 = numberingCache[k][0] == -1
-                        notNumberedPlaces1 = numberingCache[k][1] == -1
-                        notNumberedPlaces2 = numberingCache[k][2] == -1
-                        howManyNotNumbered0 = len(numberingCache[k][0][notNumberedPlaces0])
-                        howManyNotNumbered1 = len(numberingCache[k][1][notNumberedPlaces1])
-                        howManyNotNumbered2 = len(numberingCache[k][2][notNumberedPlaces2])
-                        # assert howManyNotNumbered < numOfBasis, "We make sure at least a part is numbered!"
-                        if howManyNotNumbered0 > 0:
-                            numberingCache[k][0][notNumberedPlaces0] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered0
-                            )
-                            currentNumber += howManyNotNumbered0
-                        if howManyNotNumbered1 > 0:
-                            numberingCache[k][1][notNumberedPlaces1] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered1
-                            )
-                            currentNumber += howManyNotNumbered1
-                        if howManyNotNumbered2 > 0:
-                            numberingCache[k][2][notNumberedPlaces2] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered2
-                            )
-                            currentNumber += howManyNotNumbered2
-
-                    for j, EMki in enumerate(element_map[k]):
-                        if isinstance(EMki, str): # on domain boundary
-                            pass
-                        else:
-                            otherElement = EMki
-                            otherSide = other_side_name[j]
-                            if otherElement not in numberingCache and otherElement > k:
-                                numberingCache[otherElement] = [-np.ones((p[0], p[1]+1, p[2]+1), dtype=int),
-                                                                -np.ones((p[0]+1, p[1], p[2]+1), dtype=int),
-                                                                -np.ones((p[0]+1, p[1]+1, p[2]), dtype=int)]
-                            if otherElement > k:
-                                self.___PRIVATE_for_1Form_pass_element_side_numbering_from_to___(
-                                    k, sidePairDict[otherSide], otherElement, otherSide, numberingCache
-                                )
-                toBeSentAway = dict()
-                for k in element_indices: toBeSentAway[k] = numberingCache[k]
-                if i == mAster_rank:
-                    global_numbering = toBeSentAway
-                else:
-                    cOmm.send(toBeSentAway, dest=i, tag=i)
-                for k in element_indices: del numberingCache[k]
 
-        dofsPOOL = set()
-        for i in self._sf_.mesh.elements:
-            vector = np.concatenate([global_numbering[i][0].ravel('F'),
-                                     global_numbering[i][1].ravel('F'),
-                                     global_numbering[i][2].ravel('F')])
-            gathering_matrix[i] = Gathering_Vector(i, vector)
-            dofsPOOL.update(vector)
-        gathering_matrix = Gathering_Matrix(gathering_matrix, mesh_type='_3dCSCG')
-        numOfDofs = len(dofsPOOL)
+    def _1Form_no_parameters(self):
+        """Do the numbering if it is a standard 1-form:
+        :class:`_3dCSCG.form.standard._1_form._1Form`.
 
-        return gathering_matrix, numOfDofs, extraInfo
+        :returns: A tuple of 3 outputs:
+
+            1. (str) -- The global numbering in local elements.
+            2. (int) -- Number of dofs in this core.
+            3. (None,...)-- Extra numbering information.
+        """
+        gathering_matrix = dict()
+        element_num = self._sf_.mesh.elements.num
+        numOfBasis = self._sf_.num.basis
+        extraInfo = None
+        if self._sf_.IS.hybrid:
+            for i in self._sf_.mesh.elements:
+                gathering_matrix[i] = Gathering_Vector(i, range(i * numOfBasis, (i + 1) * numOfBasis))
+            gathering_matrix = Gathering_Matrix(gathering_matrix, mesh_type='_3dCSCG')
+            numOfDofs = numOfBasis * element_num
+            return gathering_matrix, numOfDofs, extraInfo
 
-    @staticmethod
-    def ___PRIVATE_for_1Form_pass_element_side_numbering_from_to___(
-        fromElement, fromSide, toElement, toSide, numberingCache):
-        """"""
-
-        data0, data1, data2 = None, None, None
-
-        if fromSide == 'N'  :
-            data1 = numberingCache[fromElement][1][0 , :, :]
-            data2 = numberingCache[fromElement][2][0 , :, :]
-        elif fromSide == 'S':
-            data1 = numberingCache[fromElement][1][-1, :, :]
-            data2 = numberingCache[fromElement][2][-1, :, :]
-        elif fromSide == 'W':
-            data0 = numberingCache[fromElement][0][ :, 0, :]
-            data2 = numberingCache[fromElement][2][ :, 0, :]
-        elif fromSide == 'E':
-            data0 = numberingCache[fromElement][0][ :,-1, :]
-            data2 = numberingCache[fromElement][2][ :,-1, :]
-        elif fromSide == 'B':
-            data0 = numberingCache[fromElement][0][ :, :, 0]
-            data1 = numberingCache[fromElement][1][ :, :, 0]
-        elif fromSide == 'F':
-            data0 = numberingCache[fromElement][0][ :, :,-1]
-            data1 = numberingCache[fromElement][1][ :, :,-1]
-        else: raise Exception()
-        if toSide == 'N'  :
-            numberingCache[toElement][1][ 0, :, :] = data1
-            numberingCache[toElement][2][ 0, :, :] = data2
-        elif toSide == 'S':
-            numberingCache[toElement][1][-1, :, :] = data1
-            numberingCache[toElement][2][-1, :, :] = data2
-        elif toSide == 'W':
-            numberingCache[toElement][0][ :, 0, :] = data0
-            numberingCache[toElement][2][ :, 0, :] = data2
-        elif toSide == 'E':
-            numberingCache[toElement][0][ :,-1, :] = data0
-            numberingCache[toElement][2][ :,-1, :] = data2
-        elif toSide == 'B':
-            numberingCache[toElement][0][ :, :, 0] = data0
-            numberingCache[toElement][1][ :, :, 0] = data1
-        elif toSide == 'F':
-            numberingCache[toElement][0][ :, :,-1] = data0
-            numberingCache[toElement][1][ :, :,-1] = data1
-        else: raise Exception()
+        # non-hybrid numbering ...
+        return self.___PRIVATE_distributed_numbering___()
 
 
 
@@ -452,103 +319,8 @@ class _3dCSCG_Standard_Form_Numbering_Naive(FrozenOnly):
             numOfDofs = numOfBasis * element_num
             return gathering_matrix, numOfDofs, extraInfo
 
-        global_numbering = None
         # non-hybrid numbering ...
-        mesh = self._sf_.mesh
-        if mesh.domain.IS.periodic:
-            if rAnk == mAster_rank:
-                baseElementLayout = mesh.elements.layout
-                for rn in baseElementLayout:
-                    region = mesh.domain.regions[rn]
-                    if region.IS.periodic_to_self:
-                        regionElementLayout = baseElementLayout[rn]
-                        assert all(np.array(regionElementLayout) > 1), \
-                            f" elements.layout[{rn}]={regionElementLayout} wrong," \
-                            f" needs (>1, >1, >1) to make it work for periodic domain."
-
-        if rAnk != mAster_rank:
-            element_map = mesh.elements.map
-            element_indices = mesh.elements.indices
-            cOmm.send([element_map, element_indices], dest=mAster_rank, tag=rAnk)
-            global_numbering = cOmm.recv(source=mAster_rank, tag=rAnk)
-        else:
-            p = self._sf_.p
-            p = (p[0]+1, p[1]+1, p[2]+1)
-            numberingCache = dict()
-            currentNumber = 0
-            other_side_name = 'SNEWFB' # not an error, this is other side name.
-            sidePairDict = {'N':'S', 'S':'N', 'W':'E', 'E':'W', 'B':'F', 'F':'B'}
-
-            for i in range(sIze):
-                if i == mAster_rank:
-                    element_map = mesh.elements.map
-                    element_indices = mesh.elements.indices
-                else:
-                    element_map, element_indices = cOmm.recv(source=i, tag=i)
-
-                for k in element_indices:
-                    if k == 0:
-                        assert numberingCache == dict(), "We make sure #0 element is numbered firstly."
-                        numberingCache[0] = np.arange(numOfBasis).reshape(p, order='F')
-                        currentNumber += numOfBasis
-                    else:
-                        notNumberedPlaces = numberingCache[k] == -1
-                        howManyNotNumbered = len(numberingCache[k][notNumberedPlaces])
-                        # assert howManyNotNumbered < numOfBasis, "We make sure at least a part is numbered!"
-                        if howManyNotNumbered > 0:
-                            numberingCache[k][notNumberedPlaces] = np.arange(
-                                currentNumber, currentNumber+howManyNotNumbered
-                            )
-                            currentNumber += howManyNotNumbered
-
-                    for j, EMki in enumerate(element_map[k]):
-                        if isinstance(EMki, str): # on domain boundary
-                            pass
-                        else:
-                            otherElement = EMki
-                            otherSide = other_side_name[j]
-                            if otherElement not in numberingCache and otherElement > k:
-                                numberingCache[otherElement] = -np.ones(p, dtype=int)
-                            if otherElement > k:
-                                self.___PRIVATE_for_0Form_pass_element_side_numbering_from_to___(
-                                    k, sidePairDict[otherSide], otherElement, otherSide, numberingCache
-                                )
-                toBeSentAway = dict()
-                for k in element_indices: toBeSentAway[k] = numberingCache[k]
-                if i == mAster_rank:
-                    global_numbering = toBeSentAway
-                else:
-                    cOmm.send(toBeSentAway, dest=i, tag=i)
-                for k in element_indices: del numberingCache[k]
-
-        dofsPOOL = set()
-        for i in self._sf_.mesh.elements:
-            vector = global_numbering[i].ravel('F')
-            gathering_matrix[i] = Gathering_Vector(i, vector)
-            dofsPOOL.update(vector)
-        gathering_matrix = Gathering_Matrix(gathering_matrix, mesh_type='_3dCSCG')
-        numOfDofs = len(dofsPOOL)
-
-        return gathering_matrix, numOfDofs, extraInfo
-
-    @staticmethod
-    def ___PRIVATE_for_0Form_pass_element_side_numbering_from_to___(
-        fromElement, fromSide, toElement, toSide, numberingCache):
-        if fromSide == 'N'  : data = numberingCache[fromElement][0 , :, :]
-        elif fromSide == 'S': data = numberingCache[fromElement][-1, :, :]
-        elif fromSide == 'W': data = numberingCache[fromElement][ :, 0, :]
-        elif fromSide == 'E': data = numberingCache[fromElement][ :,-1, :]
-        elif fromSide == 'B': data = numberingCache[fromElement][ :, :, 0]
-        elif fromSide == 'F': data = numberingCache[fromElement][ :, :,-1]
-        else: raise Exception()
-
-        if toSide == 'N'  : numberingCache[toElement][ 0, :, :] = data
-        elif toSide == 'S': numberingCache[toElement][-1, :, :] = data
-        elif toSide == 'W': numberingCache[toElement][ :, 0, :] = data
-        elif toSide == 'E': numberingCache[toElement][ :,-1, :] = data
-        elif toSide == 'B': numberingCache[toElement][ :, :, 0] = data
-        elif toSide == 'F': numberingCache[toElement][ :, :,-1] = data
-        else: raise Exception()
+        return self.___PRIVATE_distributed_numbering___()
 
     def _0Form_a_region_side_crack(self):
         """Do the numbering for 0Form with one region side crack."""
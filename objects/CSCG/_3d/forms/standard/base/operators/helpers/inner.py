@@ -1,12 +1,18 @@
-
-
 import numpy as np
+from scipy.sparse import csc_matrix
 from screws.freeze.base import FrozenOnly
 
 
 
 class ___Operators_3dCSCG_sf_Inner___(FrozenOnly):
-    """The class for the inner product matrix."""
+    """The class for the inner product matrix.
+
+    We do not compute the local matrices one by one. Instead, we group the local mesh-elements
+    according to their types w.r.t. metric, and compute the local matrices of the representatives
+    (one element for each group) all together with the batched kernel,
+    ``___PRIVATE_operator_inner_batched___``, of the form. The results are stored in a 3d array,
+    see ``blocks``.
+    """
     def __init__(self, sf, of, quad_degree=None):
         assert sf.ndim == of.ndim and sf.k == of.k, " <___STORAGE_OPERATORS_INNER___> "
         assert sf.mesh == of.mesh, "Meshes do not match."
@@ -25,10 +31,62 @@ class ___Operators_3dCSCG_sf_Inner___(FrozenOnly):
         self._quad_weights_ = quad_weights
         self._bfSelf_ = bfSelf
         self._bfOther_ = bfOther
+        self._blocks_ = None
+        self._positions_ = None
         self._freeze_self_()
 
+    def ___PRIVATE_batched_computing___(self):
+        """Compute the local matrices of all groups. Orthogonal groups and the others are computed
+        in two batches because the former do not have off-diagonal blocks."""
+        elements = self._mesh_.elements
+        marks = dict()
+        representatives = list()
+        positions = dict()
+        for i in elements:
+            mark = elements[i].type_wrt_metric.mark
+            if mark not in marks:
+                marks[mark] = len(representatives)
+                representatives.append(i)
+            positions[i] = marks[mark]
+
+        orthogonal, others = list(), list()
+        for k, i in enumerate(representatives):
+            mark = elements[i].type_wrt_metric.mark
+            if isinstance(mark, str) and mark[:4] == 'Orth':
+                orthogonal.append(k)
+            else:
+                others.append(k)
+
+        blocks = None
+        for K in (orthogonal, others):
+            if len(K) == 0: continue
+            B = self._sf_.___PRIVATE_operator_inner_batched___(
+                self._of_, [representatives[k] for k in K],
+                self._xietasigma_, self._quad_weights_, self._bfSelf_, self._bfOther_
+            )
+            if blocks is None:
+                blocks = np.empty((len(representatives),) + B.shape[1:])
+            blocks[K] = B
+
+        self._blocks_ = blocks
+        self._positions_ = positions
+
+    @property
+    def blocks(self):
+        """A 3d array of shape (num_of_groups, m, n). ``blocks[positions[i]]`` is the local
+        matrix of mesh-element #i. When there is no local mesh-element, it is None."""
+        if self._positions_ is None:
+            self.___PRIVATE_batched_computing___()
+        return self._blocks_
+
+    @property
+    def positions(self):
+        """A dict: keys are local mesh-elements, values are the indices of their local
+        matrices in ``blocks``."""
+        if self._positions_ is None:
+            self.___PRIVATE_batched_computing___()
+        return self._positions_
+
     def __call__(self, i):
-        Mi = self._sf_.___PRIVATE_operator_inner___(
-            self._of_, i, self._xietasigma_, self._quad_weights_, self._bfSelf_, self._bfOther_
-        )
+        Mi = csc_matrix(self.blocks[self.positions[i]])
         return Mi
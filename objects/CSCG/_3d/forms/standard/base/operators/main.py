@@ -1,6 +1,7 @@
 
 from screws.freeze.main import FrozenOnly
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.main import EWC_SparseMatrix
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.block_dense import EWC_BlockDense
 from objects.CSCG._3d.forms.standard.base.operators.helpers.inner import ___Operators_3dCSCG_sf_Inner___
 
 
@@ -19,13 +20,10 @@ class _3dCSCG_Standard_Form_Operators(FrozenOnly):
         :param quad_degree:
         """
         data_generator = ___Operators_3dCSCG_sf_Inner___(self._sf_, other, quad_degree=quad_degree)
-        # note that even all mesh elements are unique, we still cache the output because we may use it for multiple times.
-
-        if self._sf_.mesh.elements.IS.homogeneous_according_to_types_wrt_metric:
-            return EWC_SparseMatrix(self._sf_.mesh.elements, data_generator, 'constant')
-        else:
-            return EWC_SparseMatrix(self._sf_.mesh.elements, data_generator,
-                                    self._sf_.mesh.elements.___PRIVATE_elementwise_cache_metric_key___)
+        # the local matrices are block-dense: one block for each group of elements of the same metric.
+        # Even all mesh elements are unique, we still cache the output because we may use it for multiple times.
+        BD = EWC_BlockDense(data_generator.blocks, data_generator.positions)
+        return EWC_SparseMatrix(self._sf_.mesh.elements, BD)
 
     def wedge(self, other, quad_degree=None):
         """"""
@@ -14,20 +14,160 @@ from screws.freeze.base import FrozenOnly
 
 
 class _3dCSCG_MeshElement_CT_VEC(FrozenOnly):
-    """"""
+    """We will compute the results all together and put the results in higher dimensional arrays.
+    The first index always refers to the (local) mesh-elements.
+    """
     def __init__(self, elements):
         """"""
         self._elements_ = elements
         self._freeze_self_()
 
-    def Jacobian(self, xi, et, sg):
+    def ___PRIVATE_region_wise_rst___(self, xi, et, sg, elements=None):
+        """Group the local mesh-elements by regions; for each region, yield the positions of its
+        elements in the sequence of local elements (or in `elements` if it is given), the deltas
+        of its elements and the (raveled) region coordinates of all evaluation points in all its
+        elements.
         """
+        regions = self._elements_._mesh_.domain.regions
+        groups = dict()
+        for k, i in enumerate(self._elements_ if elements is None else elements):
+            element = self._elements_[i]
+            if element.in_region not in groups:
+                groups[element.in_region] = ([], [], [])
+            groups[element.in_region][0].append(k)
+            groups[element.in_region][1].append(element.coordinate_transformation.origin)
+            groups[element.in_region][2].append(element.coordinate_transformation.delta)
+
+        for rn in groups:
+            K, origin, delta = groups[rn]
+            origin = np.array(origin)
+            delta = np.array(delta)
+            rst = [((ep[np.newaxis, :] + 1) * 0.5 * delta[:, j:j+1] + origin[:, j:j+1]).ravel()
+                   for j, ep in enumerate((xi, et, sg))]
+            yield regions[rn], K, delta, rst
+
+    def mapping(self, xi, et, sg):
+        """The mapping of all local mesh-elements. Elements in the same region are mapped together
+        by one call of the region interpolation.
 
         :param xi: ndarray, (xi, et, sg) be same shape.
         :param et: ndarray, (xi, et, sg) be same shape.
         :param sg: ndarray, (xi, et, sg) be same shape.
+        :return: A 3-tuple of ndarrays (x, y, z); each is of shape (num_local_elements, *xi.shape).
+        """
+        if len(self._elements_) == 0:
+            return None
+
+        xi, et, sg = [np.asarray(_) for _ in (xi, et, sg)]
+        shape = xi.shape
+        xi, et, sg = xi.ravel(), et.ravel(), sg.ravel()
+
+        XYZ = [np.empty((len(self._elements_), len(xi))) for _ in range(3)]
+        for region, K, _, rst in self.___PRIVATE_region_wise_rst___(xi, et, sg):
+            xyz = region.interpolation(*rst)
+            for j in range(3):
+                XYZ[j][K] = xyz[j].reshape((len(K), len(xi)))
+
+        return tuple([_.reshape((len(self._elements_),) + shape) for _ in XYZ])
+
+    def Jacobian_matrix(self, xi, et, sg, elements=None):
+        """
+
+        :param xi: ndarray, (xi, et, sg) be same shape
+        :param et: ndarray, (xi, et, sg) be same shape
+        :param sg: ndarray, (xi, et, sg) be same shape
+        :param elements: None or a list of local mesh-elements. If it is given, we only compute
+            for these elements and the first index of the outputs refers to them.
+        :return: When all elements are of the same type w.r.t. metric (and `elements` is None),
+            return the 3 by 3 nested list of the first element. Otherwise, return a 3 by 3 nested
+            list of ndarrays of shape (num_local_elements, *xi.shape); elements in the same region
+            are computed together.
+        """
+        if elements is not None:
+            num_elements = len(elements)
+        elif len(self._elements_) == 0:
+            return None
+        else:
+            num_elements = len(self._elements_)
+
+        if elements is None and self._elements_.IS.homogeneous_according_to_types_wrt_metric:
+
+            i = self._elements_.indices[0]
+            Jacobian_matrix = self._elements_[i].coordinate_transformation.Jacobian_matrix(xi, et, sg)
+            return Jacobian_matrix
+
+        else:
+            xi, et, sg = [np.asarray(_) for _ in (xi, et, sg)]
+            shape = xi.shape
+            xi, et, sg = xi.ravel(), et.ravel(), sg.ravel()
+
+            J = [[np.empty((num_elements, len(xi))) for _ in range(3)] for _ in range(3)]
+            for region, K, delta, rst in self.___PRIVATE_region_wise_rst___(xi, et, sg, elements=elements):
+                xyz_rst = region.interpolation.Jacobian_matrix(*rst)
+                for j in range(3):
+                    for l in range(3):
+                        J[j][l][K] = np.broadcast_to(xyz_rst[j][l], rst[0].shape).reshape((len(K), len(xi))) \
+                                     * (delta[:, l:l+1] / 2) # an entry can be a scalar (0).
+
+            return [[J[j][l].reshape((num_elements,) + shape) for l in range(3)] for j in range(3)]
+
+    def inverse_Jacobian_matrix(self, xi, et, sg, elements=None, J=None):
+        """
+
+        :param xi: ndarray, (xi, et, sg) be same shape
+        :param et: ndarray, (xi, et, sg) be same shape
+        :param sg: ndarray, (xi, et, sg) be same shape
+        :param elements: None or a list of local mesh-elements, see ``Jacobian_matrix``.
+        :param J: The batched Jacobian matrix of `elements` if we already have it.
+        :return: When all elements are of the same type w.r.t. metric (and `elements` is None),
+            return the 3 by 3 nested list of the first element. Otherwise, return a 3 by 3 nested
+            list of ndarrays of shape (num_local_elements, *xi.shape).
+        """
+        if elements is None and len(self._elements_) == 0:
+            return None
+
+        if elements is None and self._elements_.IS.homogeneous_according_to_types_wrt_metric:
+
+            i = self._elements_.indices[0]
+            inverse_Jacobian_matrix = self._elements_[i].coordinate_transformation.inverse_Jacobian_matrix(xi, et, sg)
+            return inverse_Jacobian_matrix
+
+        else:
+            if J is None:
+                J = self.Jacobian_matrix(xi, et, sg, elements=elements)
+            Jacobian = + J[0][0] * J[1][1] * J[2][2] + J[0][1] * J[1][2] * J[2][0] + J[0][2] * J[1][0] * J[2][1] \
+                       - J[0][0] * J[1][2] * J[2][1] - J[0][1] * J[1][0] * J[2][2] - J[0][2] * J[1][1] * J[2][0]
+            reciprocalJacobian = 1 / Jacobian
+            del Jacobian
+            iJ00 = reciprocalJacobian * (J[1][1] * J[2][2] - J[1][2] * J[2][1])
+            iJ01 = reciprocalJacobian * (J[2][1] * J[0][2] - J[2][2] * J[0][1])
+            iJ02 = reciprocalJacobian * (J[0][1] * J[1][2] - J[0][2] * J[1][1])
+            iJ10 = reciprocalJacobian * (J[1][2] * J[2][0] - J[1][0] * J[2][2])
+            iJ11 = reciprocalJacobian * (J[2][2] * J[0][0] - J[2][0] * J[0][2])
+            iJ12 = reciprocalJacobian * (J[0][2] * J[1][0] - J[0][0] * J[1][2])
+            iJ20 = reciprocalJacobian * (J[1][0] * J[2][1] - J[1][1] * J[2][0])
+            iJ21 = reciprocalJacobian * (J[2][0] * J[0][1] - J[2][1] * J[0][0])
+            iJ22 = reciprocalJacobian * (J[0][0] * J[1][1] - J[0][1] * J[1][0])
+            return [[iJ00, iJ01, iJ02],
+                    [iJ10, iJ11, iJ12],
+                    [iJ20, iJ21, iJ22]]
+
+    def Jacobian(self, xi, et, sg, elements=None, J=None):
+        """
+
+        :param xi: ndarray, (xi, et, sg) be same shape.
+        :param et: ndarray, (xi, et, sg) be same shape.
+        :param sg: ndarray, (xi, et, sg) be same shape.
+        :param elements: None or a list of local mesh-elements, see ``Jacobian_matrix``.
+        :param J: The batched Jacobian matrix of `elements` if we already have it.
         :return:
         """
+        if elements is not None or J is not None:
+            if J is None:
+                J = self.Jacobian_matrix(xi, et, sg, elements=elements)
+            return + J[0][0]*J[1][1]*J[2][2] + J[0][1]*J[1][2]*J[2][0] + J[0][2]*J[1][0]*J[2][1]\
+                   - J[0][0]*J[1][2]*J[2][1] - J[0][1]*J[1][0]*J[2][2] - J[0][2]*J[1][1]*J[2][0]
+
         if len(self._elements_) == 0:
             return None
 
@@ -46,6 +186,30 @@ class _3dCSCG_MeshElement_CT_VEC(FrozenOnly):
                 Jacobian.append(J[i])
             return np.array(Jacobian)
 
+    def inverse_metric_matrix(self, xi, et, sg, elements=None, iJ=None):
+        """The inverse metric matrix, g^{i,j}, of local mesh-elements (or of `elements`).
+
+        :param xi: ndarray, (xi, et, sg) be same shape
+        :param et: ndarray, (xi, et, sg) be same shape
+        :param sg: ndarray, (xi, et, sg) be same shape
+        :param elements: None or a list of local mesh-elements, see ``Jacobian_matrix``.
+        :param iJ: The (batched) inverse Jacobian matrix if we already have it.
+        :return:
+        """
+        if iJ is None:
+            iJ = self.inverse_Jacobian_matrix(xi, et, sg, elements=elements)
+            if iJ is None:
+                return None
+        iG = [[None for _ in range(3)] for __ in range(3)]
+        for i in range(3):
+            for j in range(i, 3):
+                iG[i][j] = iJ[i][0] * iJ[j][0]
+                for l in range(1, 3):
+                    iG[i][j] = iG[i][j] + iJ[i][l] * iJ[j][l]
+                if i != j:
+                    iG[j][i] = iG[i][j]
+        return iG
+
     def inverse_Jacobian(self, xi, et, sg):
         """
 
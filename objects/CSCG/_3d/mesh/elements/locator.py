@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""Locate physical points in the mesh elements: find the mesh elements containing them and their
+reference coordinates (xi, eta, sigma) in these elements.
+
+In each core, we make an index of the local mesh elements: the bounding box of every local
+element and a uniform grid (of cells) over the bounding box of all local elements. A point then
+only is tested against the elements whose bounding boxes cover the cell it is in; we find its
+reference coordinates with a Newton iteration of the inverse mapping, vectorized over all
+(point, candidate element) pairs in a region.
+"""
+import sys
+if './' not in sys.path: sys.path.append('./')
+
+from screws.freeze.main import FrozenOnly
+from root.config.main import *
+
+
+class _3dCSCG_Mesh_Elements_Locator(FrozenOnly):
+    """
+    :param elements: The local mesh elements.
+    :param samples: The bounding box of a mesh element is made of its mapping of a lattice of
+        `samples` ^ 3 reference points (and then padded a little bit). So curvilinear elements
+        are also covered.
+    """
+    def __init__(self, elements, samples=4):
+        self._elements_ = elements
+        self._regions_ = elements._mesh_.domain.regions
+        indices = list(elements)
+        self._indices_ = np.array(indices, dtype=int)
+        num = len(indices)
+
+        if num > 0:
+            _ = np.linspace(-1, 1, samples)
+            xi, et, sg = np.meshgrid(_, _, _, indexing='ij')
+            XYZ = elements.coordinate_transformation.vectorized.mapping(xi, et, sg)
+            XYZ = np.stack([_.reshape((num, -1)) for _ in XYZ], axis=1) # (num, 3, samples**3)
+            low = np.min(XYZ, axis=2)
+            up = np.max(XYZ, axis=2)
+            pad = 0.05 * (up - low) + 1e-12 * (1 + np.abs(up))
+            self._boxes_ = (low - pad, up + pad) # two (num, 3) arrays.
+            self._scales_ = np.max(up - low, axis=1)
+            self._box_ = (np.min(self._boxes_[0], axis=0), np.max(self._boxes_[1], axis=0))
+
+            # ----- the uniform grid: which elements cover which cells ------------------------------
+            n = max(1, int(round(num ** (1 / 3))))
+            self._grid_shape_ = np.array([n, n, n])
+            LOW = self.___PRIVATE_cells_of___(self._boxes_[0])
+            UP = self.___PRIVATE_cells_of___(self._boxes_[1])
+            CELLS = [list() for _ in range(n ** 3)]
+            for e in range(num):
+                I, J, K = [np.arange(LOW[e, d], UP[e, d] + 1) for d in range(3)]
+                for c in np.ravel_multi_index(np.meshgrid(I, J, K, indexing='ij'), (n, n, n)).ravel():
+                    CELLS[c].append(e)
+            self._cell_pointer_ = np.concatenate([[0], np.cumsum([len(_) for _ in CELLS])])
+            self._cell_elements_ = np.array([e for _ in CELLS for e in _], dtype=int)
+
+            self._origins_ = np.array([elements[i].coordinate_transformation.origin for i in indices])
+            self._deltas_ = np.array([elements[i].coordinate_transformation.delta for i in indices])
+            in_regions = [elements[i].in_region for i in indices]
+            self._region_groups_ = dict()
+            for e, rn in enumerate(in_regions):
+                if rn not in self._region_groups_: self._region_groups_[rn] = list()
+                self._region_groups_[rn].append(e)
+            for rn in self._region_groups_:
+                self._region_groups_[rn] = np.array(self._region_groups_[rn], dtype=int)
+
+        else:
+            self._box_ = None
+
+        self._freeze_self_()
+
+    @property
+    def bounding_box(self):
+        """The bounding box, ``(lower corner, upper corner)``, of all local mesh elements. None if
+        there is no local mesh element."""
+        return self._box_
+
+    def ___PRIVATE_cells_of___(self, xyz):
+        """The (i, j, k) indices of the cells the points `xyz` (of shape (num, 3)) are in."""
+        low, up = self._box_
+        ijk = np.floor((xyz - low) / (up - low) * self._grid_shape_).astype(int)
+        return np.clip(ijk, 0, self._grid_shape_ - 1)
+
+    def __call__(self, x, y, z, tolerance=1e-10, maxiter=25):
+        """Locate points in the local mesh elements.
+
+        :param x: 1d array
+        :param y: 1d array
+        :param z: 1d array
+        :param tolerance: The (relative to the element size) tolerance of the Newton iteration.
+        :param maxiter: The max number of the Newton iterations.
+        :return: A tuple of 4 1d arrays: (elements, xi, et, sg). `elements` are the numbers of the
+            mesh elements containing the points; for points not in any local mesh element, they
+            are -1 and their reference coordinates are nan.
+        """
+        xyz = np.stack([np.asarray(_, dtype=float).ravel() for _ in (x, y, z)], axis=1)
+        num = len(xyz)
+        ELEMENTS = np.full(num, -1, dtype=int)
+        RST = np.full((num, 3), np.nan)
+        if num == 0 or self._box_ is None:
+            return ELEMENTS, RST[:, 0], RST[:, 1], RST[:, 2]
+
+        # ----- candidate (point, element) pairs --------------------------------------------------
+        inside = np.all((xyz >= self._box_[0]) & (xyz <= self._box_[1]), axis=1)
+        points = np.flatnonzero(inside)
+        cells = np.ravel_multi_index(self.___PRIVATE_cells_of___(xyz[points]).T, tuple(self._grid_shape_))
+        start, stop = self._cell_pointer_[cells], self._cell_pointer_[cells + 1]
+        counts = stop - start
+        P = np.repeat(points, counts)
+        E = self._cell_elements_[np.repeat(start - np.cumsum(counts) + counts, counts) + np.arange(np.sum(counts))]
+        in_box = np.all((xyz[P] >= self._boxes_[0][E]) & (xyz[P] <= self._boxes_[1][E]), axis=1)
+        P, E = P[in_box], E[in_box]
+
+        # ----- Newton iterations, region by region --------------------------------------------------
+        found = np.zeros(len(P), dtype=bool)
+        ref = np.zeros((len(P), 3))
+        for rn in self._region_groups_:
+            which = np.flatnonzero(np.isin(E, self._region_groups_[rn]))
+            if len(which) == 0: continue
+            found[which], ref[which] = self.___PRIVATE_inverse_mapping___(
+                self._regions_[rn], self._origins_[E[which]], self._deltas_[E[which]], xyz[P[which]],
+                tolerance * self._scales_[E[which]], maxiter)
+
+        # ----- the first element found for each point ------------------------------------------------
+        P, E, ref = P[found], E[found], ref[found]
+        first = np.unique(P, return_index=True)[1]
+        ELEMENTS[P[first]] = self._indices_[E[first]]
+        RST[P[first]] = ref[first]
+        return ELEMENTS, RST[:, 0], RST[:, 1], RST[:, 2]
+
+    @staticmethod
+    def ___PRIVATE_inverse_mapping___(region, origin, delta, xyz, tolerance, maxiter):
+        """Vectorized Newton iterations of the inverse mapping of the elements (of `origin` and
+        `delta` in the reference region) for the points `xyz`, all arrays of shape (num, 3).
+
+        :return: If the points are in the elements, and their reference coordinates.
+        """
+        num = len(xyz)
+        ref = np.zeros((num, 3))
+        converged = np.zeros(num, dtype=bool)
+        active = np.arange(num)
+        for _ in range(maxiter):
+            r = origin[active] + (ref[active] + 1) * 0.5 * delta[active]
+            residual = np.stack(region.interpolation(r[:, 0], r[:, 1], r[:, 2]), axis=1) - xyz[active]
+            done = np.max(np.abs(residual), axis=1) <= tolerance[active]
+            converged[active[done]] = True
+            active, r, residual = active[~done], r[~done], residual[~done]
+            if len(active) == 0: break
+            Jr = region.interpolation.Jacobian_matrix(r[:, 0], r[:, 1], r[:, 2])
+            J = np.empty((len(active), 3, 3))
+            for j in range(3):
+                for l in range(3): # an entry can be a scalar (0).
+                    J[:, j, l] = np.broadcast_to(Jr[j][l], (len(active),)) * delta[active, l] * 0.5
+            try:
+                step = np.linalg.solve(J, residual[:, :, np.newaxis])[:, :, 0]
+            except np.linalg.LinAlgError:
+                step = np.einsum('kij, kj -> ki', np.linalg.pinv(J), residual)
+            ref[active] = np.clip(ref[active] - step, -1.5, 1.5)
+
+        inside = converged & np.all(np.abs(ref) <= 1 + 1e-8, axis=1)
+        return inside, np.clip(ref, -1, 1)
+
+    def locate(self, x, y, z, **kwargs):
+        """Locate points in the whole mesh. Collective: each core gives its own points (can be
+        empty) and gets the results of them.
+
+        The points are routed to all cores whose bounding boxes contain them (one ``Alltoallv``),
+        located in the local elements there, and the results are sent back (one ``Alltoallv``).
+
+        :param x: 1d array
+        :param y: 1d array
+        :param z: 1d array
+        :param kwargs: Other kwargs passed to the local locating, see ``__call__``.
+        :return: A tuple of 4 1d arrays: (elements, xi, et, sg). For points out of the mesh, the
+            elements are -1 and the reference coordinates are nan.
+        """
+        xyz = np.stack([np.asarray(_, dtype=float).ravel() for _ in (x, y, z)], axis=1)
+        num = len(xyz)
+        BOXES = cOmm.allgather(self._box_)
+
+        SEND = list()
+        for core in range(sIze):
+            if BOXES[core] is None:
+                SEND.append(np.zeros(0, dtype=int))
+            else:
+                SEND.append(np.flatnonzero(np.all((xyz >= BOXES[core][0]) & (xyz <= BOXES[core][1]), axis=1)))
+        send_counts = np.array([len(_) for _ in SEND], dtype=int)
+        recv_counts = np.empty(sIze, dtype=int)
+        cOmm.Alltoall(send_counts, recv_counts)
+
+        send = np.ascontiguousarray(xyz[np.concatenate(SEND)]) if num > 0 else np.zeros((0, 3))
+        recv = np.empty((np.sum(recv_counts), 3))
+        cOmm.Alltoallv([send, 3 * send_counts], [recv, 3 * recv_counts])
+
+        elements, xi, et, sg = self(recv[:, 0], recv[:, 1], recv[:, 2], **kwargs)
+        send = np.ascontiguousarray(np.stack([elements, xi, et, sg], axis=1)) # element numbers as floats.
+        back = np.empty((np.sum(send_counts), 4))
+        cOmm.Alltoallv([send, 4 * recv_counts], [back, 4 * send_counts])
+
+        ELEMENTS = np.full(num, -1, dtype=int)
+        RST = np.full((num, 3), np.nan)
+        points = np.concatenate(SEND) if num > 0 else np.zeros(0, dtype=int)
+        found = back[:, 0] >= 0
+        points, back = points[found], back[found]
+        first = np.unique(points, return_index=True)[1] # a point on a boundary between cores.
+        ELEMENTS[points[first]] = back[first, 0].astype(int)
+        RST[points[first]] = back[first, 1:]
+        return ELEMENTS, RST[:, 0], RST[:, 1], RST[:, 2]
@@ -10,6 +10,7 @@ from objects.CSCG._3d.mesh.elements.coordinate_transformation.main import _3dCSC
 from objects.CSCG._3d.mesh.elements.do.main import _3dCSCG_Mesh_Elements_DO
 from objects.CSCG._3d.mesh.elements.visualize import _3dCSCG_MeshElements_VIS
 from objects.CSCG._3d.mesh.elements.IS import _3dCSCG_MeshElements_IS
+from objects.CSCG._3d.mesh.elements.locator import _3dCSCG_Mesh_Elements_Locator
 
 
 class _3dCSCG_Mesh_Elements(FrozenOnly):
@@ -20,6 +21,7 @@ class _3dCSCG_Mesh_Elements(FrozenOnly):
         self._DO_ = None
         self._visualize_ = None
         self._IS_ = None
+        self._locator_ = None
         self._ct_ = _3dCSCG_Mesh_Elements_CT(self)
         for i in self.indices:
             self._elements_[i] = _3dCSCG_Mesh_Element(self, i)
@@ -215,6 +217,17 @@ class _3dCSCG_Mesh_Elements(FrozenOnly):
             self._DO_ = _3dCSCG_Mesh_Elements_DO(self)
         return self._DO_
 
+    @property
+    def locator(self):
+        """The index to locate physical points in the mesh elements, see
+        :class:`_3dCSCG_Mesh_Elements_Locator`. For example,
+
+            >>> elements, xi, et, sg = mesh.elements.locator.locate(x, y, z) # collective
+        """
+        if self._locator_ is None:
+            self._locator_ = _3dCSCG_Mesh_Elements_Locator(self)
+        return self._locator_
+
     @property
     def visualize(self):
         if self._visualize_ is None:
@@ -67,11 +67,14 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
 
 
         :param EDM:
-            Element-Distribution-Methods; it can be one of (None, 'debug', 'SWV0', 'chaotic')
+            Element-Distribution-Methods; it can be one of (None, 'debug', 'SWV0', 'chaotic', 'RCB')
 
                 None (default): We will try to find a proper method. If we cannot, we will use a most rigid method.
                 'debug': We will force ourselves to use the most rigid method.
                 'SWV0': Smart-Way-Version-0; A not so small way.
+                'RCB': Cores get equal amounts of elements, and the elements are numbered by recursive
+                    coordinate bisection of the regions such that each core gets compact blocks of
+                    elements. See `distribution_quality` for the edge-cut and imbalance.
                 'chaotic': A very chaotic one. We better not save it because, when we re-build it, it will
                     randomly generate the element distribution again. So we will actually get different meshes
                     even we call same amount of cores, which sometimes is OKAY, but sometimes is not.
@@ -511,6 +514,16 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
 
                 current_num += self._num_elements_in_region_[rn]
 
+        elif EDM == 'RCB':
+            current_num = 0
+            for rn in rns:
+                if rn in DO_number_what:
+                    ___element_global_numbering___[rn] = \
+                        self.___PRIVATE_RCB_element_numbering___(rn, current_num)
+                else:
+                    pass
+                current_num += self._num_elements_in_region_[rn]
+
         else:
             raise Exception(f"element_distribution_method: '{EDM}' not coded for "
                             f"<generate_element_global_numbering>.")
@@ -557,6 +570,49 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
 
 
 
+    def ___PRIVATE_RCB_element_numbering___(self, region_name, start):
+        """Number the elements of a region by recursive coordinate bisection (RCB).
+
+        The elements of the region go to the cores whose element ranges overlap
+        ``[start, start + #elements in this region)``. The element graph of a region is a
+        structured (I, J, K) lattice, so we bisect it recursively, always along the direction of the
+        largest extent, into groups of these amounts. The groups are then numbered one after another,
+        so each core receives a compact block of elements and shares fewer element sides with others.
+
+        :param region_name:
+        :param start: The numbering of the elements in this region starts with `start`.
+        :return: The element numbering of the region; a 3d array of shape ``element_layout[region_name]``.
+        """
+        layout = self._element_layout_[region_name]
+        end = start + self._num_elements_in_region_[region_name]
+        sizes = list()
+        for core in range(sIze):
+            RANGE = self._element_distribution_[core]
+            amount = min(RANGE.stop, end) - max(RANGE.start, start)
+            if amount > 0:
+                sizes.append(amount)
+        assert sum(sizes) == end - start, "A trivial check."
+
+        EGN = np.empty(layout, dtype=int)
+        INDICES = np.array(np.unravel_index(np.arange(end - start), layout, order='F')).T
+
+        def bisect(indices, group_sizes, first_number):
+            if len(group_sizes) == 1:
+                indices = indices[np.lexsort((indices[:, 0], indices[:, 1], indices[:, 2]))]
+                EGN[indices[:, 0], indices[:, 1], indices[:, 2]] = \
+                    first_number + np.arange(len(indices))
+                return
+            half = len(group_sizes) // 2
+            amount = sum(group_sizes[:half])
+            axis = int(np.argmax(np.max(indices, axis=0) - np.min(indices, axis=0)))
+            others = [_ for _ in range(3) if _ != axis]
+            indices = indices[np.lexsort((indices[:, others[0]], indices[:, others[1]], indices[:, axis]))]
+            bisect(indices[:amount], group_sizes[:half], first_number)
+            bisect(indices[amount:], group_sizes[half:], first_number + amount)
+
+        bisect(INDICES, sizes, start)
+        return EGN
+
     def ___PRIVATE_generate_element_global_numbering_for_region___(self, region_name):
         """generate element numbering for one regions."""
         # rns = self.domain.regions.names
@@ -584,16 +640,15 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
 
         return self.___PRIVATE_generate_element_global_numbering___(number_what='all regions')
 
-    def ___PRIVATE_element_division_and_numbering_quality___(self):
-        """find the quality of element division (to cores) and element (regions-wise global) numbering quality.
+    def ___PRIVATE_count_local_element_sides___(self):
+        """Count the sides of the local elements.
 
-        :return: A tuple of 2 outputs:
+        :return: A tuple of 3 integers: the numbers of local element sides that are
 
-                1. The overall quality (of the whole mesh across all cores.) 1 is best, 0 is worst.
-                2. The local quality of this core.
+                1. shared with local elements (INTERNAL).
+                2. shared with elements in other cores (EXTERNAL).
+                3. on the domain boundary (BOUNDARY).
         """
-        if sIze == 1: return 1, 1
-
         INTERNAL = 0
         EXTERNAL = 0
         BOUNDARY = 0
@@ -610,6 +665,20 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
                     else:
                         EXTERNAL += 1
 
+        return INTERNAL, EXTERNAL, BOUNDARY
+
+    def ___PRIVATE_element_division_and_numbering_quality___(self):
+        """find the quality of element division (to cores) and element (regions-wise global) numbering quality.
+
+        :return: A tuple of 2 outputs:
+
+                1. The overall quality (of the whole mesh across all cores.) 1 is best, 0 is worst.
+                2. The local quality of this core.
+        """
+        if sIze == 1: return 1, 1
+
+        INTERNAL, EXTERNAL, BOUNDARY = self.___PRIVATE_count_local_element_sides___()
+
         loc_qua = (INTERNAL + BOUNDARY) / (self.elements.num * 6)
 
         I = cOmm.reduce(INTERNAL, root=mAster_rank, op=MPI.SUM)
@@ -1213,6 +1282,22 @@ class _3dCSCG_Mesh(CSCG_MESH_BASE):
             self._sub_geometry_ = _3dCSCG_Mesh_SubGeometry(self)
         return self._sub_geometry_
 
+    @property
+    def distribution_quality(self):
+        """The quality of the element distribution (to cores). A dict:
+
+            - 'edge-cut': how many element sides are shared by two cores.
+            - 'imbalance': max(#local elements) / mean(#local elements) - 1; 0 is the best.
+            - 'quality': the ratio of element sides not shared by cores; 1 is the best.
+        """
+        QUALITY = self.___PRIVATE_element_division_and_numbering_quality___()[0]
+        EXTERNAL = cOmm.allreduce(self.___PRIVATE_count_local_element_sides___()[1], op=MPI.SUM)
+        assert EXTERNAL % 2 == 0, "A shared element side must be counted by two cores."
+        amounts = [len(self._element_distribution_[c]) for c in range(sIze)]
+        return {'edge-cut': EXTERNAL // 2,
+                'imbalance': max(amounts) / np.mean(amounts) - 1,
+                'quality': QUALITY}
+
     @property
     def quality(self):
         """A factor in [0,1] that reflects the quality of the mesh; 1
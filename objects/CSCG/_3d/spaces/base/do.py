@@ -2,7 +2,7 @@ from screws.freeze.main import FrozenOnly
 
 import numpy as np
 from screws.exceptions import DimensionError
-from screws.decorators.accepts import memoize1
+from screws.decorators.memoize.memoize_6 import memoize6
 
 class _3dCSCG_space_do(FrozenOnly):
     """"""
@@ -12,6 +12,12 @@ class _3dCSCG_space_do(FrozenOnly):
         self.basises = space.basises
         self._freeze_self_()
 
+    @property
+    def ___cache_key___(self):
+        """The evaluations are fully decided by the 1d basises (and the type) of the space."""
+        return self._space_.__class__.__name__, self.basises
+
+    @memoize6
     def evaluate_edge_basis_at_meshgrid(self, k, *domain):
         """ """
         assert 0 <= k <= self.ndim-1, " <Polynomials> : k={} is wrong.".format(k)
@@ -62,6 +68,7 @@ class _3dCSCG_space_do(FrozenOnly):
 
         return _basis_
 
+    @memoize6
     def evaluate_form_basis_at_meshgrid(self, k, *domain, compute_xietasigma=True):
         """
         Parameters
@@ -164,7 +171,7 @@ class _3dCSCG_space_do(FrozenOnly):
         sigma = sigma.ravel('F')
         return xi, eta, sigma
 
-    @memoize1
+    @memoize6
     def evaluate_form_basis_at_quadrature(
             self, k, quad_degree, quad_type=None, compute_xietasigma=True):
         """"""
@@ -175,6 +182,7 @@ class _3dCSCG_space_do(FrozenOnly):
                 k, *quad_nodes, compute_xietasigma=compute_xietasigma)
         return _xietasigma_, _basis_, quad_weights, quad_weights_ravel
 
+    @memoize6
     def evaluate_trace_basis_at_meshgrid(self, k, *domain, compute_xietasigma=True):
         """ """
         assert 0 <= k <= self.ndim-1, " <Polynomials> : k={} is wrong.".format(k)
@@ -129,7 +129,7 @@ class CSCG_MESH_BASE(FrozenClass):
         :param EDM:
         :return:
         """
-        customized_methods = ('debug', 'SWV0', 'chaotic')
+        customized_methods = ('debug', 'SWV0', 'chaotic', 'RCB')
 
         if EDM in customized_methods: # we strongly use the method.
 
@@ -443,6 +443,13 @@ class CSCG_MESH_BASE(FrozenClass):
 
 
 
+        elif EDM == 'RCB': # recursive coordinate bisection; the cores get equal amounts of elements.
+            # Which elements a core gets is decided by the element numbering (made by the mesh).
+            numOfTotalElements = self._num_total_elements_
+            eleDis = [numOfTotalElements // sIze + (1 if x < numOfTotalElements % sIze else 0) for x in range(sIze)]
+            for i in range(sIze):
+                disDict[i] = eleDis[i]
+
         #---- IF new EDM added we must add `elif` below to make disDict for this new EDM !!!!!!
 
 
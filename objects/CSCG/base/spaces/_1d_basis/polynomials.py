@@ -2,6 +2,7 @@
 import matplotlib.pyplot as plt
 from screws.freeze.main import FrozenOnly
 from screws.quadrature import Quadrature
+from screws.decorators.memoize.memoize_6 import memoize6
 from root.config.main import *
 
 
@@ -84,12 +85,18 @@ class _1dPolynomial(FrozenOnly):
         """(int) Return ``1``."""
         return 1
 
+    @property
+    def ___cache_key___(self):
+        """The basis functions are fully decided by the nodes."""
+        return self.nodes
+
 
     # must have methods ...
     def node_basis(self, x):
         """Return the lagrange polynomials."""
         return self.lagrange_basis(x)
 
+    @memoize6
     def lagrange_basis(self, x=None):
         """Return the lagrange polynomials evaluated at ``x``."""
         if x is None:
@@ -103,6 +110,7 @@ class _1dPolynomial(FrozenOnly):
                     basis[i, :] *= (x - self.nodes[j]) / (self.nodes[i] - self.nodes[j])
         return basis
 
+    @memoize6
     def edge_basis(self, x):
         """Return the edge polynomials evaluated at ``x``."""
         p = np.size(self.nodes) - 1
@@ -70,6 +70,8 @@ from root.config.dispatching import dIspatching
 from root.config.chaining import cHaining
 from root.config.group import gRoup_cores
 from root.config.check_same_in_all_cores import cHeck_same_in_all_cores
+from root.config.scope import sCoped
+from root.config.task_pool import tAsk_pool
 
 
 
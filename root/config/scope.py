@@ -0,0 +1,64 @@
+import sys
+from contextlib import contextmanager
+from mpi4py import MPI
+cOmm = MPI.COMM_WORLD
+
+
+___SCOPED_NAMES___ = ('cOmm', 'rAnk', 'sIze', 'sEcretary_rank', 'sLave_ranks', 'wOrker_ranks')
+
+
+def ___PRIVATE_config_values___(comm):
+    """The values of the scoped global names for communicator `comm`."""
+    size = comm.Get_size()
+    secretary_rank = 1 if size >= 2 else 0 # the master rank is always 0.
+    return {'cOmm': comm,
+            'rAnk': comm.Get_rank(),
+            'sIze': size,
+            'sEcretary_rank': secretary_rank,
+            'sLave_ranks': [i for i in range(1, size)],
+            'wOrker_ranks': [i for i in range(size) if i != secretary_rank]}
+
+
+def ___PRIVATE_config_modules___(comm):
+    """The loaded modules having the global names of `root.config` for communicator `comm`, i.e.,
+    modules that imported them from `root.config.main` (or the modules of `root.config`)."""
+    MODULES = list()
+    for module in list(sys.modules.values()):
+        if module is None or not hasattr(module, '__dict__'): continue
+        names = [name for name in ___SCOPED_NAMES___ if name in module.__dict__]
+        if len(names) == 0: continue
+        if 'cOmm' in names and module.__dict__['cOmm'] is not comm: continue
+        MODULES.append(module)
+    return MODULES
+
+
+@contextmanager
+def sCoped(comm):
+    """Within this context, the global names ``cOmm``, ``rAnk``, ``sIze``, ``sEcretary_rank``,
+    ``sLave_ranks`` and ``wOrker_ranks`` of all modules (which have imported them from
+    ``root.config.main``) refer to communicator `comm` instead of ``MPI.COMM_WORLD``.
+
+    So, with a sub-communicator of ``cOmm.Split``, a group of cores can run (anything of) mifem
+    independently of other groups. For example,
+
+        >>> group = cOmm.Split(color)
+        >>> with sCoped(group):
+        ...     mesh = MeshGenerator('crazy')([2, 2, 2]) # distributed in `group` only.
+
+    Only call it in all cores of `comm`. Objects made within the context are only valid within
+    it; do not use objects made outside in it. The master rank (0) is the same in all scopes.
+
+    :param comm: A (sub-)communicator of ``MPI.COMM_WORLD``.
+    """
+    world_values = ___PRIVATE_config_values___(cOmm) # cOmm is the current (maybe scoped) one.
+    scoped_values = ___PRIVATE_config_values___(comm)
+    for module in ___PRIVATE_config_modules___(cOmm):
+        for name in ___SCOPED_NAMES___:
+            if name in module.__dict__: setattr(module, name, scoped_values[name])
+    try:
+        yield comm
+    finally:
+        # modules imported within the context have taken the scoped names as well.
+        for module in ___PRIVATE_config_modules___(comm):
+            for name in ___SCOPED_NAMES___:
+                if name in module.__dict__: setattr(module, name, world_values[name])
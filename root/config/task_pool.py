@@ -0,0 +1,127 @@
+from mpi4py import MPI
+cOmm = MPI.COMM_WORLD
+sIze: int = cOmm.Get_size()
+rAnk: int = cOmm.Get_rank()
+mAster_rank: int = 0 # you can, but you do not need to change this!
+sLave_ranks: list = [i for i in range(sIze)]
+sLave_ranks.remove(mAster_rank)
+from collections import deque
+
+
+___CHUNK_TAG___ = 32001
+___REPORT_TAG___ = 32002
+
+
+def tAsk_pool(originalTaskInputs, method, chunk_size=1, gather=False, master_works=False):
+    """
+    A pool of tasks: the master keeps the inputs of ``originalTaskInputs`` and the slaves pull
+    chunks of them, so cores that finish early simply take more chunks.
+
+    Compared to ``dIspatching``,
+
+        - tasks are sent in chunks of ``chunk_size`` tasks (one message per chunk);
+        - a slave always holds its next chunk (prefetched by a nonblocking receive) while it
+          works on the current one, so it never waits for a round-trip to the master;
+        - results can be gathered into the master in the order of the tasks;
+        - the master can work as well; it then serves the slaves between its own tasks.
+
+    So ``tAsk_pool(taskInputs, method)`` can replace ``dIspatching(taskInputs, method)``, and
+    ``tAsk_pool(taskInputs, method, master_works=True)`` with ``gather`` can replace ``cHaining``
+    when the tasks do not need to be done in sequence.
+
+    :param originalTaskInputs: Only need data in master, be ``None`` in slaves.
+    :param method: The method to take the input and do the job.
+    :param chunk_size: (`default`: ``1``) How many tasks are sent in one message.
+    :param gather: (`default`: ``False``) If True, the master returns the results of all tasks in
+        the order of ``originalTaskInputs`` (slaves return ``None``). Otherwise, every core returns
+        the results of the tasks it has done (in the order they are done).
+    :param master_works: (`default`: ``False``) If True, the master also does tasks.
+    :return:
+    """
+    assert isinstance(chunk_size, int) and chunk_size >= 1, f"chunk_size={chunk_size} wrong."
+
+    if rAnk == mAster_rank:
+        taskInputs = list(originalTaskInputs)
+        CHUNKS = deque([[(i, taskInputs[i]) for i in range(j, min(j + chunk_size, len(taskInputs)))]
+                        for j in range(0, len(taskInputs), chunk_size)])
+        RESULTS = list() # list of (task index, result)
+
+        if sIze == 1:
+            while len(CHUNKS) > 0:
+                RESULTS.extend([(i, method(data)) for i, data in CHUNKS.popleft()])
+
+        else:
+            stopped = dict()
+            num_sent = 0 # the number of chunks sent to slaves.
+            num_reported = 0
+            SEND = list()
+            for core in sLave_ranks: # everyone takes a chunk and a prefetched chunk.
+                stopped[core] = False
+                for _ in range(2):
+                    if stopped[core]:
+                        pass
+                    elif len(CHUNKS) > 0:
+                        SEND.append(cOmm.isend(CHUNKS.popleft(), dest=core, tag=___CHUNK_TAG___))
+                        num_sent += 1
+                    else:
+                        SEND.append(cOmm.isend(None, dest=core, tag=___CHUNK_TAG___))
+                        stopped[core] = True
+
+            status = MPI.Status()
+            while num_reported < num_sent or len(CHUNKS) > 0:
+                if master_works and len(CHUNKS) > 0:
+                    # we do one task and then serve the slaves who have reported.
+                    i, data = CHUNKS[0].pop(0)
+                    RESULTS.append((i, method(data)))
+                    if len(CHUNKS[0]) == 0: CHUNKS.popleft()
+                    while cOmm.Iprobe(source=MPI.ANY_SOURCE, tag=___REPORT_TAG___, status=status):
+                        num_reported, num_sent = ___PRIVATE_serve___(
+                            RESULTS, CHUNKS, stopped, SEND, status.Get_source(), num_reported, num_sent)
+                else:
+                    cOmm.Probe(source=MPI.ANY_SOURCE, tag=___REPORT_TAG___, status=status)
+                    num_reported, num_sent = ___PRIVATE_serve___(
+                        RESULTS, CHUNKS, stopped, SEND, status.Get_source(), num_reported, num_sent)
+
+            for core in sLave_ranks: # slaves have done everything; stop them.
+                if not stopped[core]:
+                    SEND.append(cOmm.isend(None, dest=core, tag=___CHUNK_TAG___))
+            MPI.Request.waitall(SEND)
+
+    else:
+        RESULTS = list()
+        SEND = list()
+        current = cOmm.recv(source=mAster_rank, tag=___CHUNK_TAG___)
+        while current is not None:
+            prefetch = cOmm.irecv(source=mAster_rank, tag=___CHUNK_TAG___)
+            results = [(i, method(data)) for i, data in current]
+            SEND.append(cOmm.isend(results if gather else len(results), dest=mAster_rank, tag=___REPORT_TAG___))
+            RESULTS.extend(results)
+            current = prefetch.wait()
+        MPI.Request.waitall(SEND)
+
+    cOmm.Barrier() # sync all cores.
+
+    if gather:
+        if rAnk == mAster_rank:
+            RESULTS.sort(key=lambda ir: ir[0])
+            return [r for _, r in RESULTS]
+        else:
+            return None
+    else:
+        return [r for _, r in RESULTS]
+
+
+def ___PRIVATE_serve___(RESULTS, CHUNKS, stopped, SEND, core, num_reported, num_sent):
+    """Receive the report of a chunk from `core` and send it a new chunk (or stop it)."""
+    report = cOmm.recv(source=core, tag=___REPORT_TAG___)
+    if isinstance(report, list): # gathered results.
+        RESULTS.extend(report)
+    num_reported += 1
+    if not stopped[core]:
+        if len(CHUNKS) > 0:
+            SEND.append(cOmm.isend(CHUNKS.popleft(), dest=core, tag=___CHUNK_TAG___))
+            num_sent += 1
+        else:
+            SEND.append(cOmm.isend(None, dest=core, tag=___CHUNK_TAG___))
+            stopped[core] = True
+    return num_reported, num_sent
@@ -4,6 +4,7 @@ from root.read.helpers._2dCSCG.exact_solution import ___restore__2dCSCG_ExactSol
 from root.read.helpers._2dCSCG.mesh import ___restore__2dCSCG_Mesh___
 from root.read.helpers._2dCSCG.space import ___restore__2dCSCG_Space___
 from objects.CSCG._2d.master import FormCaller as _2dCSCG_FormCaller
+from root.read.helpers.scatter import ___scatter_region_wise_cochain___
 
 def ___restore__2dCSCG_Form___(parameters, mesh_cache, space_cache):
     assert parameters.pop('type') == '_2dCSCG_Form'
@@ -44,6 +45,7 @@ def ___restore__2dCSCG_Form___(parameters, mesh_cache, space_cache):
         form.TW.func.___DO_set_func_body_as___(ES, ES_variable_name)
         form.TW.___DO_push_all_to_instant___()
 
+    COCHAIN = ___scatter_region_wise_cochain___(COCHAIN, mesh)
     form.cochain.___PRIVATE_do_distribute_region_wise_local_index_grouped_cochain_to_local___(COCHAIN)
 
     return form
\ No newline at end of file
@@ -4,6 +4,7 @@ from objects.CSCG._3d.master import FormCaller as _3dCSCG_FormCaller
 from root.read.helpers._3dCSCG.space import ___restore__3dCSCG_Space___
 from root.read.helpers._3dCSCG.mesh import ___restore__3dCSCG_Mesh___
 from root.read.helpers._3dCSCG.exact_solution import ___restore__3dCSCG_ExactSolution___
+from root.read.helpers.scatter import ___scatter_region_wise_cochain___
 
 
 
@@ -69,6 +70,7 @@ def ___restore__3dCSCG_Form___(parameters, mesh_cache, space_cache):
                 cochain_local[i] = COCHAIN[i]
             form.cochain.local = cochain_local
     elif ___COCHAIN_READ_VERSION___ == 1:
+        COCHAIN = ___scatter_region_wise_cochain___(COCHAIN, mesh)
         form.cochain.___PRIVATE_do_distribute_region_wise_local_index_grouped_cochain_to_local___(COCHAIN)
     else:
         raise Exception()
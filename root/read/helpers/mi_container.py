@@ -0,0 +1,167 @@
+"""
+The chunked `.mi` container.
+
+    | MAGIC (8 bytes) | index offset (8 bytes) | index length (8 bytes) |
+    | chunk 0 | cochain block 0 | chunk 1 | ... | index |
+
+Every saved object is pickled into its own chunk. The region-wise cochain of a form (the
+'region_wise_cochain_local' of its parameters) is not pickled; it is written as a raw block
+(of all element cochains one after another) plus, in the index, the position of each element
+cochain in it.
+
+So the master core reads the (small) index and then only the chunks it needs; element cochains
+are read (through a memory map) only when they are scattered to the cores, see
+`root.read.helpers.scatter`.
+
+Files of the old format (one pickled list or dict) have no MAGIC; we still can read them.
+"""
+import pickle
+from collections.abc import Mapping
+import numpy as np
+
+
+MAGIC = b'\x93MIFEM\x01\x00'
+___PREFIX_LEN___ = len(MAGIC) + 16
+
+
+def ___is_mi_container___(filename):
+    """If the file is a chunked `.mi` container."""
+    with open(filename, 'rb') as inputs:
+        return inputs.read(len(MAGIC)) == MAGIC
+
+
+def ___PRIVATE_split_cochain___(bs):
+    """Take the region-wise cochain out of the parameters of a saved object.
+
+    :return: a tuple of two: the object dict to be pickled and the cochain (or None).
+    """
+    parameters = bs['parameters']
+    if not isinstance(parameters, dict) or 'region_wise_cochain_local' not in parameters:
+        return bs, None
+    RW = parameters['region_wise_cochain_local']
+    if not isinstance(RW, dict) or len(RW) == 0:
+        return bs, None
+    values = [np.asarray(RW[key]) for key in RW]
+    if any([v.dtype.kind not in 'biuf' for v in values]): # not numerical; we just pickle it.
+        return bs, None
+    parameters = dict(parameters)
+    del parameters['region_wise_cochain_local']
+    return {'obj': bs['obj'], 'parameters': parameters}, dict(zip(RW.keys(), values))
+
+
+def ___write_mi_container___(filename, objects, saving_info, single):
+    """Write saved objects (dicts of keys 'obj' and 'parameters') into a chunked container. Only
+    call it in the master core.
+
+    :param filename:
+    :param objects: The list of saved objects.
+    :param saving_info: The tuple of saving information of the objects.
+    :param single: If True, `read` returns the object instead of a tuple of one object.
+    """
+    chunks = list()
+    cochains = list()
+    with open(filename, 'wb') as output:
+        output.write(MAGIC + bytes(16))
+
+        for bs in objects:
+            bs, RW = ___PRIVATE_split_cochain___(bs)
+            data = pickle.dumps(bs, pickle.HIGHEST_PROTOCOL)
+            chunks.append((output.tell(), len(data)))
+            output.write(data)
+
+            if RW is None:
+                cochains.append(None)
+            else:
+                dtype = np.result_type(*RW.values())
+                offset = output.tell()
+                index = dict()
+                start = 0
+                for key in RW:
+                    value = np.ascontiguousarray(RW[key], dtype=dtype)
+                    index[key] = (start, value.shape)
+                    start += value.size
+                    output.write(value.tobytes())
+                cochains.append({'offset': offset, 'dtype': dtype.str, 'size': start, 'index': index})
+
+        INDEX = {'single': single,
+                 'chunks': chunks,
+                 'cochains': cochains,
+                 'saving_info': saving_info}
+        data = pickle.dumps(INDEX, pickle.HIGHEST_PROTOCOL)
+        index_offset = output.tell()
+        output.write(data)
+        output.seek(len(MAGIC))
+        output.write(np.array([index_offset, len(data)], dtype='<u8').tobytes())
+
+
+class MiContainer(object):
+    """Read a chunked `.mi` container lazily. Initializing it only reads the index."""
+    def __init__(self, filename):
+        self._filename_ = filename
+        with open(filename, 'rb') as inputs:
+            prefix = inputs.read(___PREFIX_LEN___)
+            assert prefix[:len(MAGIC)] == MAGIC, f"{filename} is not a chunked .mi container."
+            index_offset, index_length = np.frombuffer(prefix[len(MAGIC):], dtype='<u8')
+            inputs.seek(int(index_offset))
+            INDEX = pickle.loads(inputs.read(int(index_length)))
+        self._single_ = INDEX['single']
+        self._chunks_ = INDEX['chunks']
+        self._cochains_ = INDEX['cochains']
+        self._saving_info_ = INDEX['saving_info']
+
+    @property
+    def single(self):
+        """If the file stores one object saved alone."""
+        return self._single_
+
+    @property
+    def saving_info(self):
+        return self._saving_info_
+
+    def __len__(self):
+        return len(self._chunks_)
+
+    def __getitem__(self, i):
+        """Deserialize the ith object, a dict of keys 'obj' and 'parameters'. A region-wise
+        cochain is given as a `LazyRegionWiseCochain`."""
+        offset, length = self._chunks_[i]
+        with open(self._filename_, 'rb') as inputs:
+            inputs.seek(offset)
+            obj_dict = pickle.loads(inputs.read(length))
+        if self._cochains_[i] is not None:
+            obj_dict['parameters']['region_wise_cochain_local'] = \
+                LazyRegionWiseCochain(self._filename_, self._cochains_[i])
+        return obj_dict
+
+
+class LazyRegionWiseCochain(Mapping):
+    """A region-wise cochain (keys like ``'R:R=|=(0, 1, 0)'``) which is only read, from a memory
+    map, when we ask for the cochain of an element."""
+    def __init__(self, filename, info):
+        self._filename_ = filename
+        self._index_ = info['index']
+        self._dtype_ = np.dtype(info['dtype'])
+        self._offset_ = info['offset']
+        self._size_ = info['size']
+        self._memmap_ = None
+
+    def ___PRIVATE_memmap___(self):
+        if self._memmap_ is None:
+            self._memmap_ = np.memmap(self._filename_, dtype=self._dtype_, mode='r',
+                                      offset=self._offset_, shape=(self._size_,))
+        return self._memmap_
+
+    def __getitem__(self, key):
+        start, shape = self._index_[key]
+        size = int(np.prod(shape))
+        if size == 0: return np.zeros(shape, dtype=self._dtype_)
+        return np.array(self.___PRIVATE_memmap___()[start:start+size]).reshape(shape)
+
+    def __iter__(self):
+        return iter(self._index_)
+
+    def __len__(self):
+        return len(self._index_)
+
+    def __contains__(self, key):
+        return key in self._index_
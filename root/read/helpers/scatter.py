@@ -0,0 +1,24 @@
+
+from root.config.main import cOmm, rAnk, mAster_rank
+
+
+def ___scatter_region_wise_cochain___(RW_COCHAIN, mesh):
+    """Scatter the region-wise cochain (only in the master core, ``None`` in slaves) to the cores
+    according to the element distribution of `mesh`: each core only receives the cochains of its
+    own elements.
+
+    :param RW_COCHAIN: A dict (or a mapping, like a `LazyRegionWiseCochain`) whose keys are like
+        ``'R:R=|=(0, 1, 0)'``.
+    :param mesh:
+    :return: A dict of the region-wise cochains of the local elements.
+    """
+    KEYS = list()
+    for i in mesh.elements:
+        rn, loc_ind = mesh.do.find.region_name_and_local_indices_of_element(i)
+        KEYS.append(rn + '=|=' + str(loc_ind))
+    KEYS = cOmm.gather(KEYS, root=mAster_rank)
+    if rAnk == mAster_rank:
+        SCATTER = [{key: RW_COCHAIN[key] for key in keys} for keys in KEYS]
+    else:
+        SCATTER = None
+    return cOmm.scatter(SCATTER, root=mAster_rank)
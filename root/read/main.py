@@ -1,6 +1,6 @@
 
 
-from root.config.main import cHaining, cOmm
+from root.config.main import cOmm, rAnk, mAster_rank
 
 from root.read.helpers._2dCSCG.mesh import ___restore__2dCSCG_Mesh___
 from root.read.helpers._2dCSCG.space import ___restore__2dCSCG_Space___
@@ -16,6 +16,7 @@ from root.read.helpers.mpRfT2.mesh import ___restore__mpRfT2_Mesh___
 
 
 from root.read.helpers.chain import chain
+from root.read.helpers.mi_container import ___is_mi_container___, MiContainer
 
 ___CACHE_2dCSCG_mesh___ = list() # we only cache the last (ONE) mesh
 ___CACHE_2dCSCG_space___ = list() # we only cache the last (ONE) space
@@ -36,25 +37,39 @@ def read(filename, read_individuals=None):
         If read_individuals is None, we read all objects.
     :return:
     """
-    OBJ = cHaining(chain, filename)
-
-    if isinstance(OBJ,  list): # multiple saving objects: must be a list.
-        if isinstance(OBJ[-1], tuple): # multiple saving objects with saving info:
-                                       # saving info must be in a tuple.
-            save_info_tuple = OBJ[-1]
-            OBJ = OBJ[:-1]
-
-            for info in save_info_tuple:
-                assert info is None or isinstance(info, dict)
-                # saving info for every obj must be None or a dict.
-        else:
-            pass
-    elif isinstance(OBJ, dict): # single saving object: must be a dict.
-        OBJ = [OBJ,]
+    if filename[-3:] != '.mi': filename += '.mi'
+
+    # only the master reads the file; the others receive what they need from the master.
+    if rAnk == mAster_rank:
+        if ___is_mi_container___(filename):
+            # we read the index only; objects are deserialized only when we restore them.
+            OBJ = MiContainer(filename)
+            single = OBJ.single
+        else: # the old format: one pickled list (or dict).
+            single = False
+            OBJ = chain(filename)
+
+            if isinstance(OBJ,  list): # multiple saving objects: must be a list.
+                if isinstance(OBJ[-1], tuple): # multiple saving objects with saving info:
+                                               # saving info must be in a tuple.
+                    save_info_tuple = OBJ[-1]
+                    OBJ = OBJ[:-1]
+
+                    for info in save_info_tuple:
+                        assert info is None or isinstance(info, dict)
+                        # saving info for every obj must be None or a dict.
+                else:
+                    pass
+            elif isinstance(OBJ, dict): # single saving object: must be a dict.
+                OBJ = [OBJ,]
+            else:
+                raise Exception()
+        LEN = len(OBJ)
     else:
-        raise Exception()
+        OBJ, LEN, single = None, None, None
+
+    LEN, single = cOmm.bcast([LEN, single], root=mAster_rank)
 
-    LEN = len(OBJ)
 
     if read_individuals is None:
         read_individuals = [1 for _ in range(LEN)]
@@ -77,10 +92,24 @@ def read(filename, read_individuals=None):
 
     for i in range(LEN):
         if read_individuals[i]:
-            obj_dict = OBJ[i]
-            obj_name = obj_dict.pop('obj')
-            obj_para = obj_dict.pop('parameters')
-            assert len(obj_dict) == 0, "mi file should store a dict of two keys only."
+            if rAnk == mAster_rank:
+                obj_dict = OBJ[i] # for a chunked file, only now we deserialize it.
+                obj_name = obj_dict.pop('obj')
+                obj_para = obj_dict.pop('parameters')
+                assert len(obj_dict) == 0, "mi file should store a dict of two keys only."
+                # the region-wise cochain is not broadcast; it will be scattered to the cores.
+                if isinstance(obj_para, dict) and 'region_wise_cochain_local' in obj_para:
+                    RW_cochain = obj_para.pop('region_wise_cochain_local')
+                    has_RW_cochain = True
+                else:
+                    RW_cochain, has_RW_cochain = None, False
+            else:
+                obj_name, obj_para, RW_cochain, has_RW_cochain = None, None, None, None
+
+            obj_name, obj_para, has_RW_cochain = cOmm.bcast([obj_name, obj_para, has_RW_cochain],
+                                                            root=mAster_rank)
+            if has_RW_cochain:
+                obj_para['region_wise_cochain_local'] = RW_cochain # None in slaves.
 
             # ----------- 3d CSCG objects -----------------------------------------------------
             if obj_name == '_3dCSCG_Mesh':
@@ -142,7 +171,8 @@ def read(filename, read_individuals=None):
 
         objs += (obj,)
         cOmm.barrier()
-        OBJ[i] = None # clean memory.
+        if rAnk == mAster_rank and not isinstance(OBJ, MiContainer):
+            OBJ[i] = None # clean memory.
 
-    if len(objs) == 1: objs = objs[0]
+    if len(objs) == 1 or single: objs = objs[0]
     return objs
\ No newline at end of file
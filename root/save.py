@@ -6,13 +6,15 @@ In this script, we DO NOT use the structure of naming files and folders of the m
 """
 from screws.miscellaneous.timer import check_filename_mi
 from root.config.main import mAster_rank, rAnk, cOmm
-import pickle
+from root.read.helpers.mi_container import ___write_mi_container___
 from root.read.main import read
 
 
 
 def save(obj, filename):
-    """
+    """Save an object or a list (tuple) of objects into a chunked `.mi` file, see
+    `root.read.helpers.mi_container`: each object is an independent chunk and the cochains of forms
+    are stored element by element such that, when reading, every core only reads its own elements.
 
     Parameters
     ----------
@@ -25,25 +27,24 @@ def save(obj, filename):
     """
     filename = check_filename_mi(filename)
     if isinstance(obj, (list, tuple)):
-        _2bs_ = list()
-        _sif_ = tuple()
-        for obj_i in obj:
-            bs = obj_i.___PRIVATE_save___(filename, do_save=False)
-            _2bs_.append(bs)
-
-            sif = obj_i.___PRIVATE_saving_info___()
-            _sif_ += (sif,)
-
-        _2bs_.append(_sif_)
-
-        cOmm.barrier()
-        if rAnk == mAster_rank:
-            with open(filename, 'wb') as output:
-                pickle.dump(_2bs_, output, pickle.HIGHEST_PROTOCOL)
-            output.close()
+        single = False
     else:
-        obj.___PRIVATE_save___(filename, do_save=True)
-
+        single = True
+        obj = [obj,]
+
+    _2bs_ = list()
+    _sif_ = tuple()
+    for obj_i in obj:
+        bs = obj_i.___PRIVATE_save___(filename, do_save=False)
+        _2bs_.append(bs)
+
+        sif = obj_i.___PRIVATE_saving_info___()
+        _sif_ += (sif,)
+
+    cOmm.barrier()
+    if rAnk == mAster_rank:
+        ___write_mi_container___(filename, _2bs_, _sif_, single)
+    cOmm.barrier() # make sure the file is ready for all cores.
 
 
 
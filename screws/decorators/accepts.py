@@ -21,6 +21,7 @@ from screws.decorators.memoize.memoize_2 import memoize2
 from screws.decorators.memoize.memoize_3 import memoize3
 from screws.decorators.memoize.memoize_4 import memoize4
 from screws.decorators.memoize.memoize_5 import memoize5
+from screws.decorators.memoize.memoize_6 import memoize6
 
 
 
@@ -0,0 +1,166 @@
+
+
+
+import functools
+import hashlib
+import weakref
+from collections import OrderedDict
+import numpy as np
+
+
+class BoundedCache(object):
+    """ A least-recently-used cache whose size is bounded by a byte budget.
+
+    Keys are structured (see :meth:`key_of`): ndarrays are represented by their shapes, dtypes and
+    digests of their contents, and objects can provide their own content keys through a
+    ``___cache_key___`` attribute. So we never build long strings of arrays and equal inputs of
+    different objects can share entries.
+
+    Cached ndarrays are made read-only, because they are shared by all callers.
+
+    :param max_bytes: The byte budget. When the cached values take more bytes, the least recently
+        used entries are evicted.
+    :param name: The name of the cache.
+    """
+    def __init__(self, max_bytes=2**28, name='cache'):
+        self._max_bytes_ = max_bytes
+        self._name_ = name
+        self._entries_ = OrderedDict() # key -> (value, nbytes, weak references of the objects in the key)
+        self._bytes_ = 0
+        self._hits_ = 0
+        self._misses_ = 0
+        self._evictions_ = 0
+
+    @property
+    def name(self):
+        return self._name_
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes_
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        assert max_bytes >= 0, f"max_bytes={max_bytes} wrong."
+        self._max_bytes_ = max_bytes
+        self.___PRIVATE_evict___()
+
+    @property
+    def stats(self):
+        """(dict) The statistics: hits, misses, evictions, entries and bytes."""
+        return {'hits': self._hits_, 'misses': self._misses_, 'evictions': self._evictions_,
+                'entries': len(self._entries_), 'bytes': self._bytes_}
+
+    def clear(self):
+        """Remove all entries (but keep the statistics)."""
+        self._entries_.clear()
+        self._bytes_ = 0
+
+    def __len__(self):
+        return len(self._entries_)
+
+    def __contains__(self, key):
+        return key in self._entries_
+
+    def key_of(self, obj, refs=None):
+        """The structured key of `obj`.
+
+        :param obj:
+        :param refs: None or a list; if `obj` has to be keyed by its identity, a weak reference to
+            it is appended to `refs` such that we can find out if the key is outdated.
+        """
+        if isinstance(obj, np.ndarray):
+            if not obj.flags.c_contiguous: obj = np.ascontiguousarray(obj)
+            return ('ndarray', obj.shape, obj.dtype.str, hashlib.blake2b(obj.data, digest_size=16).digest())
+        elif isinstance(obj, (tuple, list)):
+            return (obj.__class__.__name__,) + tuple([self.key_of(_, refs=refs) for _ in obj])
+        elif isinstance(obj, dict):
+            return ('dict',) + tuple([(k, self.key_of(obj[k], refs=refs)) for k in sorted(obj, key=str)])
+        elif obj is None or isinstance(obj, (bool, int, float, complex, str, bytes, np.generic)):
+            return obj
+        elif hasattr(obj, '___cache_key___'):
+            return (obj.__class__.__name__, self.key_of(obj.___cache_key___, refs=refs))
+        else:
+            try:
+                ref = weakref.ref(obj)
+            except TypeError:
+                raise Exception(f"cannot make a cache key for {obj.__class__.__name__}.")
+            if refs is not None: refs.append(ref)
+            return ('id', obj.__class__.__name__, id(obj))
+
+    @staticmethod
+    def ___PRIVATE_freeze___(value):
+        """Make the ndarrays in `value` read-only and count the bytes of `value`."""
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+            return value.nbytes
+        elif isinstance(value, (tuple, list)):
+            return 64 + sum([BoundedCache.___PRIVATE_freeze___(_) for _ in value])
+        elif isinstance(value, dict):
+            return 64 + sum([BoundedCache.___PRIVATE_freeze___(value[k]) for k in value])
+        else:
+            return 64
+
+    def ___PRIVATE_evict___(self):
+        while self._bytes_ > self._max_bytes_ and len(self._entries_) > 0:
+            _, (__, nbytes, ___) = self._entries_.popitem(last=False)
+            self._bytes_ -= nbytes
+            self._evictions_ += 1
+
+    def get(self, key):
+        """Return ``(True, value)`` if `key` is cached, otherwise ``(False, None)``."""
+        if key in self._entries_:
+            value, _, refs = self._entries_[key]
+            if all([ref() is not None for ref in refs]):
+                self._entries_.move_to_end(key)
+                self._hits_ += 1
+                return True, value
+            else: # an object in the key is gone; its id may have been reused.
+                del self._entries_[key]
+                self._bytes_ -= _
+        self._misses_ += 1
+        return False, None
+
+    def put(self, key, value, refs=()):
+        """Cache `value`. If it alone is larger than the budget, it is not cached."""
+        nbytes = self.___PRIVATE_freeze___(value)
+        if key in self._entries_:
+            self._bytes_ -= self._entries_.pop(key)[1]
+        if nbytes > self._max_bytes_:
+            return
+        self._entries_[key] = (value, nbytes, tuple(refs))
+        self._bytes_ += nbytes
+        self.___PRIVATE_evict___()
+
+
+basis_cache = BoundedCache(name='basis')
+
+
+def memoize6(func=None, cache=None):
+    """ Memoize a function or a method in a shared :class:`BoundedCache` (`basis_cache` by default).
+
+    - ``+``: Can be used for frozen object and numpy.ndarray inputs (we key them by digests).
+    - ``+``: kwargs are in the keys.
+    - ``+``: The memory is bounded; least recently used results are evicted.
+    - ``-``: Returned ndarrays are read-only and shared; copy them before changing them.
+
+    Use it as ``@memoize6`` or ``@memoize6(cache=my_cache)``.
+    """
+    if func is None:
+        return functools.partial(memoize6, cache=cache)
+    if cache is None:
+        cache = basis_cache
+
+    @functools.wraps(func)
+    def memoized_func(*args, **kwargs):
+        refs = list()
+        key = (func.__module__, func.__qualname__,
+               cache.key_of(args, refs=refs), cache.key_of(kwargs, refs=refs))
+        found, value = cache.get(key)
+        if not found:
+            value = func(*args, **kwargs)
+            cache.put(key, value, refs=refs)
+        return value
+
+    memoized_func.cache = cache
+    return memoized_func
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Forward-mode automatic differentiation with hyper-dual numpy arrays.
+
+A ``HyperDual`` carries, for every entry, the value and all first and second partial derivatives
+with respect to `n` variables: ``value`` of shape S, ``gradient`` of shape (n,) + S and ``Hessian``
+of shape (n, n) + S. So, evaluating a function of numpy operations once (vectorized over all
+points) with ``HyperDual`` variables gives the value and all first and second derivatives.
+
+Supported are ``+``, ``-``, ``*``, ``/``, ``**`` and the numpy ufuncs in ``___UNIVARIATE___`` (like
+``np.sin``, ``np.exp``, ``np.sqrt``, ...). Other numpy functions (and conversions to float) raise
+``HyperDualNotSupported``, a TypeError.
+"""
+import numpy as np
+
+
+class HyperDualNotSupported(TypeError):
+    """An operation that cannot be done with ``HyperDual``."""
+
+
+def ___univariate___(f, f1, f2):
+    """Make a univariate rule: given the value `u`, return ``(f(u), f'(u), f''(u))``."""
+    def rule(u):
+        return f(u), f1(u), f2(u)
+    return rule
+
+
+def ___tan___(u):
+    t = np.tan(u)
+    return t, 1 + t**2, 2 * t * (1 + t**2)
+
+def ___tanh___(u):
+    t = np.tanh(u)
+    return t, 1 - t**2, -2 * t * (1 - t**2)
+
+def ___exp___(u):
+    e = np.exp(u)
+    return e, e, e
+
+def ___sqrt___(u):
+    s = np.sqrt(u)
+    return s, 0.5 / s, -0.25 / (s * u)
+
+def ___reciprocal___(u):
+    r = 1 / u
+    return r, - r**2, 2 * r**3
+
+
+___UNIVARIATE___ = {
+    np.negative: ___univariate___(np.negative, lambda u: -np.ones_like(u), np.zeros_like),
+    np.positive: ___univariate___(np.positive, np.ones_like, np.zeros_like),
+    np.sin: ___univariate___(np.sin, np.cos, lambda u: -np.sin(u)),
+    np.cos: ___univariate___(np.cos, lambda u: -np.sin(u), lambda u: -np.cos(u)),
+    np.tan: ___tan___,
+    np.arcsin: ___univariate___(np.arcsin, lambda u: 1 / np.sqrt(1 - u**2), lambda u: u / (1 - u**2)**1.5),
+    np.arccos: ___univariate___(np.arccos, lambda u: -1 / np.sqrt(1 - u**2), lambda u: -u / (1 - u**2)**1.5),
+    np.arctan: ___univariate___(np.arctan, lambda u: 1 / (1 + u**2), lambda u: -2 * u / (1 + u**2)**2),
+    np.sinh: ___univariate___(np.sinh, np.cosh, np.sinh),
+    np.cosh: ___univariate___(np.cosh, np.sinh, np.cosh),
+    np.tanh: ___tanh___,
+    np.exp: ___exp___,
+    np.log: ___univariate___(np.log, lambda u: 1 / u, lambda u: -1 / u**2),
+    np.log10: ___univariate___(np.log10, lambda u: 1 / (u * np.log(10)), lambda u: -1 / (u**2 * np.log(10))),
+    np.sqrt: ___sqrt___,
+    np.square: ___univariate___(np.square, lambda u: 2 * u, lambda u: 2 * np.ones_like(u)),
+    np.absolute: ___univariate___(np.absolute, np.sign, np.zeros_like),
+    np.reciprocal: ___reciprocal___,
+}
+
+
+class HyperDual(object):
+    """
+    :param value: ndarray of shape S.
+    :param gradient: ndarray of shape (n,) + S.
+    :param Hessian: ndarray of shape (n, n) + S.
+    """
+    __array_priority__ = 100
+
+    def __init__(self, value, gradient, Hessian):
+        self.value = value
+        self.gradient = gradient
+        self.Hessian = Hessian
+
+    @classmethod
+    def variables(cls, *values):
+        """The independent variables of given values; they are broadcast to one shape.
+
+        :return: A tuple of HyperDual: the ith is seeded to have derivative 1 in the ith direction.
+        """
+        n = len(values)
+        shape = np.broadcast(*values).shape if n > 1 else np.shape(values[0])
+        VARIABLES = list()
+        for i, value in enumerate(values):
+            value = np.array(np.broadcast_to(value, shape), dtype=float)
+            gradient = np.zeros((n,) + shape)
+            gradient[i] = 1
+            VARIABLES.append(cls(value, gradient, np.zeros((n, n) + shape)))
+        return tuple(VARIABLES)
+
+    @property
+    def shape(self):
+        return np.shape(self.value)
+
+    @property
+    def ndim(self):
+        return np.ndim(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return f"<HyperDual of shape {self.shape} @{id(self)}>"
+
+    def ___PRIVATE_expand___(self, ndim):
+        """The same HyperDual but with the values of (at least) `ndim` dimensions, such that it
+        broadcasts (in the derivatives as well) with arrays of `ndim` dimensions."""
+        extra = ndim - self.ndim
+        if extra <= 0: return self
+        n = len(self.gradient)
+        shape = (1,) * extra + self.shape
+        return HyperDual(np.reshape(self.value, shape), np.reshape(self.gradient, (n,) + shape),
+                         np.reshape(self.Hessian, (n, n) + shape))
+
+    # ------ the chain rules --------------------------------------------------------------------
+    def ___PRIVATE_chain___(self, f0, f1, f2):
+        """The composition ``f(self)`` given the value, the first and the second derivatives of
+        ``f`` at ``self.value``."""
+        g = self.gradient
+        return HyperDual(f0, f1 * g, f1 * self.Hessian + f2 * (g[:, np.newaxis] * g[np.newaxis, :]))
+
+    def ___PRIVATE_align___(self, other):
+        """Make `self` and `other` (a HyperDual or a constant) of the same number of dimensions."""
+        if isinstance(other, HyperDual):
+            ndim = max(self.ndim, other.ndim)
+            return self.___PRIVATE_expand___(ndim), other.___PRIVATE_expand___(ndim)
+        else:
+            other = np.asarray(other)
+            return self.___PRIVATE_expand___(other.ndim), other
+
+    def ___PRIVATE_add___(self, other):
+        self, other = self.___PRIVATE_align___(other)
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value + other.value, self.gradient + other.gradient,
+                             self.Hessian + other.Hessian)
+        else:
+            value = self.value + other
+            return HyperDual(value, np.broadcast_to(self.gradient, self.gradient.shape[:1] + value.shape),
+                             np.broadcast_to(self.Hessian, self.Hessian.shape[:2] + value.shape))
+
+    def ___PRIVATE_mul___(self, other):
+        self, other = self.___PRIVATE_align___(other)
+        if isinstance(other, HyperDual):
+            a, b = self, other
+            ga, gb = a.gradient, b.gradient
+            return HyperDual(a.value * b.value,
+                             ga * b.value + a.value * gb,
+                             a.Hessian * b.value + a.value * b.Hessian
+                             + ga[:, np.newaxis] * gb[np.newaxis, :] + gb[:, np.newaxis] * ga[np.newaxis, :])
+        else:
+            return HyperDual(self.value * other, self.gradient * other, self.Hessian * other)
+
+    def ___PRIVATE_power___(self, c):
+        """``self ** c`` for a constant `c`."""
+        if np.ndim(c) == 0 and c in (0, 1): # avoid 0 * inf at zero values.
+            return self if c == 1 else self * 0 + 1
+        elif np.all(np.equal(c, 2)):
+            return self.___PRIVATE_chain___(self.value**2, 2 * self.value, 2 * np.ones_like(self.value))
+        u = self.value
+        return self.___PRIVATE_chain___(u**c, c * u**(c - 1), c * (c - 1) * u**(c - 2))
+
+    @staticmethod
+    def ___PRIVATE_pow___(a, b):
+        if not isinstance(b, HyperDual):
+            return a.___PRIVATE_power___(b)
+        else: # a ** b = exp(b * log(a))
+            return np.exp(b * np.log(a))
+
+    # ------ arithmetic -----------------------------------------------------------------------------
+    def __add__(self, other):
+        return self.___PRIVATE_add___(other)
+
+    def __radd__(self, other):
+        return self.___PRIVATE_add___(other)
+
+    def __sub__(self, other):
+        return self.___PRIVATE_add___(-other)
+
+    def __rsub__(self, other):
+        return (-self).___PRIVATE_add___(other)
+
+    def __mul__(self, other):
+        return self.___PRIVATE_mul___(other)
+
+    def __rmul__(self, other):
+        return self.___PRIVATE_mul___(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, HyperDual):
+            return self.___PRIVATE_mul___(np.reciprocal(other))
+        else:
+            return self.___PRIVATE_mul___(1 / np.asarray(other, dtype=float))
+
+    def __rtruediv__(self, other):
+        return np.reciprocal(self).___PRIVATE_mul___(other)
+
+    def __pow__(self, other):
+        return self.___PRIVATE_pow___(self, other)
+
+    def __rpow__(self, other):
+        return np.exp(self * np.log(other))
+
+    def __neg__(self):
+        return HyperDual(-self.value, -self.gradient, -self.Hessian)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __float__(self):
+        raise HyperDualNotSupported(f"a HyperDual cannot be converted to float.")
+
+    # comparisons only look at the values.
+    def __lt__(self, other):
+        return self.value < getattr(other, 'value', other)
+
+    def __le__(self, other):
+        return self.value <= getattr(other, 'value', other)
+
+    def __gt__(self, other):
+        return self.value > getattr(other, 'value', other)
+
+    def __ge__(self, other):
+        return self.value >= getattr(other, 'value', other)
+
+    # ------ numpy ------------------------------------------------------------------------------------
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or 'out' in kwargs:
+            raise HyperDualNotSupported(f"{ufunc.__name__}.{method} is not supported by HyperDual.")
+        if ufunc in ___UNIVARIATE___:
+            u = inputs[0]
+            return u.___PRIVATE_chain___(*___UNIVARIATE___[ufunc](u.value))
+        elif ufunc is np.add:
+            return inputs[0] + inputs[1] if isinstance(inputs[0], HyperDual) else inputs[1] + inputs[0]
+        elif ufunc is np.subtract:
+            return inputs[0] - inputs[1] if isinstance(inputs[0], HyperDual) else inputs[1].__rsub__(inputs[0])
+        elif ufunc is np.multiply:
+            return inputs[0] * inputs[1] if isinstance(inputs[0], HyperDual) else inputs[1] * inputs[0]
+        elif ufunc in (np.true_divide, np.divide):
+            return inputs[0] / inputs[1] if isinstance(inputs[0], HyperDual) else inputs[1].__rtruediv__(inputs[0])
+        elif ufunc is np.power:
+            return inputs[0] ** inputs[1] if isinstance(inputs[0], HyperDual) else inputs[1].__rpow__(inputs[0])
+        else:
+            raise HyperDualNotSupported(f"{ufunc.__name__} is not supported by HyperDual.")
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.shape:
+            return self.shape
+        elif func is np.ndim:
+            return self.ndim
+        elif func in (np.zeros_like, np.ones_like):
+            return func(self.value, *args[1:], **kwargs)
+        else:
+            raise HyperDualNotSupported(f"{func.__name__} is not supported by HyperDual.")
@@ -0,0 +1,144 @@
+import sys
+if './' not in sys.path: sys.path.append('./')
+
+import warnings
+from types import MethodType
+import numpy as np
+from screws.freeze.main import FrozenOnly
+from screws.decorators.memoize.memoize_6 import BoundedCache
+from screws.numerical.automatic_differentiation.hyper_dual import HyperDual, HyperDualNotSupported
+from screws.warnings.automatic_differentiation import AutomaticDifferentiationWarning
+from screws.numerical.time_plus_3d_space.partial_derivative_as_functions import \
+    NumericalPartialDerivative_txyz_Functions
+
+
+___TXYZ___ = 'txyz'
+
+# The value, gradient and Hessian of functions at (t, points); shared by all
+# `AutomaticPartialDerivative_txyz_Functions`, so all derivatives of a function at the same
+# points (in a time step) come from one evaluation.
+jet_cache = BoundedCache(max_bytes=2**27, name='automatic differentiation')
+
+
+class AutomaticPartialDerivative_txyz_Functions(FrozenOnly):
+    """Like the NumericalPartialDerivative_txyz_Functions class but the partial derivatives are
+    computed by forward-mode automatic differentiation (see
+    ``screws.numerical.automatic_differentiation.hyper_dual``): one vectorized evaluation of the
+    function gives its value and all first and second partial derivatives, and they are cached.
+
+    So the partial derivatives are exact (up to round-off). If the function cannot be evaluated
+    with hyper-dual inputs (it uses numpy functions that are not supported), we fall back to the
+    numerical partial derivatives (with an AutomaticDifferentiationWarning). Other errors of the
+    function are raised.
+    """
+    def __init__(self, func):
+        self._NPDf_ = NumericalPartialDerivative_txyz_Functions(func) # it checks `func`.
+        self._func_ = func
+        if isinstance(func, MethodType): # bound methods are new objects every time.
+            self._identity_ = (func.__self__, func.__func__)
+        else:
+            self._identity_ = (func,)
+        self._freeze_self_()
+
+    def __call__(self, p_):
+        """partial func / partial _? `p_` be 't', 'x', 'y' or 'z', or two of them, like 'xx' or
+        'xy', for the second partial derivatives."""
+        assert isinstance(p_, str) and len(p_) in (1, 2) and all([_ in ___TXYZ___ for _ in p_]), \
+            f"partial_{p_} is wrong, should be t, x, y or z, or two of them."
+        if len(p_) == 1:
+            i = ___TXYZ___.index(p_)
+            def partial(t, x, y, z):
+                return self.___PRIVATE_derivative___((i,), t, x, y, z)
+        else:
+            i, j = ___TXYZ___.index(p_[0]), ___TXYZ___.index(p_[1])
+            def partial(t, x, y, z):
+                return self.___PRIVATE_derivative___((i, j), t, x, y, z)
+        return partial
+
+    def jet(self, t, x, y, z):
+        """The value, gradient (of shape (4,) + S) and Hessian (of shape (4, 4) + S) of the function
+        at (t, x, y, z); S is the broadcast shape of x, y and z. They are cached and read-only.
+
+        :return: A tuple of 3 ndarrays, or None if the function does not work with hyper-dual
+            inputs.
+        """
+        refs = list()
+        key = (jet_cache.key_of(self._identity_, refs=refs), jet_cache.key_of(t),
+               jet_cache.key_of((np.asarray(x), np.asarray(y), np.asarray(z))))
+        found, JET = jet_cache.get(key)
+        if not found:
+            T, X, Y, Z = HyperDual.variables(t, x, y, z)
+            try:
+                F = self._func_(T, X, Y, Z)
+            except HyperDualNotSupported as e:
+                warnings.warn(f"{getattr(self._func_, '__qualname__', self._func_)} uses numerical "
+                              f"partial derivatives: {e}", AutomaticDifferentiationWarning)
+                F = None
+            if F is None:
+                JET = None
+            elif isinstance(F, HyperDual):
+                shape = T.shape
+                JET = (np.array(np.broadcast_to(F.value, shape)),
+                       np.array(np.broadcast_to(F.gradient, (4,) + shape)),
+                       np.array(np.broadcast_to(F.Hessian, (4, 4) + shape)))
+            else: # a constant.
+                shape = T.shape
+                JET = (np.array(np.broadcast_to(F, shape), dtype=float),
+                       np.zeros((4,) + shape), np.zeros((4, 4) + shape))
+            jet_cache.put(key, JET, refs=refs)
+        return JET
+
+    def ___PRIVATE_derivative___(self, ij, t, x, y, z):
+        JET = self.jet(t, x, y, z)
+        if JET is None: # use the numerical derivatives.
+            d = [___TXYZ___[_] for _ in ij]
+            if len(d) == 1:
+                return self._NPDf_(d[0])(t, x, y, z)
+            else:
+                return NumericalPartialDerivative_txyz_Functions(self._NPDf_(d[0]))(d[1])(t, x, y, z)
+        if len(ij) == 1:
+            return np.array(JET[1][ij[0]])
+        else:
+            return np.array(JET[2][ij[0], ij[1]])
+
+
+
+def automatic_second_partial(es, base, f, f_d, d):
+    """The function of the partial derivative of ``f_d`` (the partial derivative of ``f`` in
+    direction `d`) in direction `d`, for an exact solution `es`.
+
+    If ``f_d`` is not given by the exact solution (the class of `es` does not override it of
+    `base`), it is the automatic second derivative of ``f``; otherwise it is the automatic first
+    derivative of the given ``f_d``.
+
+    :param es: The exact solution (status).
+    :param base: The base class of `es` where ``f_d`` is computed from ``f``.
+    :param str f: The name of the function, like 'phi' or 'u'.
+    :param str f_d: The name of its partial derivative, like 'u' or 'u_x'.
+    :param str d: The direction, 't', 'x', 'y' or 'z'.
+    """
+    if getattr(es.__class__, f_d) is getattr(base, f_d):
+        return AutomaticPartialDerivative_txyz_Functions(getattr(es, f))(d + d)
+    else:
+        return AutomaticPartialDerivative_txyz_Functions(getattr(es, f_d))(d)
+
+
+
+
+if __name__ == '__main__':
+    # mpiexec -n 6 python screws\numerical\time_plus_3d_space\automatic_partial_derivative_as_functions.py
+
+    def func(t, x, y, z): return np.sin(np.pi*x) * np.sin(np.pi*y) * np.sin(np.pi*z) * t
+
+    def Px(t, x, y, z): return np.pi*np.cos(np.pi*x) * np.sin(np.pi*y) * np.sin(np.pi*z) * t
+    def Pxy(t, x, y, z): return np.pi**2*np.cos(np.pi*x) * np.cos(np.pi*y) * np.sin(np.pi*z) * t
+
+    t = 5
+    x = np.random.rand(11, 12, 13)
+    y = np.random.rand(11, 12, 13)
+    z = np.random.rand(11, 12, 13)
+
+    APD4F = AutomaticPartialDerivative_txyz_Functions(func)
+
+    np.testing.assert_array_almost_equal(APD4F('x')(t, x, y, z), Px(t, x, y, z))
+    np.testing.assert_array_almost_equal(APD4F('xy')(t, x, y, z), Pxy(t, x, y, z))
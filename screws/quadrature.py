@@ -11,6 +11,7 @@ import numpy as np
 from functools import partial
 from scipy.special import legendre, roots_legendre
 from screws.freeze.base import FrozenOnly
+from screws.decorators.memoize.memoize_6 import memoize6
 
 
 
@@ -99,14 +100,24 @@ class Quadrature(FrozenOnly):
         """(Tuple) ``quad[0]`` are the nodes, ``quad[1]`` are the weights."""
         if self._quad_ is None:
             if self.ndim == 1:
-                self._quad_ = getattr(self, '___PRIVATE_compute_'+self.category[0]+'___')(self.p[0])
+                self._quad_ = self.___PRIVATE_compute___(self.category[0], int(self.p[0]))
             else:
                 self._quad_ = ([], [])
                 for i in range(self.ndim):
-                    nodes, weights = getattr(self, '___PRIVATE_compute_'+self.category[i]+'___')(self.p[i])
+                    nodes, weights = self.___PRIVATE_compute___(self.category[i], int(self.p[i]))
                     self._quad_[0].append(nodes)
                     self._quad_[1].append(weights)
         return self._quad_
+
+    @property
+    def ___cache_key___(self):
+        """1d quadrature nodes and weights do not depend on the instance, see ``___PRIVATE_compute___``."""
+        return None
+
+    @memoize6
+    def ___PRIVATE_compute___(self, category, p):
+        """1d quadrature nodes and weights; cached in the (shared) basis cache."""
+        return getattr(self, '___PRIVATE_compute_'+category+'___')(p)
         
     @property
     def quad_ndim(self):
@@ -0,0 +1,8 @@
+"""
+"""
+
+
+
+
+class AutomaticDifferentiationWarning(UserWarning, ValueError):
+    pass
@@ -24,6 +24,7 @@ class ___GM_ADJUST___(FrozenOnly):
         if self._gm_.mtype != 'lil':
             self._gm_._M_ = self._gm_._M_.tolil() # this will
         self._gm_._M_[r, :] = 0
+        self._gm_._distributed_ = None
 
     def ___PRIVATE_set_value___(self, i, j, value):
         """
@@ -41,4 +42,5 @@ class ___GM_ADJUST___(FrozenOnly):
             self._gm_._M_[i, j] = value
         else:
             self._gm_._M_[i, j] = 0
+        self._gm_._distributed_ = None
     # -------------------------- ABOVE -------------------------------------------------------------
\ No newline at end of file
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""A GlobalMatrix whose rows are distributed over the cores such that each row is owned by exactly
+one core (see ``___RowDistribution___``).
+
+The owned rows are split into two blocks:
+
+    - the local-diagonal block: the columns of the owned rows,
+    - the off-diagonal block: the columns of the halo rows (owned by other cores).
+
+``A @ x`` then posts non-blocking sends and receives of the halo entries, multiplies the
+local-diagonal block while the messages are in flight, and finally adds the off-diagonal block
+times the received halo.
+"""
+from screws.freeze.main import FrozenOnly
+from scipy import sparse as spspa
+from root.config.main import rAnk, cOmm, np, MPI
+from tools.linear_algebra.data_structures.global_matrix.helpers.row_distribution import ___RowDistribution___
+
+
+
+class DistributedGlobalMatrix(FrozenOnly):
+    """
+
+    :param GM: A square GlobalMatrix or the local scipy sparse matrix of it. It is collective.
+    """
+    def __init__(self, GM):
+        M = GM.M if GM.__class__.__name__ == 'GlobalMatrix' else GM
+        assert spspa.issparse(M), "I need a GlobalMatrix or a scipy sparse matrix."
+        RD = ___RowDistribution___(M)
+        n = len(RD.owned)
+        A = RD.A.tocsc()
+        self._diagonal_block_ = A[:, :n].tocsr()
+        self._off_diagonal_block_ = A[:, n:].tocsr()
+        del A
+        self._RD_ = RD
+        self._halo_values_ = np.empty(len(RD.halo))
+        self._send_buffers_ = [np.empty(len(indices)) for _, indices in RD.send_pattern]
+        self._freeze_self_()
+
+    @property
+    def GLOBAL_shape(self):
+        return self._RD_.GLOBAL_shape
+
+    @property
+    def shape(self):
+        """The local shape: (amount of owned rows, amount of owned rows)."""
+        return self._diagonal_block_.shape
+
+    @property
+    def owned(self):
+        """(1d-array) The sorted (global) rows owned by this core."""
+        return self._RD_.owned
+
+    @property
+    def halo(self):
+        """(1d-array) The rows owned by other cores but needed in this core for ``A @ x``."""
+        return self._RD_.halo
+
+    @property
+    def diagonal_block(self):
+        """The owned rows and the owned columns (locally numbered) of the matrix."""
+        return self._diagonal_block_
+
+    @property
+    def off_diagonal_block(self):
+        """The owned rows and the halo columns (locally numbered) of the matrix."""
+        return self._off_diagonal_block_
+
+    def __matmul__(self, x):
+        """``A @ x``. It is collective.
+
+        :param x: (1d-array) The values of the owned rows.
+        :return: (1d-array) The values of the owned rows.
+        """
+        RD = self._RD_
+        halo = self._halo_values_
+        requests = list()
+        for core, start, end in RD.recv_pattern:
+            requests.append(cOmm.Irecv(halo[start:end], source=core, tag=core))
+        for (core, indices), buffer in zip(RD.send_pattern, self._send_buffers_):
+            np.take(x, indices, out=buffer)
+            requests.append(cOmm.Isend(buffer, dest=core, tag=rAnk))
+
+        y = self._diagonal_block_ @ x # overlaps with the communication.
+
+        MPI.Request.Waitall(requests)
+        if len(halo) > 0:
+            y += self._off_diagonal_block_ @ halo
+        return y
+
+    def owners_of(self, rows):
+        """Find the owners of (sorted, global) rows. It is collective.
+
+        :return: (1d-array) the owners.
+        """
+        return self._RD_.owners_of(rows)
+
+    def distribute(self, V):
+        """Distribute a GlobalVector (or its local csc_matrix) to the owners. It is collective.
+
+        :return: (1d-array) The values of the owned rows.
+        """
+        if V.__class__.__name__ == 'GlobalVector': V = V.V
+        return self._RD_.distribute(V)
+
+    def dot(self, u, v):
+        """The global dot product of two vectors of owned values. It is collective."""
+        return self._RD_.dot(u, v)
+
+    def gather(self, x):
+        """Make the full vector from the owned values in all cores. It is collective.
+
+        :return: (1d-array) of global length.
+        """
+        return self._RD_.gather(x)
@@ -9,12 +9,19 @@ class ___GM_DO___(FrozenOnly):
         self._gm_ = gm
         self._freeze_self_()
 
-    def claim_distribution_pattern(self):
+    def claim_distribution_pattern(self, distributed=False):
         """
         We parse the structure of M and classify the global matrix into 'row', 'column' or False.
 
+        :param distributed: If True, we also make the row-distributed version of the matrix (see
+            ``GlobalMatrix.distributed``): the rows are partitioned over the cores, split into the
+            local-diagonal and off-diagonal blocks, and the halo communication pattern is computed.
         :return:
         """
+        if distributed:
+            self._gm_._distributed_ = None
+            _ = self._gm_.distributed
+
         IS_row_major = self._gm_.___PRIVATE_check_row_major___()
         if IS_row_major:
             self._gm_.IS.regularly_distributed = 'row'
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Distribute the rows of a (square) GlobalMatrix over the cores such that each row is owned by
+exactly one core.
+
+A GlobalMatrix is the sum of the local matrices in all cores. If the GlobalMatrix is assembled from
+an EWC matrix, the non-empty rows of the local matrix in a core are the dofs of the local mesh
+elements. We let a row be owned by the lowest core having it, so the row partition follows the
+element distribution of the gathering matrices.
+
+Nothing of global length is stored in any core. To find the owners of rows, we use a directory:
+core #d stores the owners of rows in ``range(d*B, (d+1)*B)`` where ``B = GLOBAL_shape[0] // sIze + 1``.
+"""
+from screws.freeze.main import FrozenOnly
+from scipy import sparse as spspa
+from root.config.main import rAnk, sIze, cOmm, np, MPI
+
+
+
+class ___RowDistribution___(FrozenOnly):
+    """
+
+    :param M: The local (scipy sparse) matrix of a square GlobalMatrix.
+    """
+    def __init__(self, M):
+        N = M.shape[0]
+        assert M.shape[0] == M.shape[1], f"I need a square matrix, now its shape is {M.shape}."
+        M = M.tocsr()
+        M.sum_duplicates()
+        self._N_ = N
+        self._B_ = N // sIze + 1
+
+        # ----- the directory: owners of rows in range(rAnk*B, (rAnk+1)*B) -----------------------
+        local_rows = np.flatnonzero(np.diff(M.indptr))
+        received = cOmm.alltoall(self.___PRIVATE_split_by_directory___(local_rows))
+        lo = rAnk * self._B_
+        hi = min(lo + self._B_, N)
+        directory = np.full(max(hi - lo, 0), sIze, dtype=int)
+        for core, rows in enumerate(received):
+            directory[rows - lo] = np.minimum(directory[rows - lo], core)
+        directory[directory == sIze] = rAnk # globally empty rows, let the directory core own them.
+        self._directory_ = directory
+
+        to_send = [np.flatnonzero(directory == core) + lo for core in range(sIze)]
+        self._owned_ = np.sort(np.concatenate(cOmm.alltoall(to_send)))
+
+        # ------ collect the rows that I own from all cores ----------------------------------------
+        A = self.___PRIVATE_collect_rows___(M, local_rows)
+
+        # ------- the halo pattern -----------------------------------------------------------------
+        columns = np.unique(A.indices)
+        is_owned = self.___PRIVATE_is_owned___(columns)
+        halo = columns[~is_owned]
+        owners = self.owners_of(halo)
+        order = np.lexsort((halo, owners))
+        halo = halo[order]
+        owners = owners[order]
+
+        recv_cores, recv_counts = np.unique(owners, return_counts=True)
+        recv_lists = [halo[owners == core] for core in range(sIze)]
+        send_lists = cOmm.alltoall(recv_lists) # which of my rows the other cores need.
+
+        self._halo_ = halo
+        self._recv_ = list()
+        start = 0
+        for core, count in zip(recv_cores, recv_counts):
+            self._recv_.append((int(core), start, start + int(count)))
+            start += int(count)
+        self._send_ = [(core, np.searchsorted(self._owned_, rows))
+                       for core, rows in enumerate(send_lists) if len(rows) > 0]
+
+        # ------- renumber the columns: owned columns first, then the halo columns -----------------
+        # `columns[~is_owned]` is the halo before being ordered by the owners.
+        local_columns = np.empty(len(columns), dtype=int)
+        local_columns[is_owned] = np.searchsorted(self._owned_, columns[is_owned])
+        local_columns[~is_owned] = len(self._owned_) + np.argsort(order)
+        A = spspa.csr_matrix((A.data, local_columns[np.searchsorted(columns, A.indices)], A.indptr),
+                             shape=(len(self._owned_), len(self._owned_) + len(halo)))
+        self._A_ = A
+        self._freeze_self_()
+
+    @property
+    def GLOBAL_shape(self):
+        return self._N_, self._N_
+
+    @property
+    def owned(self):
+        """(1d-array) The sorted rows owned by this core."""
+        return self._owned_
+
+    @property
+    def halo(self):
+        """(1d-array) The rows owned by other cores but needed in this core for ``A @ x``."""
+        return self._halo_
+
+    @property
+    def recv_pattern(self):
+        """A list of ``(core, start, end)``: we receive ``halo[start:end]`` from ``core``."""
+        return self._recv_
+
+    @property
+    def send_pattern(self):
+        """A list of ``(core, indices)``: we send ``x[indices]`` to ``core`` where ``x`` is the
+        values of the owned rows."""
+        return self._send_
+
+    @property
+    def A(self):
+        """The owned rows of the matrix. Columns are locally numbered: the owned ones first and
+        then the halo ones."""
+        return self._A_
+
+    def ___PRIVATE_split_by_directory___(self, rows):
+        """Split sorted rows into a list of ``sIze`` arrays according to the directory cores."""
+        cuts = np.searchsorted(rows, np.arange(1, sIze) * self._B_)
+        return np.split(rows, cuts)
+
+    def ___PRIVATE_is_owned___(self, rows):
+        """Which of the (sorted) rows are owned by me?"""
+        owned = self._owned_
+        if len(owned) == 0: return np.zeros(len(rows), dtype=bool)
+        where = np.searchsorted(owned, rows)
+        where[where == len(owned)] = 0
+        return owned[where] == rows
+
+    def owners_of(self, rows):
+        """Find the owners of rows. It is collective: all cores must call it.
+
+        :param rows: (1d-array) sorted rows.
+        :return: (1d-array) the owners.
+        """
+        queries = cOmm.alltoall(self.___PRIVATE_split_by_directory___(rows))
+        lo = rAnk * self._B_
+        answers = cOmm.alltoall([self._directory_[q - lo] for q in queries])
+        if len(rows) == 0:
+            return np.array([], dtype=int)
+        else:
+            return np.concatenate(answers).astype(int)
+
+    def ___PRIVATE_collect_rows___(self, M, local_rows):
+        """Send local rows to their owners and sum them up there."""
+        owners = self.owners_of(local_rows)
+        to_send = list()
+        for core in range(sIze):
+            rows = local_rows[owners == core]
+            to_send.append((rows, M[rows]))
+        received = cOmm.alltoall(to_send)
+        del to_send
+
+        ROW, COL, DAT = list(), list(), list()
+        for rows, Mr in received:
+            Mr = Mr.tocoo()
+            ROW.append(np.searchsorted(self._owned_, rows)[Mr.row])
+            COL.append(Mr.col)
+            DAT.append(Mr.data)
+        return spspa.csr_matrix((np.concatenate(DAT), (np.concatenate(ROW), np.concatenate(COL))),
+                                shape=(len(self._owned_), self._N_))
+
+    def distribute(self, V):
+        """Distribute a vector (the local part of a GlobalVector, entries may be split into
+        parts and stored in multiple cores) to the owners. It is collective.
+
+        :param V: csc_matrix of shape (x, 1).
+        :return: (1d-array) the values of the owned rows.
+        """
+        V = spspa.csc_matrix(V)
+        V.sum_duplicates()
+        indices, data = V.indices, V.data
+        owners = self.owners_of(indices)
+        received = cOmm.alltoall([(indices[owners == core], data[owners == core])
+                                  for core in range(sIze)])
+        v = np.zeros(len(self._owned_))
+        for indices, data in received:
+            np.add.at(v, np.searchsorted(self._owned_, indices), data)
+        return v
+
+    def dot(self, u, v):
+        """The global dot product of two vectors of owned values. It is collective."""
+        return cOmm.allreduce(np.dot(u, v), op=MPI.SUM)
+
+    def gather(self, x):
+        """Make a full vector of the values of the owned rows in all cores. It is collective.
+
+        :return: (1d-array) of global length.
+        """
+        OWNED = cOmm.allgather(self._owned_)
+        X = cOmm.allgather(x)
+        full = np.zeros(self._N_)
+        for owned, xi in zip(OWNED, X):
+            full[owned] = xi
+        return full
@@ -18,6 +18,7 @@ from tools.linear_algebra.data_structures.global_matrix.undirected_graph import
 from tools.linear_algebra.data_structures.global_matrix.adjust import ___GM_ADJUST___
 from tools.linear_algebra.data_structures.global_matrix.condition import ___GM_CONDITION___
 from tools.linear_algebra.data_structures.global_matrix.helpers.split_A import ___split_A___
+from tools.linear_algebra.data_structures.global_matrix.distributed import DistributedGlobalMatrix
 
 from tools.linear_algebra.data_structures.vectors.GLOBAL.main import GlobalVector
 from tools.linear_algebra.data_structures.vectors.locally_full.main import LocallyFullVector
@@ -56,6 +57,7 @@ class GlobalMatrix(FrozenOnly):
             for i, sp in enumerate(SHAPE):
                 assert sp == SHAPE[0], f"shape in core {i} is different from shape in core 0."
         #-----------------------------------------------------------------------------------------
+        self._distributed_ = None
         self._visualize_ = ___GM_VISUALIZE___(self)
         self._condition_ = ___GM_CONDITION___(self)
         self._undirected_graph_ = ___GM_Undirected_Graph___(self)
@@ -125,6 +127,16 @@ class GlobalMatrix(FrozenOnly):
         _shared_rows_ = self.___PRIVATE_parse_distributions___(what='shared_rows')
         return _shared_rows_
 
+    @property
+    def distributed(self):
+        """The row-distributed version of me (a ``DistributedGlobalMatrix``) for fast ``A @ x`` in
+        iterative solvers. We make it at the first call (it is then collective) or at
+        ``do.claim_distribution_pattern(distributed=True)`` and keep it.
+        """
+        if self._distributed_ is None:
+            self._distributed_ = DistributedGlobalMatrix(self)
+        return self._distributed_
+
     @property
     def T(self):
         """Transpose."""
@@ -339,6 +351,7 @@ class GlobalMatrix(FrozenOnly):
         assert splitting_factor > 0, f"splitting_factor={splitting_factor} wrong, must be > 0."
 
         if clean_local:
+            self._distributed_ = None
             if self.GLOBAL_approx_nnz < splitting_factor:
                 M = cOmm.gather(self.M, root=core)
                 if rAnk == core:
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """The assembler for the EWC sparse matrix."""
+import hashlib
 import numpy as np
 from scipy.sparse import csr_matrix
 from numpy import diff
 from screws.freeze.base import FrozenOnly
 from tools.linear_algebra.data_structures.global_matrix.main import GlobalMatrix
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.assembly_plan import \
+    EWC_SparseMatrix_AssemblyPlan
 
 
 
@@ -28,6 +31,8 @@ class EWC_SparseMatrix_Assembler(FrozenOnly):
 
         if routine is None:
             A = self.___default_routine___()
+        elif routine == 'vectorized':
+            A = self.___vectorized_routine___()
         else:
             raise Exception(f"Assembling routine = {routine} is wrong!")
 
@@ -100,45 +105,155 @@ class EWC_SparseMatrix_Assembler(FrozenOnly):
 
         # Cache on: sparsity don't change, entries could still change ------------------------------
         else:
-            if self._cache_ is None or self._cache_[0] != 'default':
-                ROW = list()
-                COL = list()
-                DAT = list()
-
-                for i in self._MAT_: # go through all local sparse matrices.
-                    Mi = self._MAT_[i] # get the local sparse matrix
-                    indices = Mi.indices
-                    indptr = Mi.indptr
-                    data = Mi.data
-                    nums = diff(indptr)
-                    if Mi.__class__.__name__ == 'csc_matrix':
-                        for j, num in enumerate(nums):
-                            idx = indices[indptr[j]:indptr[j+1]]
-                            ROW.extend(GI[i][idx])
-                            COL.extend([GJ[i][j],]*num)
-                    elif Mi.__class__.__name__ == 'csr_matrix':
-                        for j, num in enumerate(nums):
-                            idx = indices[indptr[j]:indptr[j+1]]
-                            ROW.extend([GI[i][j],]*num)
-                            COL.extend(GJ[i][idx])
-                    else:
-                        raise Exception("I can not handle %r."%Mi)
-                    DAT.extend(data)
-
-                self._cache_ = ('default', ROW, COL)
+            return self.___PRIVATE_planned_assembling___(GI, GJ, DEP, WID)
 
+    def ___vectorized_routine___(self):
+        """Assemble with NumPy batches instead of per-column list extensions.
+
+        Local matrices of the same format, shape and sparsity (indptr & indices) form a group.
+        For each group we stack the gathering vectors into 2d arrays and produce the ROW and
+        COL entries of all its elements with one fancy indexing. The COO entries are put in
+        exactly the same order (and are flushed in exactly the same chunks) as in the default
+        routine, so the result is bit-identical to that of ``___default_routine___``.
+
+        :return:
+        :rtype GlobalMatrix:
+        """
+        GMs = self._MAT_.gathering_matrices
+
+        assert GMs[0] is not None, "I have no gathering matrix"
+        assert GMs[1] is not None, "I have no gathering matrix"
+        GI = GMs[0]
+        GJ = GMs[1]
+        DEP = int(GI.GLOBAL_num_dofs)
+        WID = int(GJ.GLOBAL_num_dofs)
+
+        # --- NO Cache: no sparsity locker, sparsity may change, so do not cache!---------
+        if self._MAT_.do.___sparsity_locker___ is False:
+            ROW, COL, DAT, nums = self.___PRIVATE_vectorized_COO___(GI, GJ, DEP, WID)[:4]
+
+            # we flush the COO data at the same places as the default routine does.
+            cuts = [0,]
+            amount = 0
+            for k, num in enumerate(nums):
+                amount += num
+                if amount > 1e7:
+                    cuts.append(cuts[-1] + amount)
+                    amount = 0
+            cuts.append(len(DAT))
+
+            A = csr_matrix((DEP, WID)) # initialize a sparse matrix
+            for s, e in zip(cuts[:-1], cuts[1:]):
+                A += csr_matrix((DAT[s:e], (ROW[s:e], COL[s:e])), shape=(DEP, WID))
+            return GlobalMatrix(A)
+
+        # Cache on: sparsity don't change, entries could still change ------------------------------
+        else:
+            return self.___PRIVATE_planned_assembling___(GI, GJ, DEP, WID)
+
+    def ___PRIVATE_planned_assembling___(self, GI, GJ, DEP, WID):
+        """When the sparsity is locked, we make an assembly plan once and then assemble the
+        local data with it (new CSR matrices sharing the index arrays).
+
+        Both routines share the plan, so it does not matter which routine made it.
+
+        :return:
+        :rtype GlobalMatrix:
+        """
+        if self._cache_ is None or self._cache_[0] != 'plan':
+            ROW, COL, DAT, _, sparsity = self.___PRIVATE_vectorized_COO___(GI, GJ, DEP, WID)
+            self._cache_ = ('plan', EWC_SparseMatrix_AssemblyPlan(ROW, COL, (DEP, WID), sparsity=sparsity))
+            del ROW, COL
+
+        else:
+            DAT = list()
+            sparsity = hashlib.blake2b(digest_size=16)
+            for i in self._MAT_: # go through all local sparse matrices.
+                Mi = self._MAT_[i]
+                self.___PRIVATE_update_sparsity___(sparsity, Mi)
+                DAT.append(Mi.data)
+            DAT = np.concatenate(DAT) if len(DAT) > 0 else np.array([])
+            sparsity = sparsity.digest()
+
+        return GlobalMatrix(self._cache_[1](DAT, sparsity=sparsity))
+
+    @staticmethod
+    def ___PRIVATE_update_sparsity___(sparsity, Mi):
+        """Update the digest `sparsity` with the format, shape, indptr and indices of `Mi`."""
+        sparsity.update(f"{Mi.__class__.__name__}{Mi.shape}".encode())
+        sparsity.update(np.ascontiguousarray(Mi.indptr, dtype=np.int64).data)
+        sparsity.update(np.ascontiguousarray(Mi.indices, dtype=np.int64).data)
+
+    def ___PRIVATE_local_data___(self):
+        """Go through all local matrices once.
+
+        :return: A tuple of four outputs:
+
+            1. (1d-array) The data of all local matrices, in the sequence of the elements.
+            2. (list) The amount of data in each local matrix.
+            3. (dict) Groups of local matrices of the same format, shape and sparsity. Keys are
+                the sparsity signatures, values are lists of ``[Mi, positions]`` where ``Mi`` is
+                the first local matrix of the group and ``positions`` are the sequence numbers of
+                the elements in the group.
+            4. (bytes) The digest of the sparsity of all local matrices.
+        """
+        DAT = list()
+        nums = list()
+        groups = dict()
+        sparsity = hashlib.blake2b(digest_size=16)
+        for k, i in enumerate(self._MAT_): # go through all local sparse matrices.
+            Mi = self._MAT_[i] # get the local sparse matrix
+            mtype = Mi.__class__.__name__
+            if mtype not in ('csc_matrix', 'csr_matrix'):
+                raise Exception("I can not handle %r."%Mi)
+            self.___PRIVATE_update_sparsity___(sparsity, Mi)
+            key = (mtype, Mi.shape, Mi.indptr.tobytes(), Mi.indices.tobytes())
+            if key in groups:
+                groups[key][1].append(k)
             else:
-                ROW, COL = self._cache_[1], self._cache_[2]
-                DAT = list()
-
-                if len(self._MAT_) > 0:
-                    for i in self._MAT_: # go through all local sparse matrices.
-                        Mi = self._MAT_[i] # get the local sparse matrix
-                        DAT.append(Mi.data)
-                    DAT = np.concatenate(DAT)
-                else:
-                    pass
+                groups[key] = [Mi, [k,]]
+            DAT.append(Mi.data)
+            nums.append(len(Mi.data))
+
+        if len(DAT) > 0:
+            DAT = np.concatenate(DAT)
+        else:
+            DAT = np.array([])
+
+        return DAT, nums, groups, sparsity.digest()
 
-            DAT = csr_matrix((DAT, (ROW, COL)), shape=(DEP, WID))
+    def ___PRIVATE_vectorized_COO___(self, GI, GJ, DEP, WID):
+        """Make the global COO data of all local matrices, group by group.
+
+        :return: A tuple of five outputs: ROW, COL, DAT, the amount of data in each element and the
+            digest of the sparsity of all local matrices.
+        """
+        DAT, nums, groups, sparsity = self.___PRIVATE_local_data___()
+        NNZ = len(DAT)
+        offsets = np.zeros(len(nums) + 1, dtype=np.int64)
+        np.cumsum(nums, out=offsets[1:])
+
+        if max(DEP, WID, NNZ) < np.iinfo(np.int32).max:
+            idx_dtype = np.int32
+        else:
+            idx_dtype = np.int64
+        ROW = np.empty(NNZ, dtype=idx_dtype)
+        COL = np.empty(NNZ, dtype=idx_dtype)
+
+        elements = list(self._MAT_)
+        for Mi, positions in groups.values():
+            nnz = len(Mi.data)
+            if nnz == 0: continue
+            gi = np.array([GI[elements[k]] for k in positions])
+            gj = np.array([GJ[elements[k]] for k in positions])
+            major = np.repeat(np.arange(len(Mi.indptr) - 1), np.diff(Mi.indptr))
+            minor = Mi.indices
+            if Mi.__class__.__name__ == 'csc_matrix':
+                r, c = minor, major
+            else:
+                r, c = major, minor
+            where = offsets[positions][:, np.newaxis] + np.arange(nnz)
+            ROW[where] = gi[:, r]
+            COL[where] = gj[:, c]
 
-            return GlobalMatrix(DAT)
\ No newline at end of file
+        return ROW, COL, DAT, nums, sparsity
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""The assembly plan of an EWC sparse matrix whose sparsity is locked."""
+import numpy as np
+from scipy.sparse import csr_matrix
+from screws.freeze.base import FrozenOnly
+
+
+
+class EWC_SparseMatrix_AssemblyPlan(FrozenOnly):
+    """A symbolic assembling of the local matrices.
+
+    We compute, only once, to which slot of the final CSR ``data`` array each local data goes
+    (duplicated (row, col) entries go to the same slot). Then, as long as the sparsity does not
+    change, an assembling is one ``bincount`` into a new ``data`` array of a CSR matrix sharing the
+    (read-only) index arrays of the plan; no new index arrays are made and no COO -> CSR conversion
+    is done anymore.
+
+    :param ROW: Global rows of the local data (in the sequence of the local data).
+    :param COL: Global columns of the local data (in the sequence of the local data).
+    :param shape: The shape of the global matrix.
+    :param sparsity: A digest of the sparsity (formats, shapes, indptr and indices) of the local
+        matrices the plan is made for. If given, each assembling checks it, so a changed local
+        sparsity of the same amount of local data is not scattered into wrong slots.
+    """
+    def __init__(self, ROW, COL, shape, sparsity=None):
+        DEP, WID = shape
+        ROW = np.asarray(ROW, dtype=np.int64)
+        COL = np.asarray(COL, dtype=np.int64)
+        assert len(ROW) == len(COL), f"ROW and COL length dis-match."
+
+        KEY = ROW * WID + COL
+        order = np.argsort(KEY, kind='stable')
+        KEY = KEY[order]
+        new_slot = np.ones(len(KEY), dtype=bool)
+        new_slot[1:] = KEY[1:] != KEY[:-1]
+        KEY = KEY[new_slot]
+
+        if max(DEP, WID, len(KEY)) < np.iinfo(np.int32).max:
+            idx_dtype = np.int32
+        else:
+            idx_dtype = np.int64
+
+        scatter = np.empty(len(order), dtype=idx_dtype)
+        scatter[order] = np.cumsum(new_slot) - 1
+
+        indptr = np.zeros(DEP + 1, dtype=idx_dtype)
+        np.cumsum(np.bincount(KEY // WID, minlength=DEP), out=indptr[1:])
+        indices = (KEY % WID).astype(idx_dtype)
+        # shared by all assembled matrices: structural changes in place must not happen.
+        indices.flags.writeable = False
+        indptr.flags.writeable = False
+
+        self._shape_ = (DEP, WID)
+        self._scatter_ = scatter
+        self._indices_ = indices
+        self._indptr_ = indptr
+        self._sparsity_ = sparsity
+        self._freeze_self_()
+
+    @property
+    def shape(self):
+        """The shape of the global matrix."""
+        return self._shape_
+
+    @property
+    def num_local_data(self):
+        """How many local data are gathered by this plan?"""
+        return len(self._scatter_)
+
+    @property
+    def nnz(self):
+        """The amount of slots in the CSR ``data`` array."""
+        return len(self._indices_)
+
+    def __call__(self, DAT, sparsity=None):
+        """Assemble the local data into the CSR matrix.
+
+        Every call returns a new CSR matrix with its own ``data`` array, so matrices assembled by
+        previous calls do not change; the index arrays are shared (and read-only).
+
+        :param DAT: The local data of all elements (in the sequence of the elements).
+        :param sparsity: The digest of the sparsity of the local matrices of `DAT`; checked
+            against the one the plan is made for.
+        :return: A csr_matrix.
+        """
+        assert len(DAT) == self.num_local_data, \
+            f"the sparsity has changed: {len(DAT)} local data while the plan " \
+            f"is made for {self.num_local_data}. Unlock the sparsity first."
+        assert self._sparsity_ is None or sparsity == self._sparsity_, \
+            f"the sparsity of the local matrices has changed. Unlock the sparsity first."
+
+        if np.iscomplexobj(DAT): # bincount only does real weights.
+            data = np.bincount(self._scatter_, weights=DAT.real, minlength=self.nnz) \
+                + 1j * np.bincount(self._scatter_, weights=DAT.imag, minlength=self.nnz)
+        else:
+            data = np.bincount(self._scatter_, weights=DAT, minlength=self.nnz)
+        M = csr_matrix((data, self._indices_, self._indptr_), shape=self._shape_, copy=False)
+        M.has_sorted_indices = True
+        return M
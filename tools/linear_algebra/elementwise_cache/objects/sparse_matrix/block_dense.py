@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""The block-dense storage of the local matrices of an EWC sparse matrix.
+
+Local matrices of spectral elements are small and (mostly) dense. Instead of one scipy sparse
+matrix per element, we store the local matrices of all element groups (for example, groups of
+elements of the same type w.r.t. metric) in one contiguous 3d array, and do the algebra over all
+groups at once with batched NumPy operations. Local scipy sparse matrices are only made when they
+are asked for, for example, at assembling.
+"""
+import numpy as np
+from scipy.sparse import csc_matrix
+from screws.freeze.base import FrozenOnly
+
+
+
+class EWC_BlockDense(FrozenOnly):
+    """
+    :param blocks: A 3d array of shape (num_groups, m, n). It can be None if there is no local
+        mesh-element.
+    :param positions: A dict whose keys are the local mesh-elements and values are the indices of
+        their local matrices in `blocks`.
+    :param pattern: A 3d bool array of the shape of `blocks`: the structural pattern of the local
+        matrices of all groups. If it is None, we take the nonzero entries of `blocks`.
+    """
+    def __init__(self, blocks, positions, pattern=None):
+        assert isinstance(positions, dict), f"positions must be a dict."
+        if len(positions) == 0:
+            blocks = None
+        else:
+            assert blocks.ndim == 3, f"blocks must be a 3d array, now it is of shape {blocks.shape}."
+        if blocks is None:
+            pattern = None
+        elif pattern is None:
+            pattern = blocks != 0
+        else:
+            assert pattern.shape == blocks.shape, f"pattern shape {pattern.shape} != blocks shape {blocks.shape}."
+        self._blocks_ = blocks
+        self._positions_ = positions
+        self._pattern_ = pattern
+        self._structures_ = dict()
+        self._freeze_self_()
+
+    @property
+    def blocks(self):
+        """(ndarray) The local matrices of all groups; of shape (num_groups, m, n)."""
+        return self._blocks_
+
+    @property
+    def positions(self):
+        """(dict) ``blocks[positions[i]]`` is the local matrix of mesh-element #i."""
+        return self._positions_
+
+    @property
+    def pattern(self):
+        """(ndarray) The structural (bool) pattern of the local matrices of all groups."""
+        return self._pattern_
+
+    @property
+    def num_groups(self):
+        return 0 if self._blocks_ is None else self._blocks_.shape[0]
+
+    @property
+    def shape(self):
+        """The shape of the local matrices. None if there is no local mesh-element."""
+        return None if self._blocks_ is None else self._blocks_.shape[1:]
+
+    def __call__(self, i):
+        """As a data generator of EWC_SparseMatrix.
+
+        The local matrix has the structural pattern of its group: exact zeros in the pattern are
+        kept as explicit entries, so the sparsity (thus the assembly plan of a sparsity-locked
+        matrix) does not depend on the values.
+        """
+        g = self._positions_[i]
+        if g not in self._structures_:
+            P = self._pattern_[g]
+            cols, rows = np.nonzero(P.T) # column-major, so the indices are sorted.
+            indptr = np.zeros(P.shape[1] + 1, dtype=np.int32)
+            np.cumsum(np.count_nonzero(P, axis=0), out=indptr[1:])
+            self._structures_[g] = (rows, cols, rows.astype(np.int32), indptr)
+        rows, cols, indices, indptr = self._structures_[g]
+        data = self._blocks_[g][rows, cols] # a copy.
+        M = csc_matrix((data, indices.copy(), indptr.copy()), shape=self._blocks_.shape[1:], copy=False)
+        M.has_sorted_indices = True
+        return M
+
+    def ___PRIVATE_cache_key___(self, i):
+        """As a cache key generator of EWC_SparseMatrix. The key is closed by `|` such that keys of
+        different EWC_SparseMatrix can be concatenated safely."""
+        return f">BD{self._positions_[i]}|"
+
+    def ___PRIVATE_pairing___(self, other):
+        """Pair my groups with the groups of `other`.
+
+        :return: A tuple of three outputs:
+
+            1. indices of my blocks for all the new groups.
+            2. indices of the blocks of `other` for all the new groups.
+            3. the positions of the new groups.
+        """
+        assert len(self._positions_) == len(other._positions_), f"local elements dis-match."
+        if self._positions_ is other._positions_ or self._positions_ == other._positions_:
+            K = np.arange(self.num_groups)
+            return K, K, self._positions_
+
+        pairs = dict()
+        positions = dict()
+        for i in self._positions_:
+            pair = (self._positions_[i], other._positions_[i])
+            if pair not in pairs:
+                pairs[pair] = len(pairs)
+            positions[i] = pairs[pair]
+        K = np.array(list(pairs.keys()), dtype=int).reshape((-1, 2))
+        return K[:, 0], K[:, 1], positions
+
+    def ___PRIVATE_binary___(self, other, operator, structure):
+        """Apply a binary `operator` on the local matrices of all (paired) groups at once; the
+        pattern of the result is given by `structure` applied on the patterns."""
+        assert other.__class__.__name__ == 'EWC_BlockDense'
+        K1, K2, positions = self.___PRIVATE_pairing___(other)
+        if self._blocks_ is None:
+            return EWC_BlockDense(None, positions)
+        if len(K1) == self.num_groups and np.all(K1 == np.arange(self.num_groups)):
+            B1, P1 = self._blocks_, self._pattern_
+        else:
+            B1, P1 = self._blocks_[K1], self._pattern_[K1]
+        if len(K2) == other.num_groups and np.all(K2 == np.arange(other.num_groups)):
+            B2, P2 = other._blocks_, other._pattern_
+        else:
+            B2, P2 = other._blocks_[K2], other._pattern_[K2]
+        return EWC_BlockDense(operator(B1, B2), positions, structure(P1, P2))
+
+    def ___PRIVATE_unary___(self, operator, structure=None):
+        """Apply a unary `operator` on the local matrices of all groups at once. If `structure`
+        is None, the pattern does not change."""
+        if self._blocks_ is None:
+            return EWC_BlockDense(None, self._positions_)
+        pattern = self._pattern_ if structure is None else structure(self._pattern_)
+        return EWC_BlockDense(operator(self._blocks_), self._positions_, pattern)
+
+    def __matmul__(self, other):
+        return self.___PRIVATE_binary___(other, np.matmul, np.matmul) # bool matmul: or of ands.
+
+    def __add__(self, other):
+        return self.___PRIVATE_binary___(other, np.add, np.logical_or)
+
+    def __sub__(self, other):
+        return self.___PRIVATE_binary___(other, np.subtract, np.logical_or)
+
+    def __neg__(self):
+        return self.___PRIVATE_unary___(np.negative)
+
+    def __mul__(self, number):
+        return self.___PRIVATE_unary___(lambda B: B * number)
+
+    def __truediv__(self, number):
+        return self.___PRIVATE_unary___(lambda B: B / number)
+
+    @property
+    def T(self):
+        return self.___PRIVATE_unary___(lambda B: B.transpose((0, 2, 1)), lambda P: P.transpose((0, 2, 1)))
+
+    @property
+    def inv(self):
+        return self.___PRIVATE_unary___(np.linalg.inv, ___inverse_pattern___)
+
+
+
+def ___inverse_pattern___(pattern):
+    """The structural pattern of the inverses: the transitive closure of the (directed) graphs of
+    the patterns with all diagonal entries in."""
+    P = pattern | np.eye(pattern.shape[1], dtype=bool)
+    while True:
+        Q = np.matmul(P, P)
+        if np.array_equal(Q, P):
+            return P
+        P = Q
+
+
+def ___EWC_2_BlockDense___(ewc):
+    """Make the block-dense data of an EWC_SparseMatrix.
+
+    If `ewc` is backed by block-dense data, we return it. Otherwise, elements of the same cache
+    key share one block, and we return None if it is not possible (the local matrices are
+    customized or not cached).
+    """
+    if len(ewc.customizations) > 0:
+        return None
+    if ewc.block_dense is not None:
+        return ewc.block_dense
+
+    keys = dict()
+    positions = dict()
+    representatives = list()
+    for i in ewc:
+        ck = ewc._KG_(i)
+        if ewc.___NC___ in ck:
+            return None
+        if ck not in keys:
+            keys[ck] = len(representatives)
+            representatives.append(i)
+        positions[i] = keys[ck]
+
+    if len(representatives) == 0:
+        return EWC_BlockDense(None, positions)
+
+    blocks = list()
+    pattern = list()
+    for i in representatives:
+        Mi = ewc[i].tocoo()
+        blocks.append(Mi.toarray())
+        Pi = np.zeros(Mi.shape, dtype=bool)
+        Pi[Mi.row, Mi.col] = True # the structural entries, explicit zeros included.
+        pattern.append(Pi)
+    return EWC_BlockDense(np.array(blocks), positions, np.array(pattern))
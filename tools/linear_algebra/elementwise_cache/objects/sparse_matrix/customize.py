@@ -13,11 +13,30 @@ class SpaMat_Customize(FrozenOnly):
         self._t1f_s1f_cc_ = None
         self._t0f_s0f_cc_ = None
         self.___customizations___ = dict()
+        self._masks_ = dict()
+        self._num_clears_ = 0
         self._freeze_self_()
 
     def clear(self):
         """clear all existing customizations."""
         self.___customizations___ = dict()
+        self._masks_ = dict()
+        self._num_clears_ += 1
+        self.___PRIVATE_reset_assembly_plan___()
+
+    def ___PRIVATE_state___(self, e):
+        """A string of the state of the customizations for #e element; '' if there is none.
+        Customizations are only appended or cleared, so it changes whenever they change."""
+        if e in self.___customizations___:
+            return f">CUS{self._num_clears_}.{len(self.___customizations___[e])}<"
+        else:
+            return ''
+
+    def ___PRIVATE_reset_assembly_plan___(self):
+        """In-place customizations may add slots to (and clearing them removes slots from) the
+        local matrices, so the assembly plan made for the old sparsity must be made again."""
+        if self._spa_mat_._assembler_ is not None:
+            self._spa_mat_.assembler.___PRIVATE_reset_cache___()
 
     @property
     def _customizations_(self):
@@ -28,6 +47,8 @@ class SpaMat_Customize(FrozenOnly):
                     Customization are executed in a positive sequence.
                 6: [('salv', ([5, 6], 151.1256221)), ...],  # Set A Local Value whose local indices are (5,6) in element 6 to
                     151.1256221.
+                7: [('milrs', [0, 3]), ...],  # identify local rows #0, #3 in place (Masked), see
+                    `___PRIVATE_masked_identify___`.
                 ...
         }
         """
@@ -51,7 +72,7 @@ class SpaMat_Customize(FrozenOnly):
             CUSi = self._customizations_[e] # customizations for the output of #e element.
 
 
-            for cus in CUSi:
+            for k, cus in enumerate(CUSi):
 
                 key, factors = cus # for example cus=('clr', 5) or ('salv', ([1,1],5))
 
@@ -88,6 +109,14 @@ class SpaMat_Customize(FrozenOnly):
                     RETURN[factors[0], :] = 0
                     RETURN[factors[0], factors[1]] = 1
 
+                # identify Local Rows in place (Masked) --------------------- BELOW ---------------------------
+                elif key == 'milrs':
+                    RETURN = self.___PRIVATE_masked_identify___(RETURN, e, k, factors, factors)
+
+                # identify Local Rows At Columns in place (Masked) --------------------- BELOW ---------------------
+                elif key == 'milrsac':
+                    RETURN = self.___PRIVATE_masked_identify___(RETURN, e, k, factors[0], factors[1])
+
                 # Not Implemented --------------------------------------------- BELOW ----------------------------------
                 else:
                     raise NotImplementedError(f"Can not handle customization key={key}.")
@@ -99,6 +128,66 @@ class SpaMat_Customize(FrozenOnly):
 
         return RETURN
 
+    def ___PRIVATE_masked_identify___(self, RETURN, e, k, rows, cols):
+        """Make ``RETURN[rows, :] = 0`` and ``RETURN[rows, cols] = 1`` (`rows` and `cols` are paired)
+        without changing the sparsity of the output from call to call.
+
+        For the #k customization of element #e, we make a boolean mask over the CSR `data` of the
+        entries in `rows` and the positions (the slots) of the entries (rows, cols) in `data`.
+        Slots not in the sparsity of `RETURN` are added as explicit entries. The mask is made again
+        only if the sparsity (`indptr` and `indices`) of `RETURN` is changed. Then each call only
+        copies the `data`, zeros it by the mask and sets the slots to 1. So, with the sparsity
+        locked, the assembly plan (and anything else relying on the sparsity) stays valid.
+
+        :return: A new csr matrix sharing the `indices` and `indptr` arrays of all calls.
+        """
+        if not spspa.isspmatrix_csr(RETURN): RETURN = RETURN.tocsr()
+
+        if (e, k) in self._masks_:
+            indptr0, indices0 = self._masks_[(e, k)][:2]
+            if not (np.array_equal(RETURN.indptr, indptr0) and np.array_equal(RETURN.indices, indices0)):
+                del self._masks_[(e, k)]
+
+        if (e, k) not in self._masks_:
+            rows = np.array(rows, dtype=int).ravel()
+            cols = np.array(cols, dtype=int).ravel()
+            assert len(rows) == len(cols), f"rows and cols must be paired."
+            indptr, indices = RETURN.indptr, RETURN.indices
+            nnz = len(RETURN.data)
+
+            missing = [m for m, (r, c) in enumerate(zip(rows, cols))
+                       if c not in indices[indptr[r]:indptr[r+1]]]
+            if len(missing) == 0:
+                take = None
+            else: # add the missing slots; markers tell where the original entries go.
+                major = np.repeat(np.arange(RETURN.shape[0]), np.diff(indptr))
+                markers = np.concatenate([np.arange(1, nnz + 1), - np.arange(1, len(missing) + 1)])
+                P = spspa.csr_matrix((markers.astype(float),
+                                      (np.concatenate([major, rows[missing]]),
+                                       np.concatenate([indices, cols[missing]]))), shape=RETURN.shape)
+                destination = np.flatnonzero(P.data > 0)
+                take = (destination, P.data[destination].astype(int) - 1)
+                indptr, indices = P.indptr, P.indices
+
+            major = np.repeat(np.arange(RETURN.shape[0]), np.diff(indptr))
+            mask = np.isin(major, rows)
+            slots = np.array([indptr[r] + np.flatnonzero(indices[indptr[r]:indptr[r+1]] == c)[0]
+                              for r, c in zip(rows, cols)], dtype=int)
+            self._masks_[(e, k)] = (RETURN.indptr.copy(), RETURN.indices.copy(),
+                                    take, indptr, indices, mask, slots)
+
+        take, indptr, indices, mask, slots = self._masks_[(e, k)][2:]
+        shape = RETURN.shape
+
+        if take is None:
+            data = RETURN.data.copy()
+        else:
+            data = np.zeros(len(indices), dtype=RETURN.dtype)
+            data[take[0]] = RETURN.data[take[1]]
+        data[mask] = 0
+        data[slots] = 1
+        return spspa.csr_matrix((data, indices, indptr), shape=shape)
+
 
 
 
@@ -339,7 +428,8 @@ class SpaMat_Customize(FrozenOnly):
 
 
 
-    def identify_global_rows_according_to_CSCG_partial_dofs(self, i, pds, interpreted_as='local_dofs'):
+    def identify_global_rows_according_to_CSCG_partial_dofs(self, i, pds, interpreted_as='local_dofs',
+                                                             in_place=None):
         """We locally make M[r,:] = 0 except M[r,r] = 1 according to a CSCG PartialDofs
         instance in block[i][:]
 
@@ -354,10 +444,15 @@ class SpaMat_Customize(FrozenOnly):
         :param pds: we will get dofs form this.
         :param i: We locally make block[i][:][dofs, :] = 0 except block[i][i][dofs, dofs] = 1
         :param interpreted_as:
+        :param in_place: If True, the rows are identified in place with masks over the local CSR
+            data (see `___PRIVATE_masked_identify___`), so the sparsity is the same in every call and
+            this works when the sparsity is locked. If None (default), it is True when the
+            sparsity is locked.
         :return:
         """
         assert not self._spa_mat_.do.___locker___, f"the assembled matrix is locked!"
-        assert not self._spa_mat_.do.___sparsity_locker___, f"the sparsity is locked!"
+        if in_place is None: in_place = self._spa_mat_.do.___sparsity_locker___
+        assert in_place or not self._spa_mat_.do.___sparsity_locker___, f"the sparsity is locked!"
 
         if pds.__class__.__name__ == 'PartialCochain': pds = pds.dofs
 
@@ -395,7 +490,9 @@ class SpaMat_Customize(FrozenOnly):
 
                 local_dofs = np.array(LDF[e]) + start
 
-                self.___customizations___[e].append(('ilrs', local_dofs))
+                self.___customizations___[e].append(('milrs' if in_place else 'ilrs', local_dofs))
+
+            if in_place: self.___PRIVATE_reset_assembly_plan___()
 
         else:
             raise Exception(f"Cannot identify global rows through "
@@ -404,7 +501,7 @@ class SpaMat_Customize(FrozenOnly):
 
 
     def off_diagonally_identify_rows_according_to_two_CSCG_partial_dofs(
-        self, i, j, row_pds, col_pds, interpreted_as='local_dofs'):
+        self, i, j, row_pds, col_pds, interpreted_as='local_dofs', in_place=None):
         """We will identify off-diagonal block, block[i][j], and set
         block[i][:][row_pds.dofs, :] = 0
         block[i][j][row_pds.dofs, col_pds.dofs] = 1
@@ -417,10 +514,13 @@ class SpaMat_Customize(FrozenOnly):
         :param row_pds:
         :param col_pds:
         :param interpreted_as:
+        :param in_place: If True, identify the rows in place, see
+            `identify_global_rows_according_to_CSCG_partial_dofs`.
         :return:
         """
         assert not self._spa_mat_.do.___locker___, f"the assembled matrix is locked!"
-        assert not self._spa_mat_.do.___sparsity_locker___, f"the sparsity is locked!"
+        if in_place is None: in_place = self._spa_mat_.do.___sparsity_locker___
+        assert in_place or not self._spa_mat_.do.___sparsity_locker___, f"the sparsity is locked!"
 
         if row_pds.__class__.__name__ == 'PartialCochain':
             row_pds = row_pds.dofs
@@ -483,7 +583,9 @@ class SpaMat_Customize(FrozenOnly):
                 col_local_dofs = np.array(COL) + start_col
 
                 self.___customizations___[e].append(
-                    ('ilrsac', (row_local_dofs, col_local_dofs)))
+                    ('milrsac' if in_place else 'ilrsac', (row_local_dofs, col_local_dofs)))
+
+            if in_place: self.___PRIVATE_reset_assembly_plan___()
 
         else:
             raise Exception(f"Cannot off-diagonally identify global rows through "
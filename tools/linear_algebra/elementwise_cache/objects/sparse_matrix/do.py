@@ -29,6 +29,9 @@ class EWC_SparseMatrix_Do(FrozenOnly):
     def lock_sparsity(self):
         """We lock the sparsity of local matrices (as well as the global matrix), so the sparsity
          cannot be changed anymore although the entries can still be changed.
+
+         The assembler then makes an assembly plan at the first assembling, and later assemblings
+         only compute new data for the assembled CSR matrices, which share the index arrays.
          """
         self.___sparsity_locker___ = True
 
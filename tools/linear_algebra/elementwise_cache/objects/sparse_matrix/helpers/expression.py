@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+The expression DAG of EWC_SparseMatrix operators.
+
+`+`, `-`, `*`, `/`, `@`, `.T`, `.inv` and `bmat` of EWC_SparseMatrix make nodes of a DAG instead
+of closures of closures. A node is identified by its structure (the operator, the ids of its
+operand nodes and the parameter), and identical structures are the same node (we keep them in a
+registry). So, for example, ``M.T @ M + M.T @ M`` has only one node of ``M.T @ M``.
+
+Each operand is a leaf, identified by the operand itself. A leaf of an operand which is the
+result of operators (not customized for the element) is evaluated through the node of that
+result in the same pass, so the expression is still fused; otherwise (and whenever the operand
+is customized for the element), the leaf is evaluated as ``operand[i]``, so the customizations
+of the operand, also those added after it was used, are seen. For an element, the cache key of a
+node is the tuple of the keys of its distinct leaves, and the key of a leaf includes the state
+of the customizations of its operand for that element; intermediate results are cached in the
+nodes by these keys. When a result is indexed (or assembled), its whole expression is evaluated
+in one pass in which each node is evaluated at most once.
+
+A node may also keep the block-dense data of its result (made by the block-dense operators);
+they are used for the elements whose leaves are not customized.
+"""
+import weakref
+from itertools import count
+from scipy import sparse as spspa
+from scipy.sparse import linalg as spspalinalg
+
+
+___NODES___ = weakref.WeakValueDictionary() # structure -> node
+___IDS___ = count()
+___NC___ = '>NC<'
+
+
+def ___EWC_EXPRESSION___(op, operands, parameter=None):
+    """The (unique) node of structure (`op`, `operands`, `parameter`).
+
+    :param op: 'leaf', 'add', 'sub', 'matmul', 'mul', 'truediv', 'neg', 'T', 'inv' or 'bmat'.
+    :param operands: A tuple of EWC_SparseMatrix (or None for empty bmat blocks), or of one
+        EWC_SparseMatrix for a leaf.
+    :param parameter: The number of 'mul' and 'truediv'; the block shape of 'bmat'.
+    """
+    if op == 'leaf':
+        structure = ('leaf', id(operands[0]))
+        nodes = None
+    else:
+        nodes = tuple([None if _ is None else ___EWC_EXPRESSION___('leaf', (_,)) for _ in operands])
+        structure = (op, tuple([None if _ is None else _._id_ for _ in nodes]), parameter)
+
+    node = ___NODES___.get(structure)
+    if node is None:
+        node = ___EWC_ExpressionNode___(op, operands, nodes, parameter)
+        ___NODES___[structure] = node
+    return node
+
+
+class ___EWC_ExpressionNode___(object):
+    """A node of the DAG. It is the data generator of the EWC_SparseMatrix it results in."""
+    def __init__(self, op, operands, nodes, parameter):
+        self._id_ = next(___IDS___)
+        self._op_ = op
+        self._parameter_ = parameter
+        if op == 'leaf':
+            self._ewc_ = operands[0]
+            DG = self._ewc_._DG_
+            # the node of the operand if it is an operator result; we evaluate through it.
+            nodes = (DG,) if isinstance(DG, ___EWC_ExpressionNode___) else tuple()
+            leaves = {self._id_: self}
+        else:
+            self._ewc_ = None
+            leaves = dict()
+        self._nodes_ = nodes
+        for node in nodes:
+            if node is not None:
+                for leaf in node._leaves_:
+                    leaves[leaf._id_] = leaf
+        self._leaves_ = tuple(leaves.values())
+        self._blocks_ = operands if op == 'bmat' else None
+        self._block_dense_ = None
+        self._cache_ = dict()
+
+    @property
+    def blocks(self):
+        """The blocks of a 'bmat' node, in the shape of the bmat."""
+        assert self._op_ == 'bmat', f"only bmat nodes have blocks."
+        I, J = self._parameter_
+        return [list(self._blocks_[i*J:(i+1)*J]) for i in range(I)]
+
+    @property
+    def block_dense(self):
+        """The block-dense data of my result; None if there is none or if a leaf is customized."""
+        if self._block_dense_ is None or any([len(_._ewc_.customizations) > 0 for _ in self._leaves_]):
+            return None
+        return self._block_dense_
+
+    def __KG_call__(self, item):
+        """The cache key of the element #`item`, a string (as all other cache keys are): the repr
+        of the tuple of the keys of my leaves, so keys of different leaves cannot run together."""
+        return repr(tuple([leaf.___PRIVATE_leaf_key___(item) for leaf in self._leaves_]))
+
+    def ___PRIVATE_leaf_key___(self, item):
+        """The key of a leaf for the element #`item`: the state of the customizations of the
+        operand, and the cache key of the operand if it is not evaluated through its node (whose
+        leaves have their own keys)."""
+        state = self._ewc_._customize_.___PRIVATE_state___(item)
+        if len(self._nodes_) == 0:
+            return self._ewc_._KG_(item) + state
+        else:
+            return state
+
+    def __call__(self, item):
+        """Evaluate the whole expression for element #`item` in one pass."""
+        return self.___PRIVATE_evaluate___(item, dict(), dict())
+
+    def ___PRIVATE_evaluate___(self, item, memo, leaf_keys):
+        """
+        :param item: The element.
+        :param memo: The nodes already evaluated in this pass.
+        :param leaf_keys: The cache keys of the leaves (for this element) found in this pass.
+        """
+        if self._id_ in memo:
+            return memo[self._id_]
+
+        if self._op_ == 'leaf':
+            if len(self._nodes_) == 1 and item not in self._ewc_.customizations:
+                value = self._nodes_[0].___PRIVATE_evaluate___(item, memo, leaf_keys) # fused.
+            else:
+                value = self._ewc_[item] # its own cache and customizations.
+        else:
+            for leaf in self._leaves_:
+                if leaf._id_ not in leaf_keys:
+                    leaf_keys[leaf._id_] = leaf.___PRIVATE_leaf_key___(item)
+            key = tuple([leaf_keys[leaf._id_] for leaf in self._leaves_])
+            cacheable = all([___NC___ not in _ for _ in key])
+
+            if cacheable and key in self._cache_:
+                value = self._cache_[key]
+            else:
+                if self._block_dense_ is not None and \
+                    all([item not in _._ewc_.customizations for _ in self._leaves_]):
+                    value = self._block_dense_(item)
+                else:
+                    values = [None if node is None else node.___PRIVATE_evaluate___(item, memo, leaf_keys)
+                              for node in self._nodes_]
+                    value = self.___PRIVATE_compute___(values)
+                if cacheable: self._cache_[key] = value
+
+        memo[self._id_] = value
+        return value
+
+    def ___PRIVATE_compute___(self, values):
+        op = self._op_
+        if op == 'add':
+            return values[0] + values[1]
+        elif op == 'sub':
+            return values[0] - values[1]
+        elif op == 'matmul':
+            return values[0] @ values[1]
+        elif op == 'mul':
+            return values[0] * self._parameter_
+        elif op == 'truediv':
+            return values[0] / self._parameter_
+        elif op == 'neg':
+            return - values[0]
+        elif op == 'T':
+            return values[0].T
+        elif op == 'inv':
+            return spspalinalg.inv(values[0].tocsc())
+        elif op == 'bmat':
+            I, J = self._parameter_
+            return spspa.bmat([values[i*J:(i+1)*J] for i in range(I)], format='csr')
+        else:
+            raise NotImplementedError(f"op={op} not implemented.")
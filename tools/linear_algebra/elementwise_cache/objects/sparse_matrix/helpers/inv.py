@@ -1,17 +0,0 @@
-
-
-
-from screws.freeze.base import FrozenOnly
-
-
-
-
-from scipy.sparse import linalg as spspalinalg
-
-class ___LinearAlgebraINV___(FrozenOnly):
-    def __init__(self, ewc):
-        self._ewc_ = ewc
-        self._freeze_self_()
-
-    def __call__(self, item):
-        return spspalinalg.inv(self._ewc_[item].tocsc())
\ No newline at end of file
@@ -9,20 +9,16 @@ from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.adjust import
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.blocks.main import EWC_SpaMat_Blocks
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.condition.main import EWC_SpaMat_Condition
 
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.matmul import ___MATMUL___
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.vecmul import ___VECMUL___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.add import ___ADD___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.sub import ___SUB___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.truediv import ___TRUE_DIV___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.transpose import ___TRANSPOSE___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.inv import ___LinearAlgebraINV___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.neg import ___NEG___
-from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.mul import ___MUL___
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.expression import ___EWC_EXPRESSION___
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.expression import \
+    ___EWC_ExpressionNode___
 
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.assembler import EWC_SparseMatrix_Assembler
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.do import EWC_SparseMatrix_Do
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.IS import EWC_SparseMatrix_IS
 from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.visualize import EWC_SparseMatrix_Vis
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.block_dense import ___EWC_2_BlockDense___
 
 from tools.linear_algebra.elementwise_cache.objects.column_vector.main import EWC_ColumnVector
 
@@ -40,6 +36,11 @@ class EWC_SparseMatrix(FrozenOnly):
             we make locally empty sparse matrix of shape `data_generator`. (just like situation 1).
         3) `data_generator = ('identity', int-a)` and `cache_key_generator = constant `
             We will make identity local sparse matrix of shape (int-a, int-a) in all mesh elements.
+        4) `data_generator = EWC_BlockDense` and `cache_key_generator = None`
+            The local matrices are stored in a 3d array (block-dense). Then `+`, `-`, `@`, `.T`,
+            `inv` and so on with other EWC_SparseMatrix are done for all elements at once, and
+            local sparse matrices are only made when they are asked for (for example, at
+            assembling).
     :param cache_key_generator:
         1) `cache_key_generator = 'all_diff'`
             The local sparse matrix will be all different in all mesh elements.
@@ -82,6 +83,17 @@ class EWC_SparseMatrix(FrozenOnly):
         else:
             raise Exception(f"{mesh_elements}")
 
+        # we can accept block-dense data as a data generator ------------------------------------
+        if data_generator.__class__.__name__ == 'EWC_BlockDense':
+            self._block_dense_ = data_generator
+            if cache_key_generator is None:
+                if data_generator.num_groups <= 1:
+                    cache_key_generator = 'constant'
+                else:
+                    cache_key_generator = data_generator.___PRIVATE_cache_key___
+        else:
+            self._block_dense_ = None
+
         # we can accept a dictionary as a data generator, we will wrap it with a method -----------
         if isinstance(data_generator, dict):
             self.___fully_pre_data_DICT___ = True # the data are already created!
@@ -422,24 +434,70 @@ class EWC_SparseMatrix(FrozenOnly):
         """"""
         RETURN = self.___getitem_pre_customizing___(item)
         # customization is after the cache, so we can do whatever customization afterwards.
-        RETURN = self.customize.___PRIVATE_do_execute_customization___(RETURN, item)
+        RETURN = self._customize_.___PRIVATE_do_execute_customization___(RETURN, item)
         return RETURN
 
     @property
     def customizations(self):
         """All the customizations that have been added to me."""
-        return self.customize._customizations_
+        return self._customize_._customizations_
 
     @property
     def customize(self):
         """We use sub-methods of these properties to add customization. These customizations will be
-        executed when I am called."""
+        executed when I am called. The results of operators of me see them as well, also those
+        made before they are added.
+        """
         return self._customize_
 
     @property
     def bmat_shape(self):
         return self._bmat_shape_
 
+    @property
+    def block_dense(self):
+        """(EWC_BlockDense) The block-dense data backing me. None if I am not block-dense (or if
+        I am the result of operators of which an operand is customized)."""
+        if isinstance(self._DG_, ___EWC_ExpressionNode___):
+            return self._DG_.block_dense
+        return self._block_dense_
+
+    def ___PRIVATE_block_dense_operands___(self, other=None):
+        """If I am block-dense (and not customized), return my block-dense data. If `other` is
+        given and at least one of us is block-dense, return the block-dense data of both of us
+        (the other one is converted). Otherwise, return None; then the operators do the
+        element-wise way.
+        """
+        if other is None:
+            if len(self.customizations) > 0:
+                return None
+            return self.block_dense
+        if self.block_dense is None and other.block_dense is None:
+            return None
+        BD0 = ___EWC_2_BlockDense___(self)
+        BD1 = ___EWC_2_BlockDense___(other)
+        if BD0 is None or BD1 is None:
+            return None
+        else:
+            return BD0, BD1
+
+    def ___PRIVATE_block_dense_result___(self, BD, op, operands, parameter=None, gathering_matrices=None):
+        """Make the EWC_SparseMatrix of block-dense data `BD` which is the result of the node (`op`,
+        `operands`, `parameter`) of the expression DAG. The node uses `BD` for the elements where no
+        leaf is customized, so customizations of the operands (added later) are still seen."""
+        node = ___EWC_EXPRESSION___(op, operands, parameter)
+        node._block_dense_ = BD
+        RETURN = EWC_SparseMatrix(self._elements_, node, node.__KG_call__)
+        if gathering_matrices is not None and gathering_matrices != (None, None):
+            RETURN.gathering_matrices = gathering_matrices
+        return RETURN
+
+    def ___PRIVATE_expression_result___(self, op, operands, parameter=None):
+        """Make the EWC_SparseMatrix of the node (`op`, `operands`, `parameter`) of the expression
+        DAG, see `helpers.expression`."""
+        node = ___EWC_EXPRESSION___(op, operands, parameter)
+        return EWC_SparseMatrix(self._elements_, node, node.__KG_call__)
+
 
 
     def __mul__(self, other):
@@ -449,8 +507,12 @@ class EWC_SparseMatrix(FrozenOnly):
         :param other:
         :return:
         """
-        data_generator = ___MUL___(self, other)
-        RETURN = EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None and isinstance(other, (int, float)):
+            return self.___PRIVATE_block_dense_result___(BD * other, 'mul', (self,), other, self.gathering_matrices)
+
+        assert isinstance(other, (int, float))
+        RETURN = self.___PRIVATE_expression_result___('mul', (self,), other)
         if self.gathering_matrices != (None, None):
             RETURN.gathering_matrices = self.gathering_matrices
         return RETURN
@@ -463,8 +525,12 @@ class EWC_SparseMatrix(FrozenOnly):
         :param other:
         :return:
         """
-        data_generator = ___MUL___(self, other)
-        RETURN = EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None and isinstance(other, (int, float)):
+            return self.___PRIVATE_block_dense_result___(BD * other, 'mul', (self,), other, self.gathering_matrices)
+
+        assert isinstance(other, (int, float))
+        RETURN = self.___PRIVATE_expression_result___('mul', (self,), other)
         if self.gathering_matrices != (None, None):
             RETURN.gathering_matrices = self.gathering_matrices
         return RETURN
@@ -476,8 +542,12 @@ class EWC_SparseMatrix(FrozenOnly):
         :param other:
         :return:
         """
-        data_generator = ___TRUE_DIV___(self, other)
-        RETURN = EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None and isinstance(other, (int, float)):
+            return self.___PRIVATE_block_dense_result___(BD / other, 'truediv', (self,), other,
+                                                         self.gathering_matrices)
+
+        RETURN = self.___PRIVATE_expression_result___('truediv', (self,), other)
         if self.gathering_matrices != (None, None):
             RETURN.gathering_matrices = self.gathering_matrices
         return RETURN
@@ -485,13 +555,19 @@ class EWC_SparseMatrix(FrozenOnly):
     def __sub__(self, other):
         """self - EWC_SparseMatrix"""
         assert other.__class__.__name__ == 'EWC_SparseMatrix'
-        DKC = ___SUB___(self, other)
-        return EWC_SparseMatrix(self._elements_, DKC.__DG_call__, DKC.__KG_call__)
+        BDs = self.___PRIVATE_block_dense_operands___(other)
+        if BDs is not None:
+            return self.___PRIVATE_block_dense_result___(BDs[0] - BDs[1], 'sub', (self, other))
+
+        return self.___PRIVATE_expression_result___('sub', (self, other))
 
     def __neg__(self):
         """- EWC_SparseMatrix"""
-        data_generator = ___NEG___(self)
-        RETURN = EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None:
+            return self.___PRIVATE_block_dense_result___(- BD, 'neg', (self,), None, self.gathering_matrices)
+
+        RETURN = self.___PRIVATE_expression_result___('neg', (self,))
         if self.gathering_matrices != (None, None):
             RETURN.gathering_matrices = self.gathering_matrices
         return RETURN
@@ -499,14 +575,20 @@ class EWC_SparseMatrix(FrozenOnly):
     def __add__(self, other):
         """self + EWC_SparseMatrix"""
         assert other.__class__.__name__ == 'EWC_SparseMatrix'
-        DKC = ___ADD___(self, other)
-        return EWC_SparseMatrix(self._elements_, DKC.__DG_call__, DKC.__KG_call__)
+        BDs = self.___PRIVATE_block_dense_operands___(other)
+        if BDs is not None:
+            return self.___PRIVATE_block_dense_result___(BDs[0] + BDs[1], 'add', (self, other))
+
+        return self.___PRIVATE_expression_result___('add', (self, other))
 
     def __matmul__ (self, other):
         """"""
         if other.__class__.__name__ == 'EWC_SparseMatrix':
-            DKC = ___MATMUL___(self, other)
-            return EWC_SparseMatrix(self._elements_, DKC.__DG_call__, DKC.__KG_call__)
+            BDs = self.___PRIVATE_block_dense_operands___(other)
+            if BDs is not None:
+                return self.___PRIVATE_block_dense_result___(BDs[0] @ BDs[1], 'matmul', (self, other))
+
+            return self.___PRIVATE_expression_result___('matmul', (self, other))
 
         elif other.__class__.__name__ == 'EWC_ColumnVector':
             DKC = ___VECMUL___(self, other)
@@ -522,8 +604,15 @@ class EWC_SparseMatrix(FrozenOnly):
     @property
     def T(self):
         """Transpose of self."""
-        data_generator = ___TRANSPOSE___(self)
-        RETURN = EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None:
+            if self.gathering_matrices != (None, None):
+                return self.___PRIVATE_block_dense_result___(
+                    BD.T, 'T', (self,), None, (self.gathering_matrices[1], self.gathering_matrices[0]))
+            else:
+                return self.___PRIVATE_block_dense_result___(BD.T, 'T', (self,))
+
+        RETURN = self.___PRIVATE_expression_result___('T', (self,))
 
         if self.gathering_matrices != (None, None):
             RETURN.gathering_matrices = (self.gathering_matrices[1], self.gathering_matrices[0])
@@ -533,5 +622,8 @@ class EWC_SparseMatrix(FrozenOnly):
     @property
     def inv(self):
         """inv of self."""
-        data_generator = ___LinearAlgebraINV___(self)
-        return EWC_SparseMatrix(self._elements_, data_generator, self._KG_)
\ No newline at end of file
+        BD = self.___PRIVATE_block_dense_operands___()
+        if BD is not None:
+            return self.___PRIVATE_block_dense_result___(BD.inv, 'inv', (self,))
+
+        return self.___PRIVATE_expression_result___('inv', (self,))
\ No newline at end of file
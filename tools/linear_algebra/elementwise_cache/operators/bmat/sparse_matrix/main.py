@@ -2,8 +2,7 @@
 
 
 from tools.linear_algebra.gathering.regular.chain_matrix.main import Chain_Gathering_Matrix
-from tools.linear_algebra.elementwise_cache.operators.bmat.sparse_matrix.helpers.DG import ___BMAT_HELPER_DataGenerator___
-from tools.linear_algebra.elementwise_cache.operators.bmat.sparse_matrix.helpers.KG import ___BMAT_HELPER_KeyGenerator___
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.helpers.expression import ___EWC_EXPRESSION___
 
 
 
@@ -44,7 +43,7 @@ def ___bmat_EWC_sparse_matrices___(blocks):
                 if CLASS is None:
                     CLASS = Bij.__class__
 
-                assert Bij.customize._customizations_ == dict(), \
+                assert Bij.customizations == dict(), \
                     f"customized block[{i}][{j}] cannot be used for bmat."
                 # this is because of the cache function. the customizations of block will not be renewed in cache.
 
@@ -59,11 +58,10 @@ def ___bmat_EWC_sparse_matrices___(blocks):
                 RGM[i][j], CGM[i][j] = Bij.gathering_matrices
 
     assert elements is not None, f"blocks of only None?"
-    DG = ___BMAT_HELPER_DataGenerator___(blocks)
-    KG = ___BMAT_HELPER_KeyGenerator___(blocks)
+    DG = ___EWC_EXPRESSION___('bmat', tuple([Bij for Bi in blocks for Bij in Bi]), (I, J))
 
     assert CLASS.__name__ == 'EWC_SparseMatrix', "We must find an EWC_SparseMatrix class."
-    EWC = CLASS(elements, DG, KG, bmat_shape=(I, J))
+    EWC = CLASS(elements, DG, DG.__KG_call__, bmat_shape=(I, J))
 
     # Now we have a look at if we can get the gathering matrices for the bmat result.
     rgm = [None for _ in range(I)]
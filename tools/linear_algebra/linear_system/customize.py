@@ -8,7 +8,7 @@ class ___LinearSystem_Customize___(FrozenOnly):
         self._freeze_self_()
 
 
-    def apply_strong_BC(self, i, j, pd, pc=None, interpreted_as='local_dofs'):
+    def apply_strong_BC(self, i, j, pd, pc=None, interpreted_as='local_dofs', in_place=None):
         """
 
         :param i: We apply it to block [i][j].
@@ -16,6 +16,9 @@ class ___LinearSystem_Customize___(FrozenOnly):
         :param pd: partial degrees of freedom
         :param pc: partial cochain of freedom
         :param interpreted_as: how we interpret the `pd` and `pc`.
+        :param in_place: (CSCG meshes only) If True, the rows of A are identified in place, so the
+            sparsity of A does not change and it works when the sparsity of A is locked. If None
+            (default), it is True when the sparsity of A is locked.
         :return:
         """
         if hasattr(pd, 'standard_properties') and \
@@ -61,14 +64,14 @@ class ___LinearSystem_Customize___(FrozenOnly):
                 if i == j:
                     self._LS_.A.customize.\
                         identify_global_rows_according_to_CSCG_partial_dofs(
-                        i, pd, interpreted_as=interpreted_as)
+                        i, pd, interpreted_as=interpreted_as, in_place=in_place)
                     self._LS_.b.customize.\
                         set_entries_according_to_CSCG_partial_cochains(
                         i, pd, interpreted_as=interpreted_as)
                 else:
                     self._LS_.A.customize.\
                         off_diagonally_identify_rows_according_to_two_CSCG_partial_dofs(
-                        i, j, pd, pc, interpreted_as=interpreted_as)
+                        i, j, pd, pc, interpreted_as=interpreted_as, in_place=in_place)
                     self._LS_.b.customize.\
                         set_entries_according_to_CSCG_partial_cochains(
                         i, pd, pc=pc, interpreted_as=interpreted_as)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Element-based additive Schwarz preconditioner.
+
+The sub-domains are the mesh elements; they overlap at shared dofs. With the local matrices
+``A_e`` of an EWC_SparseMatrix and the restrictions ``R_e`` given by its gathering matrix, we do
+
+    invM @ v = sum_e R_e^T inv(A_e) R_e v.
+
+The local matrices are inverted all together (block by block if the EWC_SparseMatrix is
+block-dense). Applying it needs two exchanges with the neighbouring cores: the values of the
+element dofs owned by others are fetched, and the contributions to them are sent back to their
+owners.
+"""
+from root.config.main import *
+from tools.linear_algebra.preconditioners.base import Preconditioner
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.block_dense import ___EWC_2_BlockDense___
+
+
+class AdditiveSchwarzPreconditioner(Preconditioner):
+    """
+    :param A: GlobalMatrix, normally it is assembled from `EWC`.
+    :param EWC: The EWC_SparseMatrix whose local matrices (and row gathering matrix) make the
+        element sub-domain problems.
+    :param weighted: If True, the contributions to a dof are averaged over the elements sharing
+        it (instead of summed up).
+    """
+    def __init__(self, A, EWC, weighted=True):
+        """"""
+        super(AdditiveSchwarzPreconditioner, self).__init__(A)
+        assert EWC.__class__.__name__ == 'EWC_SparseMatrix', \
+            f"I need the EWC_SparseMatrix of A as the local problems."
+        GM = EWC.gathering_matrices[0]
+        assert GM is not None, f"EWC has no gathering matrix."
+        DA = A.distributed
+        owned = DA.owned
+
+        # ----- the local matrices, inverted all together -------------------------------------
+        BD = ___EWC_2_BlockDense___(EWC)
+        if BD is None: # customized or not cached: each element is a block.
+            elements = list(EWC)
+            positions = dict(zip(elements, range(len(elements))))
+            blocks = np.array([EWC[i].toarray() for i in elements]) if len(elements) > 0 else None
+        else:
+            positions = BD.positions
+            blocks = BD.blocks
+        if blocks is not None:
+            try:
+                blocks = np.linalg.inv(blocks)
+            except np.linalg.LinAlgError:
+                blocks = np.linalg.pinv(blocks)
+
+        # ----- the element dofs: owned ones first, then the ones owned by other cores ---------
+        elements = list(EWC)
+        if len(elements) > 0:
+            DOFS = np.array([GM[i] for i in elements]) # (num_elements, num_local_dofs)
+        else:
+            DOFS = np.zeros((0, 0), dtype=int)
+        needed = np.unique(DOFS)
+        where = np.searchsorted(owned, needed)
+        where[where == len(owned)] = 0
+        is_owned = owned[where] == needed if len(owned) > 0 else np.zeros(len(needed), dtype=bool)
+        ghosts = needed[~is_owned]
+        owners = DA.owners_of(ghosts)
+        requests = cOmm.alltoall([ghosts[owners == core] for core in range(sIze)])
+
+        # locally, the owned rows are numbered first, then the ghosts.
+        local = np.empty(len(needed), dtype=int)
+        local[is_owned] = where[is_owned]
+        local[~is_owned] = len(owned) + np.arange(len(ghosts))
+        self._local_dofs_ = local[np.searchsorted(needed, DOFS)]
+        self._elements_ = elements
+        self._inv_ = blocks
+        groups = np.array([positions[i] for i in elements], dtype=int)
+        if np.array_equal(groups, np.arange(len(elements))):
+            self._groups_ = None # one block for each element.
+        else:
+            self._groups_ = [(g, np.flatnonzero(groups == g)) for g in np.unique(groups)]
+        self._num_owned_ = len(owned)
+        self._num_ghosts_ = len(ghosts)
+        self._ghost_cores_ = [owners == core for core in range(sIze)]
+        self._send_ = [np.searchsorted(owned, rows) for rows in requests]
+        self._weights_ = None
+
+        if weighted:
+            counts = np.zeros(len(owned) + len(ghosts))
+            np.add.at(counts, self._local_dofs_.ravel(), 1)
+            self._weights_ = np.reciprocal(self.___PRIVATE_reduce___(counts))
+
+        self._freeze_self_()
+
+    def ___PRIVATE_fetch___(self, v):
+        """Extend the owned values with the values of the ghost dofs."""
+        received = cOmm.alltoall([v[indices] for indices in self._send_])
+        x = np.empty(self._num_owned_ + self._num_ghosts_)
+        x[:self._num_owned_] = v
+        for core, values in enumerate(received):
+            x[self._num_owned_:][self._ghost_cores_[core]] = values
+        return x
+
+    def ___PRIVATE_reduce___(self, x):
+        """Add the values of the ghost dofs to their owners and return the owned values."""
+        ghost_values = x[self._num_owned_:]
+        received = cOmm.alltoall([ghost_values[mask] for mask in self._ghost_cores_])
+        y = np.array(x[:self._num_owned_])
+        for indices, values in zip(self._send_, received):
+            np.add.at(y, indices, values)
+        return y
+
+    @property
+    def ___applying_method___(self):
+        return 'right_apply'
+
+    def apply(self, v):
+        """"""
+        x = self.___PRIVATE_fetch___(v)
+        y = np.zeros(len(x))
+        if len(self._elements_) > 0:
+            X = x[self._local_dofs_]
+            if self._groups_ is None:
+                Y = np.einsum('eij, ej -> ei', self._inv_, X)
+            else:
+                Y = np.empty(X.shape)
+                for g, E in self._groups_:
+                    Y[E] = X[E] @ self._inv_[g].T
+            np.add.at(y, self._local_dofs_.ravel(), Y.ravel())
+        y = self.___PRIVATE_reduce___(y)
+        if self._weights_ is not None:
+            y *= self._weights_
+        return y
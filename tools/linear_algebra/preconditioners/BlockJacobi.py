@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Block-Jacobi preconditioner.
+
+The blocks are the diagonal blocks of the rows owned by the cores (see
+``DistributedGlobalMatrix``). Each block is either
+
+    - the whole local-diagonal block of a core, factorized by a sparse LU, or
+    - the owned dofs of a mesh element (no overlap), inverted densely; blocks of the same size
+      are inverted and applied all together.
+
+No communication is needed to apply it.
+"""
+from root.config.main import *
+from scipy.sparse import linalg as spspalinalg
+from tools.linear_algebra.preconditioners.base import Preconditioner
+
+
+class BlockJacobiPreconditioner(Preconditioner):
+    """
+    :param A: GlobalMatrix
+    :param GM: None, or a (Chain_)Gathering_Matrix or an EWC_SparseMatrix (whose row gathering
+        matrix is used). If it is None, the block is the whole local-diagonal block of the core
+        (per-core LU). Otherwise, a block is made of the owned dofs of one local mesh element
+        (a dof shared by elements goes to the first one).
+    """
+    def __init__(self, A, GM=None):
+        """"""
+        super(BlockJacobiPreconditioner, self).__init__(A)
+        DA = A.distributed
+        D = DA.diagonal_block
+
+        if GM is None:
+            self._LU_ = spspalinalg.splu(D.tocsc()) if D.shape[0] > 0 else None
+            self._groups_ = None
+
+        else:
+            if GM.__class__.__name__ == 'EWC_SparseMatrix':
+                GM = GM.gathering_matrices[0]
+            owned = DA.owned
+            taken = np.zeros(len(owned), dtype=bool)
+            BLOCKS = dict() # keys: block sizes, values: lists of blocks (local rows)
+            for i in GM:
+                if len(owned) == 0: break
+                dofs = np.unique(GM[i])
+                where = np.searchsorted(owned, dofs)
+                where[where == len(owned)] = 0
+                rows = where[owned[where] == dofs]
+                rows = rows[~taken[rows]]
+                if len(rows) == 0: continue
+                taken[rows] = True
+                if len(rows) not in BLOCKS: BLOCKS[len(rows)] = list()
+                BLOCKS[len(rows)].append(rows)
+            rest = np.flatnonzero(~taken) # owned rows not in any local element.
+            if len(rest) > 0:
+                BLOCKS.setdefault(1, list()).extend(rest[:, np.newaxis])
+
+            self._LU_ = None
+            self._groups_ = list()
+            for size in BLOCKS:
+                rows = np.array(BLOCKS[size]) # (num_blocks, size)
+                P = D[rows.ravel()][:, rows.ravel()].tocoo()
+                in_block = (P.row // size) == (P.col // size)
+                blocks = np.zeros((len(rows), size, size))
+                np.add.at(blocks, (P.row[in_block] // size, P.row[in_block] % size, P.col[in_block] % size),
+                          P.data[in_block])
+                self._groups_.append((rows, self.___PRIVATE_inv___(blocks)))
+
+        self._shape_ = D.shape
+        self._freeze_self_()
+
+    @staticmethod
+    def ___PRIVATE_inv___(blocks):
+        """Invert a batch of dense blocks. A singular block is pseudo-inverted."""
+        try:
+            return np.linalg.inv(blocks)
+        except np.linalg.LinAlgError:
+            return np.linalg.pinv(blocks)
+
+    @property
+    def ___applying_method___(self):
+        return 'right_apply'
+
+    def apply(self, v):
+        """"""
+        if self._groups_ is None:
+            if self._LU_ is None:
+                return np.array(v)
+            return self._LU_.solve(v)
+        else:
+            y = np.empty(self._shape_[0])
+            for rows, inv in self._groups_:
+                y[rows] = np.einsum('kij, kj -> ki', inv, v[rows])
+            return y
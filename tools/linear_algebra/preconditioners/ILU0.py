@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""ILU(0) preconditioner.
+
+An incomplete LU factorization, of zero fill-in, of the local-diagonal block (the owned rows
+and the owned columns, see ``DistributedGlobalMatrix``) of each core. Couplings to rows owned by
+other cores are dropped, so it is applied without communication.
+"""
+from root.config.main import *
+from scipy import sparse as spspa
+from scipy.sparse import linalg as spspalinalg
+from tools.linear_algebra.preconditioners.base import Preconditioner
+
+
+class ILU0Preconditioner(Preconditioner):
+    """
+    :param A: GlobalMatrix
+    """
+    ___MAX_NNZ___ = 2000000 # the max amount of non-zeros in the local-diagonal block of a core.
+
+    def __init__(self, A):
+        """"""
+        super(ILU0Preconditioner, self).__init__(A)
+        D = A.distributed.diagonal_block
+        n = D.shape[0]
+        if n > 0:
+            L, U = self.___PRIVATE_ilu0___(D)
+            # L and U are triangular, so splu of natural ordering makes no fill-in.
+            options = dict(SymmetricMode=True)
+            self._L_ = spspalinalg.splu(L, permc_spec='NATURAL', diag_pivot_thresh=0, options=options)
+            self._U_ = spspalinalg.splu(U, permc_spec='NATURAL', diag_pivot_thresh=0, options=options)
+        else:
+            self._L_ = None
+            self._U_ = None
+        self._freeze_self_()
+
+    @staticmethod
+    def ___PRIVATE_ilu0___(D):
+        """The ILU(0) factorization (the IKJ variant) of a square sparse matrix. Entries are only
+        updated on the sparsity of `D`. A zero pivot is replaced by the largest (absolute) entry of
+        its row (or by 1 if the row is empty).
+
+        The elimination is sequential: we loop over the strictly lower entries and each of them
+        updates its row with one vectorized operation. This is fine for the local-diagonal blocks
+        of the cores, but we refuse blocks of more than ``___MAX_NNZ___`` non-zeros; use the
+        BlockJacobi preconditioner for them.
+
+        :return: unit lower triangular L and upper triangular U (csc matrices).
+        """
+        n = D.shape[0]
+        D = D.tocoo()
+        assert D.nnz <= ILU0Preconditioner.___MAX_NNZ___, \
+            f"the local-diagonal block has {D.nnz} (> {ILU0Preconditioner.___MAX_NNZ___}) non-zeros, " \
+            f"too many for the ILU0 preconditioner."
+        # make sure the diagonal is in the sparsity (possibly as explicit zeros).
+        LU = spspa.csr_matrix((np.concatenate([D.data, np.zeros(n)]),
+                               (np.concatenate([D.row, np.arange(n)]),
+                                np.concatenate([D.col, np.arange(n)]))), shape=(n, n))
+        LU.sum_duplicates()
+        LU.sort_indices()
+        indptr, indices, data = LU.indptr, LU.indices, LU.data
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        diag = np.flatnonzero(rows == indices)
+
+        where = np.full(n, -1, dtype=np.int64) # where[j]: the position of entry (i, j) of row i.
+        for i in range(n):
+            start, end = indptr[i], indptr[i+1]
+            where[indices[start:end]] = np.arange(start, end)
+            for kk in range(start, diag[i]):
+                k = indices[kk]
+                data[kk] /= data[diag[k]]
+                upper_k = slice(diag[k]+1, indptr[k+1])
+                positions = where[indices[upper_k]]
+                in_row = positions >= 0
+                data[positions[in_row]] -= data[kk] * data[upper_k][in_row]
+            where[indices[start:end]] = -1
+            if data[diag[i]] == 0:
+                row_max = np.max(np.abs(data[start:end]))
+                data[diag[i]] = row_max if row_max > 0 else 1
+
+        L = spspa.tril(LU, k=-1, format='csc') + spspa.identity(n, format='csc')
+        U = spspa.triu(LU, format='csc')
+        return L, U
+
+    @property
+    def ___applying_method___(self):
+        return 'right_apply'
+
+    def apply(self, v):
+        """"""
+        if self._L_ is None:
+            return np.array(v)
+        return self._U_.solve(self._L_.solve(v))
@@ -29,11 +29,17 @@ class PreconditionerAllocator(FrozenOnly):
         domain_input), we add a nickname for it here.
 
         """
-        return {'Jacobi': "JacobiPreconditioner",}
+        return {'Jacobi': "JacobiPreconditioner",
+                'BlockJacobi': "BlockJacobiPreconditioner",
+                'ILU0': "ILU0Preconditioner",
+                'AdditiveSchwarz': "AdditiveSchwarzPreconditioner",}
 
     @classmethod
     def ___preconditioners_path___(cls):
         """ """
         base_path = '.'.join(str(cls).split(' ')[1][1:-2].split('.')[:-2]) + '.'
 
-        return {'Jacobi': base_path + 'Jacobi',}
\ No newline at end of file
+        return {'Jacobi': base_path + 'Jacobi',
+                'BlockJacobi': base_path + 'BlockJacobi',
+                'ILU0': base_path + 'ILU0',
+                'AdditiveSchwarz': base_path + 'AdditiveSchwarz',}
\ No newline at end of file
@@ -20,6 +20,7 @@ class Preconditioner(FrozenOnly):
         AM = self.___applying_method___
 
         assert AM in ('left_multiply_invM', # invM @ A x = invM @ b. So self must have `invM` property
+                      'right_apply', # A invM y = b, x = invM y. So self must have the `apply` method.
                       )
 
         return AM
@@ -27,4 +28,14 @@ class Preconditioner(FrozenOnly):
     @property
     def ___applying_method___(self):
         """An indicator that explains how to apply this preconditioner."""
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    def apply(self, v):
+        """Apply the preconditioner, i.e., compute ``invM @ v``, without making ``invM``. It is
+        collective.
+
+        :param v: (1d-array) The values of the rows owned by this core; the rows are distributed
+            as in ``A.distributed`` (see ``DistributedGlobalMatrix``).
+        :return: (1d-array) The values of the owned rows of ``invM @ v``.
+        """
+        raise NotImplementedError()
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
-import numpy as np
-
-from tools.linear_algebra.solvers.regular.direct.main import Direct
+from tools.linear_algebra.solvers.Schur.rank2.helpers.static_condensation import ___static_condensation___
 
 
 def ___scipy_sparse_linalg_direct___(M, B, C, D, g, h, GM_row, GM_col):
@@ -9,6 +7,9 @@ def ___scipy_sparse_linalg_direct___(M, B, C, D, g, h, GM_row, GM_col):
     | M B | | g |
     | C D | | h |
 
+    The reduced system D - C M^-1 B is formed element-wise (see `___static_condensation___`) and
+    solved with the direct solver.
+
     Parameters
     ----------
     M
@@ -33,35 +34,4 @@ def ___scipy_sparse_linalg_direct___(M, B, C, D, g, h, GM_row, GM_col):
 
     """
 
-    inv_M = M.inv
-
-    rA = D - C @ inv_M @ B
-    rb = h - C @ inv_M @ g
-
-    rA.gathering_matrices = (GM_row, GM_col)
-    rb.gathering_matrix = GM_col
-
-    GM = rb.gathering_matrix # cannot use GM_col because we have made a chain-GM in `rb`.
-
-    rA = rA.assembled
-    rb = rb.assembled
-
-    reduce_results, info, beta, ITER, solver_message = Direct()(rA, rb)
-
-    del rA, rb
-
-    X = dict()
-    for i in GM:
-        local_dofs = GM[i]
-
-        Li = reduce_results.V[local_dofs]
-
-        inv_Mi = inv_M[i]
-        gi = g[i]
-        Bi = B[i]
-
-        xi = inv_Mi @ ( gi.toarray().ravel() - Bi @ Li)
-
-        X[i] = np.concatenate([xi, Li])
-
-    return X, info, beta, ITER, 'reduce-system=' + solver_message
\ No newline at end of file
+    return ___static_condensation___(M, B, C, D, g, h, GM_row, GM_col, solver_name='direct')
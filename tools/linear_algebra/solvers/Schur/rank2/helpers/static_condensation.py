@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Element-local static condensation. The M-block is element-block-diagonal (for example, the
+blocks of the element unknowns of a hybridized system), so we can eliminate the element unknowns
+element by element:
+
+    | M B | | x | = | g |
+    | C D | | l |   | h |
+
+    (D - C M^-1 B) l = h - C M^-1 g,    x = M^-1 g - M^-1 B l.
+
+Only the reduced (trace) system is assembled and solved globally. All element-wise work is done
+locally in each core.
+"""
+import numpy as np
+from scipy.sparse import csc_matrix
+
+from tools.linear_algebra.elementwise_cache.objects.sparse_matrix.main import EWC_SparseMatrix
+from tools.linear_algebra.elementwise_cache.objects.column_vector.main import EWC_ColumnVector
+from tools.linear_algebra.data_structures.global_matrix.main import LocallyFullVector
+from tools.linear_algebra.solvers.regular.allocator import RegularSolverDistributor
+
+
+def ___static_condensation___(M, B, C, D, g, h, GM_row, GM_col, solver_name='direct', **kwargs):
+    """
+    | M B | | g |
+    | C D | | h |
+
+    Parameters
+    ----------
+    M : EWC_SparseMatrix -- It must be element-block-diagonal.
+    B
+    C
+    D
+    g
+    h
+    GM_row
+    GM_col
+    solver_name : str -- The regular solver for the reduced system, 'direct', 'GMRES', and so on.
+    kwargs : Other kwargs for the regular solver of the reduced system, for example,
+        `routine`, `restart`, `maxiter`, `tol`, `preconditioner` for 'GMRES'.
+
+    Returns
+    -------
+    X : dict -- A dict contain the result local vector.
+    info : The info of the solver of the reduced system.
+    beta : The residual of the reduced system.
+    ITER : The number of outer iterations of the solver of the reduced system.
+    message : str
+
+    """
+    inv_M = M.inv # element-wise (and cached) inverse, the 'inv' node of the expression DAG.
+
+    # ----- eliminate the element unknowns element by element -------------------------------------
+    # elements of the same cache keys share the local reduced matrix (and M^-1 B).
+    MATRICES = (M, B, C, D)
+    ELIMINATED = dict()
+    iMB = dict()
+    S = dict()
+    iMg = dict()
+    r = dict()
+    for i in M:
+        ck = tuple([_._KG_(i) for _ in MATRICES])
+        if any([M.___NC___ in _ for _ in ck]) or ck not in ELIMINATED:
+            inv_Mi = inv_M[i]
+            Ci = C[i]
+            iMBi = (inv_Mi @ B[i]).tocsc()
+            Si = (D[i] - Ci @ iMBi).tocsc()
+            ELIMINATED[ck] = (inv_Mi, Ci, iMBi, Si)
+        else:
+            inv_Mi, Ci, iMBi, Si = ELIMINATED[ck]
+
+        iMgi = inv_Mi @ g[i].toarray().ravel()
+        iMB[i] = iMBi
+        iMg[i] = iMgi
+        S[i] = Si
+        r[i] = csc_matrix((h[i].toarray().ravel() - Ci @ iMgi)[:, np.newaxis])
+
+    del ELIMINATED
+
+    # ------ assemble and solve the reduced system ------------------------------------------------
+    rA = EWC_SparseMatrix(M.elements, S)
+    rb = EWC_ColumnVector(M.elements, r)
+    rA.gathering_matrices = (GM_row, GM_col)
+    rb.gathering_matrix = GM_col
+
+    GM = rb.gathering_matrix # cannot use GM_col because we have made a chain-GM in `rb`.
+
+    rA = rA.assembled
+    rb = rb.assembled
+
+    num_reduced_dofs = rA.shape[0]
+    routine = kwargs.pop('routine', 'auto')
+    solver = RegularSolverDistributor(solver_name, routine=routine, name='Schur-reduced-system')
+    if solver_name == 'direct':
+        reduce_results, info, beta, ITER, solver_message = solver(rA, rb, **kwargs)
+    else:
+        X0 = LocallyFullVector(num_reduced_dofs)
+        reduce_results, info, beta, ITER, solver_message = solver(rA, rb, X0, **kwargs)
+
+    del rA, rb, S, r
+
+    # ------- recover the element unknowns locally --------------------------------------------------
+    X = dict()
+    for i in GM:
+        Li = reduce_results.V[GM[i]]
+        xi = iMg[i] - iMB[i] @ Li
+        X[i] = np.concatenate([xi, Li])
+
+    return X, info, beta, ITER, f'reduce-system[{num_reduced_dofs}]=' + solver_message
@@ -5,6 +5,8 @@ from tools.linear_algebra.solvers.Schur.base import SchurSolverBase
 
 from tools.linear_algebra.solvers.Schur.rank2.helpers.scipy_sparse_linalg_direct import \
     ___scipy_sparse_linalg_direct___
+from tools.linear_algebra.solvers.Schur.rank2.helpers.static_condensation import \
+    ___static_condensation___
 
 
 class Rank2(SchurSolverBase):
@@ -17,6 +19,14 @@ class Rank2(SchurSolverBase):
     And the blocks must be an integer. Let's say, blocks=i. Then the M-block is the left-upper [:i, :i]
     blocks of the `bmat`-ed `EWC_SparseMatrix` matrix.
 
+    Routines:
+
+        - 'auto': the 'condensation' routine with the direct solver for the reduced system.
+        - 'condensation': static condensation. The element unknowns are eliminated element by
+          element (M^-1 B and D - C M^-1 B are formed once per element, or once per group of
+          elements of the same cache keys), the reduced (trace) system is solved with any regular
+          solver (see kwargs of `__call__`), and the element unknowns are recovered locally.
+
     """
     def __init__(self, rank, blocks, routine, name):
         super(Rank2, self).__init__(rank, blocks, routine, name)
@@ -30,7 +40,9 @@ class Rank2(SchurSolverBase):
 
         :param A: EWC_SparseMatrix
         :param b: EWC_ColumnVector
-        :param kwargs: possible other kwargs for particular routine.
+        :param kwargs: possible other kwargs for particular routine. For routine 'condensation',
+            `solver_name` (default: 'direct') and kwargs of the regular solver for the reduced
+            system, for example, ``solver_name='GMRES', restart=100, maxiter=20, tol=1e-10``.
         :returns: Return a tuple of 5 outputs:
 
                 1. (LocallyFullVector) results -- The result vector.
@@ -64,6 +76,8 @@ class Rank2(SchurSolverBase):
 
         if routine == 'auto':
             ROUTINE = ___scipy_sparse_linalg_direct___
+        elif routine == 'condensation':
+            ROUTINE = ___static_condensation___
         else:
             raise NotImplementedError()
 
@@ -73,6 +87,11 @@ class Rank2(SchurSolverBase):
             GM_row = GM0.GMs[blocks:]
             GM_col = GM1.GMs[blocks:]
             results, info, beta, ITER, solver_message = ROUTINE(M, B, C, D, g, h, GM_row, GM_col)
+        elif ROUTINE == ___static_condensation___:
+            GM0, GM1 = A.gathering_matrices
+            GM_row = GM0.GMs[blocks:]
+            GM_col = GM1.GMs[blocks:]
+            results, info, beta, ITER, solver_message = ROUTINE(M, B, C, D, g, h, GM_row, GM_col, **kwargs)
         else:
             raise Exception()
 
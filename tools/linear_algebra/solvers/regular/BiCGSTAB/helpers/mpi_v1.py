@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+from root.config.main import *
+from tools.linear_algebra.data_structures.global_matrix.main import LocallyFullVector
+from tools.linear_algebra.data_structures.global_matrix.distributed import DistributedGlobalMatrix
+from screws.exceptions import LinerSystemSolverDivergenceError
+from tools.linear_algebra.solvers.regular.GMRES.helpers.components.stop_criterion import ___gmres_stop_criterion___
+
+
+def ___mpi_v1_BiCGSTAB___(lhs, rhs, X0, maxiter=3, tol=1e-3, atol=1e-4, preconditioner=None, COD=True):
+    """In this version, vectors are distributed: each core only stores the entries of the rows it owns
+    (see ``DistributedGlobalMatrix``). ``A @ v`` only exchanges halo entries and inner products are
+    local dot products plus an ``Allreduce`` of a few scalars; no core is in charge of the vectors.
+
+    :param lhs: GlobalMatrix
+    :param rhs: GlobalVector
+    :param X0: LocallyFullVector
+    :param maxiter:
+    :param tol: relative tolerance.
+    :param atol: absolute tolerance.
+    :param preconditioner: It can be applied as `left_multiply_invM` or as `right_apply`. For the
+        latter, ``invM @ A`` is never made; the search directions are preconditioned instead.
+    :param COD: Clear Original Data?
+    :return: Return a tuple of 5 outputs:
+
+            1. (LocallyFullVector) results -- The result vector.
+            2. (int) info -- The info which provides convergence information:
+
+                * 0 : successful exit
+                * >0 : (convergence to tolerance not achieved) `Info` means number of iterations
+                * <0 : illegal input or breakdown
+
+            3. (float) beta -- The residual.
+            4. (int) ITER -- The number of outer iterations.
+            5. (str) message
+
+    """
+
+    Time_start = MPI.Wtime()
+
+    A = lhs.M
+    f = rhs.V
+
+    shape0, shape1 = A.shape
+    assert f.shape[0] == X0.shape[0] == shape0 == shape1, "Ax=f shape dis-match."
+
+    right = None
+    if preconditioner is not None:
+        applying_method = preconditioner.applying_method
+
+        if applying_method == 'left_multiply_invM':
+            invM = preconditioner.invM
+            A = invM @ A
+            f = invM @ f
+            DA = DistributedGlobalMatrix(A)
+        elif applying_method == 'right_apply':
+            right = preconditioner.apply
+            DA = lhs.distributed
+        else:
+            raise NotImplementedError(f"We did not yet code preconditioning for the "
+                                      f"routine: ___mpi_v1_BiCGSTAB___ using method: <{applying_method}>.")
+
+    else:
+        DA = lhs.distributed
+
+    f = DA.distribute(f)
+    x0 = np.array(X0.V[DA.owned]) # the owned part of x0.
+
+    if COD:  # needs be after preconditioning since the preconditioner will use A.M
+        lhs._M_ = None
+        rhs._V_ = None
+        X0._V_ = None
+
+    r0 = f - DA @ x0
+    hr0 = np.array(r0)
+    rho0 = 1
+    alpha = 1
+    omega = 1
+    p = np.zeros(len(x0), dtype=float)
+    v = np.zeros(len(x0), dtype=float)
+    local_dots = np.empty((2,), dtype=float)
+    dots = np.empty((2,), dtype=float)
+
+    ITER = 0
+    BETA = None
+
+    while 1:
+        beta = DA.dot(r0, r0) ** 0.5
+
+        # check stop iteration or not ...
+        if BETA is None: BETA = [beta,] # this is right, do not initial BETA as an empty list.
+        if len(BETA) > 20: BETA = BETA[:1] + BETA[-2:]
+        BETA.append(beta)
+        JUDGE, stop_iteration, info, JUDGE_explanation = ___gmres_stop_criterion___(tol, atol, ITER, maxiter, BETA)
+        if stop_iteration: break
+        # ...
+
+        # breakdowns: the dot products are global, so all cores stop together.
+        if omega == 0: # the new p needs alpha/omega.
+            info, JUDGE, JUDGE_explanation = -2, 6, 'breakdown: omega = 0'
+            break
+
+        ITER += 1
+
+        rho1 = DA.dot(hr0, r0)
+        if rho1 == 0:
+            info, JUDGE, JUDGE_explanation = -2, 6, 'breakdown: rho = 0'
+            break
+        p = r0 + ((rho1/rho0) * (alpha/omega)) * (p - omega * v)
+        hp = p if right is None else right(p)
+        v = DA @ hp
+        hr0_v = DA.dot(hr0, v)
+        if hr0_v == 0:
+            info, JUDGE, JUDGE_explanation = -2, 6, 'breakdown: (r0, v) = 0'
+            break
+        alpha = rho1 / hr0_v
+        s = r0 - alpha * v
+        hs = s if right is None else right(s)
+        t = DA @ hs
+
+        local_dots[0] = np.dot(t, s)
+        local_dots[1] = np.dot(t, t)
+        cOmm.Allreduce(local_dots, dots, op=MPI.SUM)
+        omega = dots[0] / dots[1] if dots[1] > 0 else 0
+
+        x0 += alpha * hp + omega * hs
+        r0 = s - omega * t
+        rho0 = rho1
+
+    x0 = LocallyFullVector(DA.gather(x0))
+
+    if info < 0:
+        raise LinerSystemSolverDivergenceError(
+            f"BiCGSTAB1 fails ({JUDGE_explanation}) after {ITER} iterations with error reaching {beta}.")
+
+    Time_end = MPI.Wtime()
+
+    COST_total = Time_end - Time_start
+    message = f" mpi_v1_BiCGSTAB = [SYSTEM-SHAPE: {DA.GLOBAL_shape}] [ITER={ITER}][residual=%.2e] costs %.2f, " \
+              f"convergence info={info}, maxiter={maxiter}, " \
+              f"stop_judge={JUDGE}: {JUDGE_explanation}]"%(beta, COST_total)
+
+    return x0, info, beta, ITER, message
@@ -11,6 +11,7 @@ Not working.
 from tools.linear_algebra.preconditioners.allocator import PreconditionerAllocator
 from screws.miscellaneous.timer import MyTimer
 from tools.linear_algebra.solvers.regular.BiCGSTAB.helpers.mpi_v0 import ___mpi_v0_BiCGSTAB___
+from tools.linear_algebra.solvers.regular.BiCGSTAB.helpers.mpi_v1 import ___mpi_v1_BiCGSTAB___
 
 from tools.linear_algebra.solvers.regular.base import ParallelSolverBase
 from tools.linear_algebra.data_structures.vectors.locally_full.main import LocallyFullVector
@@ -80,10 +81,15 @@ class BiCGSTAB(ParallelSolverBase):
         # -------  Decide routine -------------------------------------------------------------------
         if self._routine_ == 'auto':
         # in the future, we may want to make de function to decide which one is the best for particular matrices.
-            ROUTINE = ___mpi_v0_BiCGSTAB___
+            if preconditioner is not None and preconditioner.applying_method == 'right_apply':
+                ROUTINE = ___mpi_v1_BiCGSTAB___ # only routine v1 applies preconditioners from the right.
+            else:
+                ROUTINE = ___mpi_v0_BiCGSTAB___
         else:
             if self._routine_ == '0':
                 ROUTINE = ___mpi_v0_BiCGSTAB___
+            elif self._routine_ == '1': # distributed vectors, for large systems in many cores.
+                ROUTINE = ___mpi_v1_BiCGSTAB___
             else:
                 raise Exception(f"routine={self._routine_} is wrong.")
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from root.config.main import *
+from tools.linear_algebra.data_structures.global_matrix.main import LocallyFullVector
+from tools.linear_algebra.data_structures.global_matrix.distributed import DistributedGlobalMatrix
+from screws.exceptions import LinerSystemSolverDivergenceError
+from tools.linear_algebra.solvers.regular.GMRES.helpers.components.stop_criterion import ___gmres_stop_criterion___
+from tools.linear_algebra.solvers.regular.GMRES.helpers.components.residual_ploter import ___gmres_plot_residuals___
+
+
+def ___mpi_v2_gmres___(lhs, rhs, X0, restart=100, maxiter=20, tol=1e-3, atol=1e-4, preconditioner=None,
+                       COD=True, name=None, plot_residuals=False):
+    """In this version, vectors are distributed: each core only stores the entries of the rows it owns
+    (see ``DistributedGlobalMatrix``), so no vector of global length is made during the iterations.
+
+    ``A @ v`` only exchanges the halo entries between neighbouring cores (overlapped with the
+    product of the local-diagonal block) and the orthogonalization only needs local dot products
+    plus an ``Allreduce`` of a few scalars.
+
+    :param lhs: GlobalMatrix
+    :param rhs: GlobalVector
+    :param X0: LocallyFullVector
+    :param restart:
+    :param maxiter:
+    :param tol: relative tolerance.
+    :param atol: absolute tolerance.
+    :param preconditioner: It can be applied as `left_multiply_invM` or as `right_apply`. For the
+        latter, we solve ``A invM y = f`` and ``x = invM y``; ``invM @ A`` is never made and the
+        residuals we check are the true residuals.
+    :param COD: Clear Original Data?
+    :param name: The name of this solving process.
+    :param plot_residuals: bool
+    :return: Return a tuple of 5 outputs:
+
+            1. (LocallyFullVector) results -- The result vector.
+            2. (int) info -- The info which provides convergence information:
+
+                * 0 : successful exit
+                * >0 : (convergence to tolerance not achieved) `Info` means number of iterations
+                * <0 : illegal input or breakdown
+
+            3. (float) beta -- The residual.
+            4. (int) ITER -- The number of outer iterations.
+            5. (str) message
+
+    """
+    Time_start = MPI.Wtime()
+    A = lhs.M
+    f = rhs.V
+
+    shape0, shape1 = A.shape
+    assert f.shape[0] == X0.shape[0] == shape0 == shape1, "Ax=f shape dis-match."
+
+    right = None
+    if preconditioner is not None:
+        applying_method = preconditioner.applying_method
+
+        if applying_method == 'left_multiply_invM':
+            invM = preconditioner.invM
+            A = invM @ A
+            f = invM @ f
+            DA = DistributedGlobalMatrix(A)
+        elif applying_method == 'right_apply':
+            right = preconditioner.apply
+            DA = lhs.distributed
+        else:
+            raise NotImplementedError(f"We did not yet code preconditioning for the "
+                                      f"routine: ___mpi_v2_gmres___ using method: <{applying_method}>.")
+
+    else:
+        DA = lhs.distributed # made and kept by lhs, so we can reuse it for a next solving.
+
+    f = DA.distribute(f)
+    x0 = np.array(X0.V[DA.owned]) # the owned part of x0.
+
+    if COD: # needs be after preconditioning since the preconditioner will use A.M
+        lhs._M_ = None
+        rhs._V_ = None
+        X0._V_ = None
+
+    ITER = 0
+    BETA = None
+
+    if rAnk == mAster_rank:
+        if plot_residuals:
+            residuals = list()
+
+    Vm = np.empty((restart, len(x0)), dtype=float)
+    Hm = np.zeros((restart + 1, restart), dtype=float)
+    Hj = np.empty((restart,), dtype=float)
+
+    while 1: # always do till break.
+
+        v0 = f - DA @ x0
+        beta = DA.dot(v0, v0) ** 0.5
+
+        # check stop iteration or not ...
+        if BETA is None: BETA = [beta,] # this is right, do not initial BETA as an empty list.
+        if len(BETA) > 20: BETA = BETA[:1] + BETA[-2:]
+        BETA.append(beta)
+        if rAnk == mAster_rank:
+            if plot_residuals:
+                # noinspection PyUnboundLocalVariable
+                residuals.append(beta)
+        JUDGE, stop_iteration, info, JUDGE_explanation = ___gmres_stop_criterion___(tol, atol, ITER, maxiter, BETA)
+        if stop_iteration: break
+        # ...
+
+        Vm[0] = v0 / beta
+        Hm[:] = 0
+        m = restart
+
+        for j in range(restart):
+
+            if right is None:
+                avj = DA @ Vm[j]
+            else:
+                avj = DA @ right(Vm[j])
+
+            hj = Vm[:j+1] @ avj
+            cOmm.Allreduce(hj, Hj[:j+1], op=MPI.SUM)
+            Hm[:j+1, j] = Hj[:j+1]
+
+            hat_v_jp1 = avj - Hj[:j+1] @ Vm[:j+1]
+            Hm[j+1, j] = DA.dot(hat_v_jp1, hat_v_jp1) ** 0.5
+
+            if Hm[j+1, j] == 0: # lucky breakdown: the solution is in the current Krylov subspace.
+                m = j + 1
+                break
+
+            if j < restart - 1:
+                Vm[j+1] = hat_v_jp1 / Hm[j+1, j]
+
+        HMT = Hm[:m+1, :m].T
+        ls_A = HMT @ Hm[:m+1, :m]
+        ls_b = HMT[:,0] * beta
+        ym = np.linalg.solve(ls_A, ls_b)
+        del HMT, ls_A, ls_b
+        if right is None:
+            x0 += ym @ Vm[:m]
+        else:
+            x0 += right(ym @ Vm[:m])
+
+        ITER += 1
+
+    x0 = LocallyFullVector(DA.gather(x0))
+
+    if info < 0:
+        raise LinerSystemSolverDivergenceError(
+            f"gmres2 diverges after {ITER} iterations with error reaching {beta}.")
+
+    Time_end = MPI.Wtime()
+
+    COST_total = Time_end - Time_start
+    message = f" mpi_v2_gmres = [SYSTEM-SHAPE: {DA.GLOBAL_shape}] [ITER={ITER}][residual=%.2e] costs %.2f, " \
+              f"convergence info={info}, restart={restart}, maxiter={maxiter}, " \
+              f"stop_judge={JUDGE}: {JUDGE_explanation}]"%(beta, COST_total)
+
+    if rAnk == mAster_rank:
+        if plot_residuals:
+            ___gmres_plot_residuals___(np.array(residuals), name, 'mpi_v2_gmres')
+
+    return x0, info, beta, ITER, message
@@ -12,6 +12,7 @@ from screws.miscellaneous.timer import MyTimer
 
 from tools.linear_algebra.solvers.regular.GMRES.helpers.mpi_v0 import ___mpi_v0_gmres___
 from tools.linear_algebra.solvers.regular.GMRES.helpers.mpi_v1 import ___mpi_v1_gmres___
+from tools.linear_algebra.solvers.regular.GMRES.helpers.mpi_v2 import ___mpi_v2_gmres___
 from tools.linear_algebra.data_structures.vectors.locally_full.main import LocallyFullVector
 
 from tools.linear_algebra.solvers.regular.base import ParallelSolverBase
@@ -87,7 +88,9 @@ class GMRES(ParallelSolverBase):
 
         # ------- Decide routine -------------------------------------------------------------------
         if self._routine_ == 'auto':
-            if A.shape[0] < 3e5: # when the total loading is less than the loading_factor,
+            if preconditioner is not None and preconditioner.applying_method == 'right_apply':
+                ROUTINE = ___mpi_v2_gmres___ # only routine v2 applies preconditioners from the right.
+            elif A.shape[0] < 3e5: # when the total loading is less than the loading_factor,
                                  # we use routine v0 which is faster when the loading is low because
                                  # it needs fewer communications
                 ROUTINE = ___mpi_v0_gmres___
@@ -99,6 +102,8 @@ class GMRES(ParallelSolverBase):
                 ROUTINE = ___mpi_v0_gmres___
             elif self._routine_ == '1':
                 ROUTINE = ___mpi_v1_gmres___
+            elif self._routine_ == '2': # distributed vectors, for large systems in many cores.
+                ROUTINE = ___mpi_v2_gmres___
             else:
                 raise Exception(f"routine={self._routine_} is wrong.")
 
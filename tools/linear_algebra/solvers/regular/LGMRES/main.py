@@ -11,6 +11,7 @@ from tools.linear_algebra.preconditioners.allocator import PreconditionerAllocat
 from screws.miscellaneous.timer import MyTimer
 from root.config.main import rAnk, mAster_rank
 from tools.linear_algebra.solvers.regular.LGMRES.helpers.mpi_v0 import ___mpi_v0_LGMRES___
+from tools.linear_algebra.solvers.regular.LGMRES.helpers.mpi_v1 import ___mpi_v1_LGMRES___
 
 from tools.linear_algebra.solvers.regular.base import ParallelSolverBase
 from tools.linear_algebra.data_structures.vectors.locally_full.main import LocallyFullVector
@@ -91,11 +92,17 @@ class LGMRES(ParallelSolverBase):
 
         # -------  Decide routine ------------------------------------------------------------------
         if self._routine_ == 'auto':
-            ROUTINE = ___mpi_v0_LGMRES___
-            # in the future, we can make a function to decide which one is the best for particular matrices.
+            if preconditioner is not None and preconditioner.applying_method == 'right_apply':
+                ROUTINE = ___mpi_v1_LGMRES___ # only routine v1 applies preconditioners from the right.
+            elif A.shape[0] < 3e5: # like GMRES, routine v0 needs fewer communications for small systems.
+                ROUTINE = ___mpi_v0_LGMRES___
+            else: # distributed vectors and SpMV for large systems.
+                ROUTINE = ___mpi_v1_LGMRES___
         else:
             if self._routine_ == '0':
                 ROUTINE = ___mpi_v0_LGMRES___
+            elif self._routine_ == '1': # distributed vectors, for large systems in many cores.
+                ROUTINE = ___mpi_v1_LGMRES___
             else:
                 raise Exception(f"routine={self._routine_} is wrong.")
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 
+import hashlib
 from scipy import sparse as spspa
 from scipy.sparse import linalg as spspalinalg
 from time import time
@@ -8,12 +9,32 @@ from root.config.main import cOmm, rAnk, mAster_rank
 from tools.linear_algebra.data_structures.global_matrix.main import LocallyFullVector
 
 
-def ___scipy_sparse_linalg_v0___(A, b, COD=None):
+___CACHE_scipy_sparse_linalg_factorization___ = list() # we only cache the last (ONE) factorization
+
+
+def ___clear_scipy_sparse_linalg_factorization___():
+    """Release the factorization kept by ``reuse_factorization=True`` (if any)."""
+    ___CACHE_scipy_sparse_linalg_factorization___.clear()
+
+
+def ___scipy_sparse_linalg_v0___(A, b, COD=None, reuse_factorization=False, factorization='splu'):
     """
 
     :param A:
     :param b:
     :param COD: clean old data?
+    :param reuse_factorization: If True, we factorize A (in the master core) and keep the
+        factorization. When we are called again with a matrix of the same values (for example,
+        the LHS of a linear time-stepping scheme), we skip both the gathering and the factorization
+        of A, and only the new RHS is gathered and solved. Whether the values are the same is
+        decided by a hash of the local matrices in all cores.
+
+        The factorization is kept until another matrix is factorized or
+        ``___clear_scipy_sparse_linalg_factorization___`` is called.
+
+        If False (default), we do ``spsolve`` from scratch and keep nothing.
+    :param factorization: {'splu', 'factorized'} When `reuse_factorization`, which scipy routine
+        we use to factorize A.
     :return: Return a tuple of 5 outputs:
 
                 1. (LocallyFullVector) results -- The result vector.
@@ -32,20 +53,93 @@ def ___scipy_sparse_linalg_v0___(A, b, COD=None):
     t0 = time()
     # ...
     if COD is None: COD = True
+    assert factorization in ('splu', 'factorized'), f"factorization={factorization} is wrong."
+
+    if not reuse_factorization:
+        A = A.do.gather_M_to_core(core=mAster_rank, clean_local=COD)
+        b = b.do.gather_V_to_core(core=mAster_rank, clean_local=COD)
+
+        if rAnk == mAster_rank:
+            shape = A.shape[0]
+            assert shape == b.shape[0], f"A:{A.shape} does not match b{b.shape}."
+            x = spspalinalg.spsolve(A, b)
+            x = spspa.csr_matrix(x).T
+        else:
+            x = None
+        x = cOmm.bcast(x, root=mAster_rank)
+        x = LocallyFullVector(x)
+        t3 = time()
+        message = f'scipy_sparse_linalg_v0_direct = [SYSTEM-SHAPE: {A.shape}] >>> costs {int((t3-t0)*100)/100}s.'
+
+        return x, 0, 0, 0, message
+
+    CACHE = ___CACHE_scipy_sparse_linalg_factorization___
+    KEY = ___factorization_key___(A, factorization)
+    if rAnk == mAster_rank:
+        reused = len(CACHE) > 0 and KEY in CACHE[0][0]
+    else:
+        reused = None
+    reused = cOmm.bcast(reused, root=mAster_rank)
+
+    shape = A.shape
+    if reused:
+        if COD: # we do not need M, but we still clean the local data as requested.
+            A.do.gather_M_to_core(core=mAster_rank, clean_local=True)
+            KEY_after = ___factorization_key___(A, factorization)
+            if rAnk == mAster_rank:
+                CACHE[0][0].add(KEY_after)
+        t1 = t2 = time()
+    else:
+        CACHE.clear() # release the old factorization before we make a new one.
+        M = A.do.gather_M_to_core(core=mAster_rank, clean_local=COD)
+        t1 = time()
+        if rAnk == mAster_rank:
+            M = M.tocsc()
+            if factorization == 'splu':
+                solve = spspalinalg.splu(M).solve
+            else:
+                solve = spspalinalg.factorized(M)
+        del M
+        t2 = time()
+        if COD: # A has been gathered to the master core; this new key also refers to the factorization.
+            KEY_after = ___factorization_key___(A, factorization)
+        else:
+            KEY_after = KEY
+        if rAnk == mAster_rank:
+            # noinspection PyUnboundLocalVariable
+            CACHE.append(({KEY, KEY_after}, solve))
 
-    A = A.do.gather_M_to_core(core=mAster_rank, clean_local=COD)
     b = b.do.gather_V_to_core(core=mAster_rank, clean_local=COD)
 
     if rAnk == mAster_rank:
-        shape = A.shape[0]
-        assert shape == b.shape[0], f"A:{A.shape} does not match b{b.shape}."
-        x = spspalinalg.spsolve(A, b)
+        assert shape[0] == b.shape[0], f"A:{shape} does not match b{b.shape}."
+        x = CACHE[0][1](b)
         x = spspa.csr_matrix(x).T
     else:
         x = None
     x = cOmm.bcast(x, root=mAster_rank)
     x = LocallyFullVector(x)
     t3 = time()
-    message = f'scipy_sparse_linalg_v0_direct = [SYSTEM-SHAPE: {A.shape}] >>> costs {int((t3-t0)*100)/100}s.'
+    message = f'scipy_sparse_linalg_v0_direct = [SYSTEM-SHAPE: {shape}] >>> costs {int((t3-t0)*100)/100}s ' \
+              f'(factorization{" reused" if reused else ""}: {int((t2-t1)*100)/100}s, ' \
+              f'solving: {int((t3-t2)*100)/100}s).'
+
+    return x, 0, 0, 0, message
 
-    return x, 0, 0, 0, message
\ No newline at end of file
+
+def ___factorization_key___(A, factorization):
+    """A key of the values of a GlobalMatrix. It is collective; only the master core gets the key,
+    others get None.
+    """
+    M = A.M.tocsr(copy=True) # a canonical copy; A.M itself is not touched.
+    M.sum_duplicates()
+    H = hashlib.blake2b(digest_size=16)
+    H.update(M.indptr)
+    H.update(M.indices)
+    H.update(M.data)
+    local_key = (M.shape, M.nnz, H.hexdigest())
+    KEY = cOmm.gather(local_key, root=mAster_rank)
+    if rAnk == mAster_rank:
+        return factorization, tuple(KEY)
+    else:
+        return None
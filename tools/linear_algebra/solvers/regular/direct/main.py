@@ -2,6 +2,8 @@
 from tools.linear_algebra.solvers.regular.base import ParallelSolverBase
 from screws.miscellaneous.timer import MyTimer
 from tools.linear_algebra.solvers.regular.direct.helpers.scipy_sparse_linalg_v0 import ___scipy_sparse_linalg_v0___
+from tools.linear_algebra.solvers.regular.direct.helpers.scipy_sparse_linalg_v0 import \
+    ___clear_scipy_sparse_linalg_factorization___
 
 
 class Direct(ParallelSolverBase):
@@ -20,7 +22,9 @@ class Direct(ParallelSolverBase):
         :param b: GlobalVector
         :param preconditioner: Format: (ID, kwargs (a dict) for the preconditioner)
         :param COD: Clear Original Data?
-        :param kwargs: possible other kwargs for particular routine.
+        :param kwargs: possible other kwargs for particular routine. For example,
+            ``reuse_factorization`` and ``factorization`` of routine '0'. A kept factorization
+            is released by ``Direct.clear_factorization()``.
         :return: Return a tuple of 5 outputs:
 
                 1. (LocallyFullVector) results -- The result vector.
@@ -49,11 +53,14 @@ class Direct(ParallelSolverBase):
                 raise Exception(f"routine={self._routine_} is wrong.")
 
         # ---------- Do the computation ----------------------------------------------------------------
-        results, info, beta, ITER, solver_message = ROUTINE(A, b, COD=COD)
-
-        _ = kwargs # trivial; just leave freedom for future updates for kwargs.
+        results, info, beta, ITER, solver_message = ROUTINE(A, b, COD=COD, **kwargs)
 
         MESSAGE =  message + '-' + solver_message
         #===============================================================================================
 
         return results, info, beta, ITER, MESSAGE
+
+    @staticmethod
+    def clear_factorization():
+        """Release the factorization kept by ``reuse_factorization=True`` of routine '0'."""
+        ___clear_scipy_sparse_linalg_factorization___()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from root.config.main import *
+from screws.miscellaneous.timer import MyTimer
 import inspect
 import os
 from tools.run.runners.base import ParallelRunnerBase
@@ -34,7 +35,7 @@ class ParallelMatrix3dInputRunner(ParallelRunnerBase):
         self._freeze_self_()
 
 
-    def ___iterate___(self, I1, I2, I3, criterion='standard', writeto=None, **kwargs):
+    def ___iterate___(self, I1, I2, I3, criterion='standard', writeto=None, group_size=None, **kwargs):
         """
 
         :param I1: The 1st matrix to be passed to the solver.
@@ -57,6 +58,11 @@ class ParallelMatrix3dInputRunner(ParallelRunnerBase):
                 Note that shape(i0[k]) must be equal to shape(i1[k]).
 
         :param writeto: The keywords variable to be passed to the solver.
+        :param group_size: If it is None (default), all cores run every case together. Otherwise,
+            we run an ensemble: the slave cores are split into groups of `group_size` cores and
+            each group runs a case (as if it was all cores we have) in its own sub-communicator;
+            a group takes the next case once it is done. The master core only dispatches the cases
+            and writes the results (in the order they are done).
         :param kwargs: The keywords variable to be passed to the solver. For a
             ParallelMatrix3dInputRunner, the same kwargs will be used for all runs.
             It is not possible to customize kwargs for each run.
@@ -66,6 +72,9 @@ class ParallelMatrix3dInputRunner(ParallelRunnerBase):
         if sIze == 1:
             self._SR_.iterate(I1, I2, I3, criterion=criterion, writeto=writeto, saveto=False, **kwargs)
 
+        elif group_size is not None:
+            self.___PRIVATE_ensemble_iterate___(I1, I2, I3, criterion, writeto, group_size, kwargs)
+
         else:
             if rAnk == mAster_rank:
                 self._SR_.iterate(I1, I2, I3, criterion=criterion, writeto=writeto, saveto=False, **kwargs)
@@ -87,6 +96,91 @@ class ParallelMatrix3dInputRunner(ParallelRunnerBase):
 
                 # we do nothing after all computation in slave cores.
 
+    def ___PRIVATE_ensemble_iterate___(self, I1, I2, I3, criterion, writeto, group_size, kwargs):
+        """Run the cases in groups of slave cores. Groups take cases from the master dynamically
+        (like `dIspatching`) and send the outputs back to the master which writes them."""
+        assert isinstance(group_size, int) and group_size >= 1, f"group_size={group_size} wrong."
+        TAG = 3 * sIze + 1 # different from the tags of the position marks.
+
+        if rAnk == mAster_rank:
+            color = MPI.UNDEFINED
+        else:
+            color = sLave_ranks.index(rAnk) // group_size
+        group = cOmm.Split(color, key=rAnk)
+
+        if rAnk == mAster_rank:
+            SR = self._SR_
+            SR.___parse_and_check_iterate_inputs___(I1, I2, I3, criterion=criterion)
+            SR.___kwargs___ = kwargs
+            SR.___prepare_write_file___(writeto)
+            I, J, K = SR._input_shape_
+            CASES = list()
+            for k in range(K):  # we let the axis2 go at the last.
+                for i in range(I):  # we let the axis0 go secondly.
+                    for j in range(J):  # we let the axis1 go firstly.
+                        inputs = [SR._I0Seq_[i][j][k], SR._I1Seq_[i][j][k], SR._I2Seq_[i][j][k]]
+                        if inputs[0] is None:
+                            pass
+                        elif SR._computed_pool_ != () and SR.___check_inputs_in_computed_pool___(inputs):
+                            print(f' -----> REPEATED computation of inputs: {inputs}', flush=True)
+                        else:
+                            CASES.append(inputs)
+
+            leaders = [core for n, core in enumerate(sLave_ranks) if n % group_size == 0]
+            print(f"\n-------- > M3IR ensemble: {len(CASES)} cases in {len(leaders)} groups < --------\n",
+                  flush=True)
+
+            if SR._rdf_.empty:
+                already_cost = 0
+            else:
+                try:
+                    already_cost = MyTimer.hms2seconds(SR._rdf_['TTC'][SR._rdf_.index[-1]])
+                except (ValueError, TypeError):
+                    already_cost = 0
+            num_cases = len(CASES)
+            done = 0
+            t_start = MPI.Wtime()
+            free = list(leaders)
+            while done < num_cases:
+                while len(CASES) > 0 and len(free) > 0:
+                    cOmm.send(CASES.pop(0) + [kwargs], dest=free.pop(0), tag=TAG)
+                status = MPI.Status()
+                inputs, outputs, cost = cOmm.recv(source=MPI.ANY_SOURCE, tag=TAG, status=status)
+                free.append(status.Get_source())
+                done += 1
+
+                m = 0 if SR._rdf_.empty else SR._rdf_.index[-1] + 1
+                elapsed = MPI.Wtime() - t_start
+                print(f'\t> {done}/{num_cases} done: inputs={inputs}', flush=True)
+                SR.___update_rdf___(m, inputs, outputs,
+                                    MyTimer.seconds2hms(cost),
+                                    MyTimer.seconds2hms(already_cost + elapsed),
+                                    MyTimer.seconds2hms(elapsed * (num_cases - done) / done))
+                SR.___write_to___(m)
+
+            for leader in leaders:
+                cOmm.send(None, dest=leader, tag=TAG) # no more cases.
+
+            SR._results_ = SR._rdf_
+            SR.___deal_with_saveto___(writeto, False)
+
+        else:
+            while 1:
+                if group.Get_rank() == 0: # the group leader.
+                    INPUTS = cOmm.recv(source=mAster_rank, tag=TAG)
+                else:
+                    INPUTS = None
+                INPUTS = group.bcast(INPUTS, root=0)
+                if INPUTS is None: break
+                t_case = MPI.Wtime()
+                with sCoped(group):
+                    outputs = self._solver_(INPUTS[0], INPUTS[1], INPUTS[2], **INPUTS[3])
+                if group.Get_rank() == 0:
+                    cOmm.send((INPUTS[:3], outputs, MPI.Wtime() - t_case), dest=mAster_rank, tag=TAG)
+            group.Free()
+
+        cOmm.barrier()
+
     @property
     def ___visualize___(self):
         if rAnk == mAster_rank: